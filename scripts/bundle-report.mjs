@@ -0,0 +1,101 @@
+// Size of what the landing page downloads up front vs on demand.
+//
+//   npm run report:bundle                         # build, then report
+//   node scripts/bundle-report.mjs --save before.json
+//   node scripts/bundle-report.mjs --baseline before.json
+//
+// Reads the Vite manifest (build.manifest) in dist/. "initial" is each
+// entry with everything it imports statically, i.e. what loads before the
+// page can run; "lazy" is every dynamically imported chunk not already in
+// it. Sizes are raw, gzip and brotli, as the files would be served.
+import { readFileSync, writeFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { brotliCompressSync, gzipSync } from 'node:zlib';
+
+const args = process.argv.slice(2);
+const option = (name) => {
+    const index = args.indexOf(name);
+    return index === -1 ? null : args[index + 1];
+};
+const dist = option('--dist') ?? 'dist';
+const manifest = JSON.parse(readFileSync(join(dist, '.vite', 'manifest.json'), 'utf8'));
+
+const sizeOf = (file) => {
+    const data = readFileSync(join(dist, file));
+    return { raw: data.length, gzip: gzipSync(data, { level: 9 }).length, brotli: brotliCompressSync(data).length };
+};
+
+// Files of `key` and of everything it imports statically.
+const staticClosure = (key, files = new Set()) => {
+    const chunk = manifest[key];
+    if (!chunk || files.has(chunk.file)) return files;
+    files.add(chunk.file);
+    for (const css of chunk.css ?? []) files.add(css);
+    for (const imported of chunk.imports ?? []) staticClosure(imported, files);
+    return files;
+};
+
+const total = (files) =>
+    [...files].reduce(
+        (sum, file) => {
+            const size = sizeOf(file);
+            return { raw: sum.raw + size.raw, gzip: sum.gzip + size.gzip, brotli: sum.brotli + size.brotli };
+        },
+        { raw: 0, gzip: 0, brotli: 0 }
+    );
+
+// Files of every chunk `key` can load, statically or dynamically.
+const fullClosure = (key) => {
+    const files = new Set();
+    const seen = new Set();
+    const pending = [key];
+    while (pending.length) {
+        const current = pending.pop();
+        const chunk = manifest[current];
+        if (!chunk || seen.has(current)) continue;
+        seen.add(current);
+        files.add(chunk.file);
+        for (const css of chunk.css ?? []) files.add(css);
+        pending.push(...(chunk.imports ?? []), ...(chunk.dynamicImports ?? []));
+    }
+    return files;
+};
+
+const report = {};
+for (const [key, chunk] of Object.entries(manifest)) {
+    if (!chunk.isEntry) continue;
+    const initial = staticClosure(key);
+    const lazy = new Set([...fullClosure(key)].filter((file) => !initial.has(file)));
+    report[key] = {
+        initial: { files: [...initial].sort(), ...total(initial) },
+        lazy: { files: [...lazy].sort(), ...total(lazy) },
+    };
+}
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KiB`;
+const delta = (now, before) => {
+    if (before === undefined) return '';
+    const change = now - before;
+    const percent = before ? ` (${change >= 0 ? '+' : ''}${((change / before) * 100).toFixed(1)}%)` : '';
+    return `  ${change >= 0 ? '+' : '-'}${kb(Math.abs(change))}${percent}`;
+};
+
+const baselinePath = option('--baseline');
+const baseline = baselinePath ? JSON.parse(readFileSync(baselinePath, 'utf8')) : {};
+for (const [entry, parts] of Object.entries(report)) {
+    console.log(`\n${entry}`);
+    for (const part of ['initial', 'lazy']) {
+        const now = parts[part];
+        const before = baseline[entry]?.[part];
+        console.log(`  ${part.padEnd(8)} ${String(now.files.length).padStart(3)} files`);
+        for (const kind of ['raw', 'gzip', 'brotli']) {
+            console.log(`    ${kind.padEnd(7)} ${kb(now[kind]).padStart(11)}${delta(now[kind], before?.[kind])}`);
+        }
+    }
+}
+
+const savePath = option('--save');
+if (savePath) {
+    writeFileSync(savePath, `${JSON.stringify(report, null, 2)}\n`);
+    console.log(`\nSaved to ${savePath}`);
+}
@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react';
+import { lazy, Suspense, useCallback, useEffect, useState } from 'react';
 import {
     Download,
     FileText,
@@ -12,13 +12,28 @@ import {
 } from 'lucide-react';
 import { motion, AnimatePresence } from 'framer-motion';
 import IntroOverlay from './components/IntroOverlay';
-import InquiryBoard from './components/InquiryBoard';
 import { useModal } from './hooks/useModal';
+import { loadInquiryBoard, prefetchInquiryBoard, prefetchInquiryBoardWhenIdle } from './lib/inquiryBoardChunk';
+import { CURRENT_VERSION, fetchUpdatePlan, getInstalledBuild, releaseUrl, type UpdatePlan } from './lib/releases';
+
+// Split out with the Supabase client; most visitors never open it.
+const InquiryBoard = lazy(loadInquiryBoard);
+
+const BoardFallback = () => (
+    <div className="relative z-[60] min-h-screen w-full bg-[#0B0C10] flex items-center justify-center">
+        <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-[#66FCF1]"></div>
+    </div>
+);
+
+const formatMB = (bytes: number) => `${(bytes / 1024 / 1024).toFixed(1)} MB`;
 
 const App = () => {
     const { showAlert } = useModal();
     const [showIntro, setShowIntro] = useState(true);
     const [showSupport, setShowSupport] = useState(false);
+    const [updatePlan, setUpdatePlan] = useState<UpdatePlan | null>(null);
+    // Stable, so re-rendering App does not restart the intro's preload.
+    const hideIntro = useCallback(() => setShowIntro(false), []);
     const adminEntry =
         typeof window !== 'undefined' &&
         (window.location.hash === '#admin' || new URLSearchParams(window.location.search).get('admin') === '1');
@@ -30,6 +45,28 @@ const App = () => {
         }
     }, [adminEntry]);
 
+    // Fetch the board once the landing page has settled, so opening it
+    // rarely waits on the network.
+    useEffect(() => {
+        if (!showIntro) return prefetchInquiryBoardWhenIdle();
+    }, [showIntro]);
+
+    // The plan names the latest build; visitors whose installed version is
+    // known also get the patch chain to it offered next to the full installer.
+    useEffect(() => {
+        let cancelled = false;
+        fetchUpdatePlan(getInstalledBuild())
+            .then((plan) => {
+                if (!cancelled && plan) setUpdatePlan(plan);
+            })
+            .catch(() => {});
+        return () => {
+            cancelled = true;
+        };
+    }, []);
+
+    // The installed build is recorded when the app reports it (?installed=),
+    // not here: a download may never be installed.
     const handleDownloadClick = (event: React.MouseEvent<HTMLAnchorElement>) => {
         const isMobile = /Mobi|Android|iPhone|iPad|iPod/i.test(navigator.userAgent);
         if (isMobile) {
@@ -37,15 +74,18 @@ const App = () => {
             showAlert('모바일에서는 다운로드가 불가합니다. \nPC에서 다운로드해주세요.', { title: '다운로드 안내' });
         }
     };
+    const patchOffer = updatePlan && updatePlan.patches.length > 0 ? updatePlan : null;
 
     return (
         <div className="min-h-screen bg-[#0B0C10] text-slate-200 relative overflow-hidden font-sans selection:bg-[#66FCF1] selection:text-[#0B0C10]">
             <AnimatePresence>
                 {showIntro && (
-                    <IntroOverlay onComplete={() => setShowIntro(false)} />
+                    <IntroOverlay onComplete={hideIntro} />
                 )}
                 {showSupport && (
-                    <InquiryBoard onClose={() => setShowSupport(false)} adminEntry={adminEntry} />
+                    <Suspense key="support" fallback={<BoardFallback />}>
+                        <InquiryBoard onClose={() => setShowSupport(false)} adminEntry={adminEntry} />
+                    </Suspense>
                 )}
             </AnimatePresence>
 
@@ -77,7 +117,7 @@ const App = () => {
                                 <div className="hidden md:flex items-center space-x-10">
                                     <a href="#features" className="text-slate-400 hover:text-[#66FCF1] text-sm font-semibold transition-all hover:glow-text">기능 소개</a>
                                     <a href="#guide" className="text-slate-400 hover:text-[#66FCF1] text-sm font-semibold transition-all hover:glow-text">이용 방법</a>
-                                    <button onClick={() => setShowSupport(true)} className="text-slate-400 hover:text-[#66FCF1] text-sm font-semibold transition-all hover:glow-text">고객 문의</button>
+                                    <button onClick={() => setShowSupport(true)} onMouseEnter={prefetchInquiryBoard} onFocus={prefetchInquiryBoard} className="text-slate-400 hover:text-[#66FCF1] text-sm font-semibold transition-all hover:glow-text">고객 문의</button>
                                     <a href="/PDF_Converter_Pro_Installer_x64.exe" download onClick={handleDownloadClick}
                                         className="bg-[#1F2833] hover:bg-[#45A29E] text-[#66FCF1] hover:text-white border border-[#45A29E]/50 px-6 py-2.5 rounded-full text-sm font-bold transition-all shadow-lg hover:shadow-[#66FCF1]/40 hover:-translate-y-0.5"
                                     >
@@ -93,7 +133,7 @@ const App = () => {
                         <div className="max-w-5xl mx-auto px-4 relative">
                             <div className="inline-flex items-center gap-2 px-4 py-2 rounded-full bg-[#1F2833] border border-[#45A29E]/30 text-[#66FCF1] text-xs font-bold mb-8 animate-float">
                                 <Zap className="w-4 h-4 fill-current" />
-                                <span className="tracking-wide">v1.0.0 정식 출시</span>
+                                <span className="tracking-wide">v{updatePlan?.latest ?? CURRENT_VERSION} 정식 출시</span>
                             </div>
 
                             <h1 className="text-5xl md:text-7xl font-extrabold text-white tracking-tight mb-8 leading-tight">
@@ -118,6 +158,30 @@ const App = () => {
                                     무료 다운로드
                                 </a>
                             </div>
+
+                            {patchOffer && (
+                                <div className="mt-8 text-sm text-slate-400">
+                                    <p>
+                                        v{patchOffer.installed} 사용자라면 업데이트 패치만 받으세요.{' '}
+                                        <span className="text-slate-500">
+                                            ({formatMB(patchOffer.patch_bytes)} / 전체 {formatMB(patchOffer.full.size)})
+                                        </span>
+                                    </p>
+                                    <div className="mt-3 flex flex-wrap justify-center gap-3">
+                                        {patchOffer.patches.map((patch) => (
+                                            <a
+                                                key={patch.file}
+                                                href={releaseUrl(patch.file)}
+                                                download
+                                                onClick={handleDownloadClick}
+                                                className="px-4 py-2 rounded-lg border border-[#45A29E]/40 text-[#66FCF1] font-semibold hover:bg-[#1F2833] transition-all"
+                                            >
+                                                v{patch.from} → v{patch.to} ({formatMB(patch.size)})
+                                            </a>
+                                        ))}
+                                    </div>
+                                </div>
+                            )}
                         </div>
                     </header>
 
@@ -249,6 +313,7 @@ const App = () => {
                         whileHover={{ scale: 1.1 }}
                         whileTap={{ scale: 0.9 }}
                         onClick={() => setShowSupport(true)}
+                        onTouchStart={prefetchInquiryBoard}
                         className="md:hidden fixed bottom-6 right-6 z-50 h-14 px-4 bg-[#66FCF1] rounded-full flex items-center justify-center gap-2 shadow-[0_0_20px_rgba(102,252,241,0.4)] text-[#0B0C10] font-bold"
                     >
                         <MessageSquare className="w-6 h-6 fill-current" />
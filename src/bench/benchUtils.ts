@@ -0,0 +1,70 @@
+// Helpers shared by the pages under bench/. Each page publishes its result
+// on window.__benchResult so a headless browser can collect it.
+
+declare global {
+    interface Window {
+        __benchResult?: Record<string, unknown>;
+    }
+}
+
+interface PerformanceWithMemory extends Performance {
+    memory?: { usedJSHeapSize: number };
+}
+
+export const params = new URLSearchParams(window.location.search);
+
+export const numberParam = (name: string, fallback: number) => {
+    const value = Number(params.get(name));
+    return Number.isFinite(value) && value > 0 ? value : fallback;
+};
+
+export const percentile = (sorted: number[], p: number) =>
+    sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))] : 0;
+
+export const summarizeDurations = (samples: number[]) => {
+    const sorted = [...samples].sort((a, b) => a - b);
+    const total = samples.reduce((sum, sample) => sum + sample, 0);
+    return {
+        count: samples.length,
+        mean: samples.length ? total / samples.length : 0,
+        p50: percentile(sorted, 50),
+        p95: percentile(sorted, 95),
+        p99: percentile(sorted, 99),
+        max: sorted[sorted.length - 1] ?? 0,
+    };
+};
+
+export const nextFrame = () => new Promise<number>((resolve) => requestAnimationFrame(resolve));
+
+export const heapBytes = () => (performance as PerformanceWithMemory).memory?.usedJSHeapSize ?? null;
+
+export const domNodeCount = () => document.getElementsByTagName('*').length;
+
+export const publish = (result: Record<string, unknown>) => {
+    window.__benchResult = result;
+    console.table(result);
+};
+
+const rng = (seed: number) => () => {
+    seed = (seed * 1664525 + 1013904223) >>> 0;
+    return seed / 2 ** 32;
+};
+
+const WORDS = ['PDF', '변환', '오류', '설치', '엑셀', '워드', '파워포인트', '글꼴', '암호', '배치', '속도', '라이선스', '업데이트', '인쇄'];
+
+// Deterministic inquiries with titles from one to several lines long.
+export const syntheticInquiries = (count: number, seed = 1) => {
+    const random = rng(seed);
+    const start = Date.UTC(2025, 0, 1);
+    return Array.from({ length: count }, (_, index) => {
+        const words = 2 + Math.floor(random() ** 3 * 40);
+        return {
+            id: `bench-${index}`,
+            title: Array.from({ length: words }, () => WORDS[Math.floor(random() * WORDS.length)]).join(' '),
+            author: `user${index % 997}`,
+            created_at: new Date(start - index * 37_000).toISOString(),
+            status: random() < 0.4 ? ('answered' as const) : ('pending' as const),
+            is_secret: random() < 0.2,
+        };
+    });
+};
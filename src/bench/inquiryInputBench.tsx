@@ -0,0 +1,105 @@
+// Input latency in the inquiry write form.
+//
+//   npm run dev, then open /bench/inquiry-input.html?rows=5000&keys=300
+//
+// Loads `rows` synthetic inquiries into the inquiry store, mounts the real
+// InquiryBoard, opens the write form and types `keys` characters into the
+// content textarea, one per frame. For each keystroke it reports how long
+// the input event takes to handle, React render and commit included, and
+// what a React Profiler around the board records. Latency should not change
+// with `rows`: only the form re-renders while typing.
+//
+// The board still connects to Supabase (VITE_SUPABASE_* from .env), and a
+// reload from the change feed can replace the synthetic rows; `loadedRows`
+// shows how many were in the store while typing.
+import { Profiler, useEffect, useState, type ProfilerOnRenderCallback } from 'react';
+import { createRoot } from 'react-dom/client';
+import '../index.css';
+import GlobalModal from '../components/GlobalModal';
+import InquiryBoard from '../components/InquiryBoard';
+import { ModalProvider } from '../context/ModalContext';
+import { getInquiriesSnapshot, replaceInquiryPage } from '../lib/inquiryStore';
+import { nextFrame, numberParam, publish, summarizeDurations, syntheticInquiries } from './benchUtils';
+
+const ROWS = numberParam('rows', 5000);
+const KEYS = numberParam('keys', 300);
+const TEXT = '프로그램 실행 중 오류가 발생했습니다. PDF 변환 후 글꼴이 깨집니다. ';
+
+// Seeded before the board mounts, so it renders the list on its first frame
+// and skips the initial fetch.
+replaceInquiryPage({ rows: syntheticInquiries(ROWS), nextCursor: null });
+
+const counts = { commits: 0, commitMs: 0 };
+
+const countBoard: ProfilerOnRenderCallback = (_id, _phase, actualDuration) => {
+    counts.commits++;
+    counts.commitMs += actualDuration;
+};
+
+const round = (ms: number) => Number(ms.toFixed(3));
+
+const buttonLabelled = (label: string) =>
+    [...document.querySelectorAll('button')].find((button) => button.textContent?.includes(label));
+
+// Sets the value the way typing does, so React's onChange fires.
+const typeInto = (textarea: HTMLTextAreaElement, value: string) => {
+    Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value')!.set!.call(textarea, value);
+    textarea.dispatchEvent(new Event('input', { bubbles: true }));
+};
+
+const Driver = () => {
+    const [report, setReport] = useState('running...');
+
+    useEffect(() => {
+        (async () => {
+            await nextFrame();
+            buttonLabelled('문의하기')?.click();
+            await nextFrame();
+            const textarea = document.querySelector<HTMLTextAreaElement>('form textarea');
+            if (!textarea) {
+                setReport('write form did not open');
+                return;
+            }
+            textarea.focus();
+            const before = { ...counts };
+            const samples: number[] = [];
+            for (let i = 1; i <= KEYS; i++) {
+                const started = performance.now();
+                typeInto(textarea, TEXT.repeat(Math.ceil(i / TEXT.length)).slice(0, i));
+                samples.push(performance.now() - started);
+                await nextFrame();
+            }
+            const stats = summarizeDurations(samples);
+            const result = {
+                rows: ROWS,
+                loadedRows: getInquiriesSnapshot().ids.length,
+                keys: KEYS,
+                typed: textarea.value.length,
+                inputMeanMs: round(stats.mean),
+                inputP50Ms: round(stats.p50),
+                inputP95Ms: round(stats.p95),
+                inputMaxMs: round(stats.max),
+                commitsPerKey: Number(((counts.commits - before.commits) / KEYS).toFixed(2)),
+                commitMsPerKey: round((counts.commitMs - before.commitMs) / KEYS),
+            };
+            publish(result);
+            setReport(JSON.stringify(result, null, 2));
+        })();
+    }, []);
+
+    return (
+        <pre className="fixed top-2 right-2 z-[200] max-w-sm p-3 text-xs bg-black/80 text-[#66FCF1] rounded">
+            {report}
+        </pre>
+    );
+};
+
+createRoot(document.getElementById('root')!).render(
+    <ModalProvider>
+        <GlobalModal />
+        <Profiler id="board" onRender={countBoard}>
+            <InquiryBoard onClose={() => {}} />
+        </Profiler>
+        <Driver />
+    </ModalProvider>
+);
@@ -0,0 +1,149 @@
+// Settlement and memory under bursts of concurrent modal requests.
+//
+//   npm run dev, then open /bench/modal-queue.html?requests=500&rounds=20
+//   (Chromium with --js-flags=--expose-gc gives steadier heap figures)
+//
+// Every round fires `requests` alerts, confirms and prompts at once. Each
+// awaiting handler holds an 8 KB buffer, so handlers that never resume
+// would show up in the heap. The page then answers modals through
+// GlobalModal's confirm button until every promise has settled. Last, a
+// second provider is unmounted with requests still open and waiting, and
+// all of them must settle. Reports settled vs fired, how many modals were
+// shown rather than dismissed by the bounded backlog, and the JS heap after
+// each round (Chromium only).
+import { useEffect, useState } from 'react';
+import { createRoot } from 'react-dom/client';
+import '../index.css';
+import GlobalModal from '../components/GlobalModal';
+import { ModalProvider } from '../context/ModalContext';
+import { useModal } from '../hooks/useModal';
+import { heapBytes, nextFrame, numberParam, publish } from './benchUtils';
+
+const REQUESTS = numberParam('requests', 500);
+const ROUNDS = numberParam('rounds', 20);
+const UNMOUNT_REQUESTS = 100;
+// Give up on a round when nothing settles for this long.
+const STALL_MS = 2000;
+
+type ModalActions = ReturnType<typeof useModal>;
+
+const collectGarbage = async () => {
+    (window as { gc?: () => void }).gc?.();
+    await nextFrame();
+    await nextFrame();
+};
+
+const fire = (actions: ModalActions, index: number) => {
+    const message = `request ${index}`;
+    if (index % 7 === 0) return actions.showPrompt(message);
+    if (index % 3 === 0) return actions.showConfirm(message);
+    return actions.showAlert(message);
+};
+
+const confirmButton = () =>
+    document.querySelector<HTMLButtonElement>('[data-testid="global-modal"] button:last-of-type');
+
+const Capture = ({ onReady }: { onReady: (actions: ModalActions) => void }) => {
+    const actions = useModal();
+    useEffect(() => onReady(actions), [actions, onReady]);
+    return null;
+};
+
+// Requests left open and waiting when their provider unmounts must settle.
+const settlesOnUnmount = async () => {
+    const container = document.createElement('div');
+    document.body.appendChild(container);
+    const root = createRoot(container);
+    const actions = await new Promise<ModalActions>((resolve) => {
+        root.render(
+            <ModalProvider>
+                <Capture onReady={resolve} />
+            </ModalProvider>
+        );
+    });
+    let settled = 0;
+    const pending = Array.from({ length: UNMOUNT_REQUESTS }, (_, index) =>
+        fire(actions, index).then(() => {
+            settled++;
+        })
+    );
+    root.unmount();
+    container.remove();
+    await Promise.race([Promise.all(pending), new Promise((resolve) => setTimeout(resolve, STALL_MS))]);
+    return settled;
+};
+
+const Driver = () => {
+    const actions = useModal();
+    const [report, setReport] = useState('running...');
+
+    useEffect(() => {
+        (async () => {
+            await collectGarbage();
+            const heap: (number | null)[] = [heapBytes()];
+            let fired = 0;
+            let settled = 0;
+            let shown = 0;
+            const started = performance.now();
+            for (let round = 0; round < ROUNDS; round++) {
+                for (let i = 0; i < REQUESTS; i++) {
+                    // What an awaiting handler keeps alive until it resumes.
+                    const held = new Float64Array(1024);
+                    fired++;
+                    fire(actions, fired).then(() => {
+                        if (held.length) settled++;
+                    });
+                }
+                let progressAt = performance.now();
+                let lastSettled = settled;
+                while (settled < fired && performance.now() - progressAt < STALL_MS) {
+                    await nextFrame();
+                    const button = confirmButton();
+                    if (button) {
+                        button.click();
+                        shown++;
+                    }
+                    if (settled !== lastSettled) {
+                        lastSettled = settled;
+                        progressAt = performance.now();
+                    }
+                }
+                await collectGarbage();
+                heap.push(heapBytes());
+            }
+            const unmountSettled = await settlesOnUnmount();
+            const first = heap[1];
+            const last = heap[heap.length - 1];
+            const result = {
+                requestsPerRound: REQUESTS,
+                rounds: ROUNDS,
+                fired,
+                settled,
+                unsettled: fired - settled,
+                shown,
+                dismissedByBacklog: fired - shown,
+                unmountSettled: `${unmountSettled}/${UNMOUNT_REQUESTS}`,
+                heapBeforeMB: heap[0] === null ? null : Number((heap[0] / 2 ** 20).toFixed(1)),
+                heapAfterRoundsMB: heap.slice(1).map((bytes) => (bytes === null ? null : Number((bytes / 2 ** 20).toFixed(1)))),
+                // Growth from the first round to the last; flat means nothing is retained per round.
+                heapGrowthMB: first == null || last == null ? null : Number(((last - first) / 2 ** 20).toFixed(2)),
+                totalMs: Math.round(performance.now() - started),
+            };
+            publish(result);
+            setReport(JSON.stringify(result, null, 2));
+        })();
+    }, [actions]);
+
+    return (
+        <pre className="fixed top-2 left-2 z-[200] max-w-sm p-3 text-xs bg-black/80 text-[#66FCF1] rounded whitespace-pre-wrap">
+            {report}
+        </pre>
+    );
+};
+
+createRoot(document.getElementById('root')!).render(
+    <ModalProvider>
+        <GlobalModal />
+        <Driver />
+    </ModalProvider>
+);
@@ -0,0 +1,126 @@
+// Re-renders caused by opening and closing modals.
+//
+//   npm run dev, then open /bench/modal-renders.html?consumers=500&cycles=50&mode=split
+//
+// Mounts `consumers` components that open modals through useModal(), as App
+// and InquiryBoard do, beside GlobalModal, then opens and closes an alert
+// `cycles` times. mode=split uses ModalContext as it is; mode=legacy has
+// every consumer read one context whose value is a new object whenever the
+// modal changes, as the provider used to. React Profilers count the renders
+// each cycle causes in consumers and in GlobalModal.
+import { createContext, memo, Profiler, useContext, useEffect, useState, type ProfilerOnRenderCallback, type ReactNode } from 'react';
+import { createRoot } from 'react-dom/client';
+import '../index.css';
+import GlobalModal from '../components/GlobalModal';
+import { ModalProvider } from '../context/ModalContext';
+import { useModal, useModalState } from '../hooks/useModal';
+import { nextFrame, numberParam, params, publish } from './benchUtils';
+
+const CONSUMERS = numberParam('consumers', 500);
+const CYCLES = numberParam('cycles', 50);
+const MODE = params.get('mode') === 'legacy' ? 'legacy' : 'split';
+
+const counts = { consumerRenders: 0, consumerMs: 0, modalRenders: 0 };
+
+const countConsumer: ProfilerOnRenderCallback = (_id, _phase, actualDuration) => {
+    counts.consumerRenders++;
+    counts.consumerMs += actualDuration;
+};
+
+const countModal: ProfilerOnRenderCallback = () => {
+    counts.modalRenders++;
+};
+
+const LegacyContext = createContext<unknown>(null);
+
+// The old provider value: everything in one object, rebuilt on every change.
+const LegacyProvider = ({ children }: { children: ReactNode }) => {
+    const actions = useModal();
+    const { modalState } = useModalState();
+    return <LegacyContext.Provider value={{ ...actions, modalState }}>{children}</LegacyContext.Provider>;
+};
+
+const SplitConsumer = memo(({ index }: { index: number }) => {
+    const { showAlert } = useModal();
+    return <button onClick={() => showAlert(`consumer ${index}`)}>{index}</button>;
+});
+
+const LegacyConsumer = memo(({ index }: { index: number }) => {
+    useContext(LegacyContext);
+    return <button>{index}</button>;
+});
+
+const Consumers = () => {
+    const Consumer = MODE === 'legacy' ? LegacyConsumer : SplitConsumer;
+    return (
+        <div className="grid grid-cols-20 gap-1 p-4 text-[8px] text-slate-600">
+            {Array.from({ length: CONSUMERS }, (_, index) => (
+                <Profiler key={index} id={`consumer-${index}`} onRender={countConsumer}>
+                    <Consumer index={index} />
+                </Profiler>
+            ))}
+        </div>
+    );
+};
+
+const Driver = () => {
+    const { showAlert, closeModal } = useModal();
+    const [report, setReport] = useState('running...');
+
+    useEffect(() => {
+        (async () => {
+            await nextFrame();
+            const mounted = { ...counts };
+            const started = performance.now();
+            for (let cycle = 0; cycle < CYCLES; cycle++) {
+                const shown = showAlert(`cycle ${cycle}`);
+                await nextFrame();
+                closeModal(undefined);
+                await shown;
+                await nextFrame();
+            }
+            const elapsed = performance.now() - started;
+            const result = {
+                mode: MODE,
+                consumers: CONSUMERS,
+                cycles: CYCLES,
+                consumerRendersPerCycle: (counts.consumerRenders - mounted.consumerRenders) / CYCLES,
+                consumerMsPerCycle: Number(((counts.consumerMs - mounted.consumerMs) / CYCLES).toFixed(3)),
+                modalRendersPerCycle: (counts.modalRenders - mounted.modalRenders) / CYCLES,
+                totalMs: Math.round(elapsed),
+            };
+            publish(result);
+            setReport(JSON.stringify(result, null, 2));
+        })();
+    }, [showAlert, closeModal]);
+
+    return (
+        <pre className="fixed top-2 right-2 z-10 max-w-sm p-3 text-xs bg-black/80 text-[#66FCF1] rounded">
+            {report}
+            {'\n'}
+            <a className="underline" href={`?consumers=${CONSUMERS}&cycles=${CYCLES}&mode=${MODE === 'legacy' ? 'split' : 'legacy'}`}>
+                switch to {MODE === 'legacy' ? 'split' : 'legacy'}
+            </a>
+        </pre>
+    );
+};
+
+const Bench = () => (
+    <div className="min-h-screen bg-[#0B0C10] text-slate-200">
+        <ModalProvider>
+            <Profiler id="global-modal" onRender={countModal}>
+                <GlobalModal />
+            </Profiler>
+            {MODE === 'legacy' ? (
+                <LegacyProvider>
+                    <Consumers />
+                </LegacyProvider>
+            ) : (
+                <Consumers />
+            )}
+            <Driver />
+        </ModalProvider>
+    </div>
+);
+
+createRoot(document.getElementById('root')!).render(<Bench />);
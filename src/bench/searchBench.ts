@@ -0,0 +1,57 @@
+// Latency of the inquiry search worker.
+//
+//   npm run dev, then open /bench/inquiry-search.html?rows=100000&runs=50
+//
+// Indexes `rows` synthetic inquiries in the search worker, then times each
+// query `runs` times. `searchMs` is the time spent in the index (measured in
+// the worker); `roundTripMs` adds the postMessage hops the board pays.
+import type { SearchWorkerRequest, SearchWorkerResponse } from '../workers/inquirySearch.worker';
+import { numberParam, publish, summarizeDurations, syntheticInquiries } from './benchUtils';
+
+const ROWS = numberParam('rows', 100_000);
+const RUNS = numberParam('runs', 50);
+const QUERIES = ['변환', '변환 오류', '파워포인트 라이선스', 'PDF 인쇄 암호 글꼴', 'user12', '없는말'];
+
+const worker = new Worker(new URL('../workers/inquirySearch.worker.ts', import.meta.url), { type: 'module' });
+const send = (message: SearchWorkerRequest) => worker.postMessage(message);
+const nextResponse = () =>
+    new Promise<SearchWorkerResponse>((resolve) => {
+        worker.onmessage = (event: MessageEvent<SearchWorkerResponse>) => resolve(event.data);
+    });
+
+const round = (value: number) => Number(value.toFixed(2));
+
+const run = async () => {
+    const docs = syntheticInquiries(ROWS).map(({ id, title, author, created_at }) => ({ id, title, author, created_at }));
+    const indexStarted = performance.now();
+    send({ type: 'reset', docs });
+    // The worker handles messages in order, so the first answer marks the
+    // end of indexing.
+    const ready = nextResponse();
+    send({ type: 'search', requestId: 0, query: '', limit: 1 });
+    await ready;
+    const indexMs = performance.now() - indexStarted;
+
+    const result: Record<string, unknown> = { rows: ROWS, runs: RUNS, indexMs: Math.round(indexMs) };
+    for (const query of QUERIES) {
+        const searchMs: number[] = [];
+        const roundTripMs: number[] = [];
+        let total = 0;
+        for (let requestId = 1; requestId <= RUNS; requestId++) {
+            const started = performance.now();
+            const response = nextResponse();
+            send({ type: 'search', requestId, query, limit: 50 });
+            const { tookMs, total: matched } = await response;
+            roundTripMs.push(performance.now() - started);
+            searchMs.push(tookMs);
+            total = matched;
+        }
+        const search = summarizeDurations(searchMs);
+        const roundTrip = summarizeDurations(roundTripMs);
+        result[query] = `${total} hits, search p50 ${round(search.p50)} p95 ${round(search.p95)} ms, round trip p50 ${round(roundTrip.p50)} ms`;
+    }
+    publish(result);
+    document.getElementById('root')!.textContent = JSON.stringify(result, null, 2);
+};
+
+run();
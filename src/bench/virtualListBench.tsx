@@ -0,0 +1,110 @@
+// Frame times while scrolling the inquiry list.
+//
+//   npm run dev, then open /bench/virtual-list.html?rows=50000&mode=virtual
+//
+// mode=virtual renders through VirtualList as InquiryBoard does; mode=full
+// mounts every row, as the board did before. The page scrolls from top to
+// bottom over `seconds` and reports frame durations, long frames, DOM size
+// and (in Chromium) JS heap.
+import { useCallback, useEffect, useState } from 'react';
+import { createRoot } from 'react-dom/client';
+import '../index.css';
+import InquiryRow from '../components/InquiryRow';
+import VirtualList from '../components/VirtualList';
+import type { InquirySummary } from '../lib/inquiries';
+import {
+    domNodeCount,
+    heapBytes,
+    nextFrame,
+    numberParam,
+    params,
+    publish,
+    summarizeDurations,
+    syntheticInquiries,
+} from './benchUtils';
+
+const ROWS = numberParam('rows', 50_000);
+const SECONDS = numberParam('seconds', 10);
+const MODE = params.get('mode') === 'full' ? 'full' : 'virtual';
+const GAP = 12;
+
+const items = syntheticInquiries(ROWS);
+const inquiryKey = (item: InquirySummary) => item.id;
+const mountStarted = performance.now();
+
+const scrollThrough = async () => {
+    const frames: number[] = [];
+    const started = await nextFrame();
+    let previous = started;
+    for (;;) {
+        const now = await nextFrame();
+        frames.push(now - previous);
+        previous = now;
+        const progress = Math.min(1, (now - started) / (SECONDS * 1000));
+        window.scrollTo(0, progress * (document.documentElement.scrollHeight - window.innerHeight));
+        if (progress === 1) return frames;
+    }
+};
+
+const Bench = () => {
+    const [selected, setSelected] = useState<string | null>(null);
+    const [report, setReport] = useState('running...');
+    const onSelect = useCallback((item: InquirySummary) => setSelected(item.id), []);
+
+    useEffect(() => {
+        (async () => {
+            await nextFrame();
+            const mountMs = performance.now() - mountStarted;
+            const nodes = domNodeCount();
+            const frames = await scrollThrough();
+            const stats = summarizeDurations(frames);
+            const heap = heapBytes();
+            const result = {
+                mode: MODE,
+                rows: ROWS,
+                mountMs: Math.round(mountMs),
+                domNodes: nodes,
+                heapMB: heap === null ? null : Math.round(heap / 1e5) / 10,
+                frames: stats.count,
+                meanMs: Number(stats.mean.toFixed(2)),
+                p50Ms: Number(stats.p50.toFixed(2)),
+                p95Ms: Number(stats.p95.toFixed(2)),
+                p99Ms: Number(stats.p99.toFixed(2)),
+                maxMs: Number(stats.max.toFixed(2)),
+                over16ms: frames.filter((frame) => frame > 1000 / 60 + 1).length,
+                over33ms: frames.filter((frame) => frame > 1000 / 30 + 1).length,
+            };
+            publish(result);
+            setReport(JSON.stringify(result, null, 2));
+        })();
+    }, []);
+
+    const renderItem = (item: InquirySummary) => (
+        <InquiryRow item={item} selected={selected === item.id} isAdmin={false} onSelect={onSelect} />
+    );
+
+    return (
+        <div className="min-h-screen bg-[#0B0C10] text-slate-200">
+            <pre className="fixed top-2 right-2 z-10 max-w-sm p-3 text-xs bg-black/80 text-[#66FCF1] rounded">
+                {report}
+                {'\n'}
+                <a className="underline" href={`?rows=${ROWS}&mode=${MODE === 'full' ? 'virtual' : 'full'}`}>
+                    switch to {MODE === 'full' ? 'virtual' : 'full'}
+                </a>
+            </pre>
+            <div className="max-w-2xl mx-auto px-6 py-12">
+                {MODE === 'virtual' ? (
+                    <VirtualList items={items} getKey={inquiryKey} estimateHeight={110} gap={GAP} renderItem={renderItem} />
+                ) : (
+                    items.map((item) => (
+                        <div key={item.id} style={{ paddingBottom: GAP }}>
+                            {renderItem(item)}
+                        </div>
+                    ))
+                )}
+            </div>
+        </div>
+    );
+};
+
+createRoot(document.getElementById('root')!).render(<Bench />);
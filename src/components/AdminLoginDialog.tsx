@@ -0,0 +1,67 @@
+import { memo, useState } from 'react';
+import { X } from 'lucide-react';
+import { supabase } from '../lib/supabase';
+
+// The board's admin sign-in. Signing in updates useAuth, which is how the
+// board learns about it.
+const AdminLoginDialog = memo(({ onClose }: { onClose: () => void }) => {
+    const [email, setEmail] = useState('');
+    const [password, setPassword] = useState('');
+    const [loginError, setLoginError] = useState('');
+
+    const handleSubmit = async (e: React.FormEvent) => {
+        e.preventDefault();
+        setLoginError('');
+        try {
+            const { error } = await supabase.auth.signInWithPassword({ email, password });
+            if (error) throw error;
+            onClose();
+        } catch (error: any) {
+            setLoginError(error.message || '로그인 실패');
+        }
+    };
+
+    return (
+        <div className="fixed inset-0 z-[80] flex items-center justify-center bg-black/70 px-6">
+            <div className="w-full max-w-md rounded-2xl border border-[#45A29E]/20 bg-[#0B0C10] p-6 shadow-xl">
+                <div className="flex items-center justify-between mb-4">
+                    <h3 className="text-lg font-bold text-white">관리자 로그인</h3>
+                    <button onClick={onClose} className="p-1 hover:bg-[#1F2833] rounded">
+                        <X className="w-5 h-5 text-slate-400 hover:text-white" />
+                    </button>
+                </div>
+                <form onSubmit={handleSubmit} className="space-y-4">
+                    <div className="space-y-2">
+                        <label className="text-sm font-bold text-slate-400">이메일</label>
+                        <input
+                            type="email" required
+                            value={email} onChange={e => setEmail(e.target.value)}
+                            placeholder="admin@example.com"
+                            className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
+                        />
+                    </div>
+                    <div className="space-y-2">
+                        <label className="text-sm font-bold text-slate-400">비밀번호</label>
+                        <input
+                            type="password" required
+                            value={password} onChange={e => setPassword(e.target.value)}
+                            placeholder="비밀번호"
+                            className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
+                        />
+                    </div>
+                    {loginError && (
+                        <div className="text-xs text-red-400">{loginError}</div>
+                    )}
+                    <button
+                        type="submit"
+                        className="w-full bg-[#66FCF1] hover:bg-[#45A29E] text-[#0B0C10] font-bold py-3 rounded-lg transition-colors shadow-lg shadow-[#66FCF1]/20"
+                    >
+                        로그인
+                    </button>
+                </form>
+            </div>
+        </div>
+    );
+});
+
+export default AdminLoginDialog;
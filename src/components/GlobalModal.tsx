@@ -1,10 +1,10 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
-import { useModal } from '../hooks/useModal';
+import { useModalState } from '../hooks/useModal';
 import { AlertCircle, HelpCircle, AlertTriangle } from 'lucide-react';
 
 const GlobalModal = () => {
-    const { modalState, closeModal } = useModal();
+    const { modalState, closeModal } = useModalState();
     const [inputValue, setInputValue] = useState('');
     const inputRef = useRef<HTMLInputElement>(null);
 
@@ -65,6 +65,9 @@ const GlobalModal = () => {
 
                 {/* Modal Window */}
                 <motion.div
+                    role="dialog"
+                    aria-modal="true"
+                    data-testid="global-modal"
                     initial={{ scale: 0.95, opacity: 0, y: 20 }}
                     animate={{ scale: 1, opacity: 1, y: 0 }}
                     exit={{ scale: 0.95, opacity: 0, y: 20 }}
@@ -1,59 +1,92 @@
-import { useState, useEffect } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 import { motion } from 'framer-motion';
-import { X, Lock, Plus, CheckCircle, Shield, ShieldCheck, BookOpen, AlertTriangle, MessageSquare } from 'lucide-react';
+import { X, Lock, CheckCircle, Shield, ShieldCheck, BookOpen, AlertTriangle } from 'lucide-react';
 import { supabase } from '../lib/supabase';
 import { useModal } from '../hooks/useModal';
-
-// Interfaces for Type Safety (Supabase Schema Match)
-interface Inquiry {
-    id: string;
-    title: string;
-    content: string;
-    author: string;
-    password?: string;
-    is_secret: boolean;
-    created_at: string; // ISO String from Supabase
-    status: 'pending' | 'answered';
-    reply: string | null;
-}
-
+import { useAuth } from '../hooks/useAuth';
+import AdminLoginDialog from './AdminLoginDialog';
+import InquiryDetail from './InquiryDetail';
+import InquiryList from './InquiryList';
+import InquiryWriteForm, { type InquiryDraft } from './InquiryWriteForm';
+import { startInquiryFeed } from '../lib/inquiryFeed';
+import { setSearchScope } from '../lib/inquirySearch';
+import { isAbortError } from '../lib/dataAccess';
+import {
+    createInquiry,
+    deleteInquiry,
+    fetchInquiryDetail,
+    fetchInquiryPage,
+    InquiryPasswordError,
+    toSummary,
+    updateInquiry,
+    type Inquiry,
+    type InquirySummary,
+    type NewInquiry,
+} from '../lib/inquiries';
+import {
+    getInquiriesSnapshot,
+    isInquiryListStale,
+    mutateInquiry,
+    removeInquiry,
+    replaceInquiryPage,
+    restoreInquiryList,
+    upsertInquiry,
+} from '../lib/inquiryStore';
+
+// Optimistic rows shown while their insert is in flight.
+const PENDING_ID_PREFIX = 'pending-';
+
+// The board holds what the panes share: the selection, the mode and the
+// list's loading flags. Typed fields live in InquiryWriteForm,
+// InquiryReplyEditor, AdminLoginDialog and InquiryList (search), and the
+// handlers passed to them are stable, so a keystroke re-renders only the
+// component that owns the field.
 const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; adminEntry?: boolean }) => {
     const { showAlert, showConfirm, showPrompt } = useModal();
-    const [inquiries, setInquiries] = useState<Inquiry[]>([]);
-    const [isAdmin, setIsAdmin] = useState(false);
-    const [userEmail, setUserEmail] = useState<string | null>(null);
+    const [refreshing, setRefreshing] = useState(false);
+    // Resolved once per page and cached, so a reopened board has it at once.
+    const { ready: authReady, email: userEmail, isAdmin } = useAuth();
+    const authLoading = !authReady;
     const [selectedInquiry, setSelectedInquiry] = useState<Inquiry | null>(null);
     const [isWriteMode, setIsWriteMode] = useState(false);
-    const [loading, setLoading] = useState(true);
-    const [authLoading, setAuthLoading] = useState(true);
+    // A list kept from the previous opening renders on the first frame.
+    const [loading, setLoading] = useState(() => !getInquiriesSnapshot().loadedAt);
     const [showAdminLogin, setShowAdminLogin] = useState(false);
-    const [adminEmail, setAdminEmail] = useState('');
-    const [adminPassword, setAdminPassword] = useState('');
-    const [adminError, setAdminError] = useState('');
-
-    // Form States
-    const [newTitle, setNewTitle] = useState('');
-    const [newContent, setNewContent] = useState('');
-    const [newAuthor, setNewAuthor] = useState('');
-    const [newPassword, setNewPassword] = useState('');
-    const [isSecret, setIsSecret] = useState(false);
-
-    // Reply State
-    const [replyContent, setReplyContent] = useState('');
+    // What the write form starts from when it opens: kept after cancelling
+    // and restored after a failed submit, like the reply text below.
+    const [draft, setDraft] = useState<InquiryDraft | null>(null);
+    const [replyDraft, setReplyDraft] = useState<{ id: string; reply: string } | null>(null);
+
+    // Full reload of the list: on a stale open, on an explicit refresh and
+    // when the change feed cannot replay what it missed. Everything else
+    // patches the store in place (mutations and startInquiryFeed).
+    const fetchInquiries = useCallback(async () => {
+        setRefreshing(true);
+        try {
+            replaceInquiryPage(await fetchInquiryPage(null));
+        } catch (error: any) {
+            if (isAbortError(error)) return;
+            console.error('Failed to fetch inquiries', error);
+            // alert('목록 불러오기 실패: ' + (error.message || '오류')); // Only enable if debugging needed
+        } finally {
+            setLoading(false);
+            setRefreshing(false);
+        }
+    }, []);
 
     useEffect(() => {
-        fetchInquiries();
-        loadSession();
-        const { data: authListener } = supabase.auth.onAuthStateChange((_event, session) => {
-            const email = session?.user?.email ?? null;
-            const id = session?.user?.id ?? null;
-            setUserEmail(email);
-            checkAdmin(id);
+        // Stale-while-revalidate: show the cached list (from memory, or
+        // IndexedDB after a reload) and refresh it in the background.
+        restoreInquiryList().then((restored) => {
+            if (restored) setLoading(false);
+            if (!restored || isInquiryListStale()) fetchInquiries();
         });
-        return () => {
-            authListener.subscription.unsubscribe();
-        };
-    }, []);
+        return startInquiryFeed(fetchInquiries);
+    }, [fetchInquiries]);
+
+    useEffect(() => {
+        setSearchScope(isAdmin);
+    }, [isAdmin]);
 
     useEffect(() => {
         if (adminEntry && !authLoading && !userEmail) {
@@ -61,167 +94,96 @@ const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; ad
         }
     }, [adminEntry, authLoading, userEmail]);
 
-    const loadSession = async () => {
-        try {
-            const { data, error } = await supabase.auth.getSession();
-            if (error) throw error;
-            const email = data.session?.user?.email ?? null;
-            const id = data.session?.user?.id ?? null;
-            setUserEmail(email);
-            await checkAdmin(id);
-        } catch (error) {
-            console.error('Failed to load session', error);
-            setUserEmail(null);
-            setIsAdmin(false);
-        } finally {
-            setAuthLoading(false);
-        }
-    };
-
-    const checkAdmin = async (id: string | null) => {
-        if (!id) {
-            setIsAdmin(false);
-            return;
-        }
-        try {
-            const { data, error } = await supabase
-                .from('admins')
-                .select('user_id')
-                .eq('user_id', id)
-                .maybeSingle();
-            if (error) throw error;
-            setIsAdmin(!!data);
-        } catch (error) {
-            console.error('Failed to check admin', error);
-            setIsAdmin(false);
-        }
-    };
-
-    const fetchInquiries = async () => {
-        try {
-            const { data, error } = await supabase
-                .from('inquiries')
-                .select('*')
-                .order('created_at', { ascending: false });
-
-            if (error) throw error;
-            setInquiries(data || []);
-        } catch (error: any) {
-            console.error('Failed to fetch inquiries', error);
-            // alert('목록 불러오기 실패: ' + (error.message || '오류')); // Only enable if debugging needed
-        } finally {
-            setLoading(false);
-        }
-    };
-
-    const handleSubmit = async (e: React.FormEvent) => {
-        e.preventDefault();
-        const newInquiry = {
-            title: newTitle,
-            content: newContent,
-            author: newAuthor,
-            password: newPassword,
-            is_secret: isSecret,
+    const handleSubmit = useCallback(async (submitted: InquiryDraft) => {
+        const newInquiry: NewInquiry = { ...submitted, status: 'pending', reply: null };
+        const pendingId = `${PENDING_ID_PREFIX}${Date.now()}`;
+        const pendingRow: InquirySummary = {
+            id: pendingId,
+            title: newInquiry.title,
+            author: newInquiry.author,
+            created_at: new Date().toISOString(),
             status: 'pending',
-            reply: null
+            is_secret: newInquiry.is_secret,
         };
 
+        // Show the list with the new row right away; the draft is kept until
+        // the insert succeeds so a failure can reopen the form with it.
+        setDraft(submitted);
+        setIsWriteMode(false);
         try {
-            const { error } = await supabase.from('inquiries').insert([newInquiry]);
-            if (error) throw error;
-
-            setIsWriteMode(false);
-            resetForm();
-            fetchInquiries();
+            const created = await mutateInquiry(pendingId, pendingRow, () => createInquiry(newInquiry));
+            removeInquiry(pendingId);
+            upsertInquiry(created);
+            setDraft(null);
             await showAlert('문의가 정상적으로 등록되었습니다! (확인)'); // Success Alert
         } catch (error: any) {
+            setIsWriteMode(true);
             await showAlert('문의 등록 실패: ' + (error.message || '알 수 없는 오류'));
             console.error(error);
         }
-    };
-
-    const handleReply = async () => {
-        if (!selectedInquiry) return;
-        try {
-            const { error } = await supabase
-                .from('inquiries')
-                .update({ reply: replyContent, status: 'answered' })
-                .eq('id', selectedInquiry.id);
+    }, [showAlert]);
 
-            if (error) throw error;
+    const handleCancelWrite = useCallback((current: InquiryDraft) => {
+        setDraft(current);
+        setIsWriteMode(false);
+    }, []);
 
-            const updated = { ...selectedInquiry, reply: replyContent, status: 'answered' as const };
-            setSelectedInquiry(updated);
-            setReplyContent('');
-            fetchInquiries();
+    const handleReply = useCallback(async (previous: Inquiry, reply: string) => {
+        const updated = { ...previous, reply, status: 'answered' as const };
+        setSelectedInquiry(updated);
+        setReplyDraft(null);
+        try {
+            const row = await mutateInquiry(previous.id, toSummary(updated), () =>
+                updateInquiry(previous.id, { reply, status: 'answered' })
+            );
+            upsertInquiry(row);
         } catch (error) {
+            setSelectedInquiry(previous);
+            setReplyDraft({ id: previous.id, reply });
             await showAlert('답변 등록 실패');
             console.error(error);
         }
-    };
+    }, [showAlert]);
 
-    const handleDeleteReply = async () => {
-        if (!selectedInquiry) return;
+    const handleDeleteReply = useCallback(async (previous: Inquiry) => {
         if (!await showConfirm('정말 답변을 삭제하시겠습니까?')) return;
 
+        const updated = { ...previous, reply: null, status: 'pending' as const };
+        setSelectedInquiry(updated);
         try {
-            const { error } = await supabase
-                .from('inquiries')
-                .update({ reply: null, status: 'pending' })
-                .eq('id', selectedInquiry.id);
-
-            if (error) throw error;
-
-            const updated = { ...selectedInquiry, reply: null, status: 'pending' as const };
-            setSelectedInquiry(updated);
-            fetchInquiries();
+            const row = await mutateInquiry(previous.id, toSummary(updated), () =>
+                updateInquiry(previous.id, { reply: null, status: 'pending' })
+            );
+            upsertInquiry(row);
         } catch (error) {
+            setSelectedInquiry(previous);
             await showAlert('답변 삭제 실패');
             console.error(error);
         }
-    };
-
-    const handleDeleteInquiry = async () => {
-        if (!selectedInquiry) return;
+    }, [showConfirm, showAlert]);
 
+    const handleDeleteInquiry = useCallback(async (previous: Inquiry) => {
+        let inputPwd: string | null = null;
         if (isAdmin) {
             if (!await showConfirm('관리자 권한으로 삭제하시겠습니까?')) return;
         } else {
-            const inputPwd = await showPrompt('삭제하려면 비밀번호를 입력해주세요.', { isSecret: true, title: '비밀번호 확인' });
-            if (inputPwd !== selectedInquiry.password) {
-                await showAlert('비밀번호가 일치하지 않습니다.');
-                return;
-            }
+            inputPwd = await showPrompt('삭제하려면 비밀번호를 입력해주세요.', { isSecret: true, title: '비밀번호 확인' });
+            if (inputPwd === null) return;
         }
 
+        setSelectedInquiry(null);
         try {
-            const { error } = await supabase.from('inquiries').delete().eq('id', selectedInquiry.id);
-            if (error) throw error;
-
-            setSelectedInquiry(null);
-            fetchInquiries();
+            await mutateInquiry(previous.id, null, () => deleteInquiry(previous.id, inputPwd));
         } catch (error) {
+            setSelectedInquiry(previous);
+            if (error instanceof InquiryPasswordError) {
+                await showAlert('비밀번호가 일치하지 않습니다.');
+                return;
+            }
             await showAlert('삭제 실패');
             console.error(error);
         }
-    };
-
-    const handleAdminLogin = async (e: React.FormEvent) => {
-        e.preventDefault();
-        setAdminError('');
-        try {
-            const { error } = await supabase.auth.signInWithPassword({
-                email: adminEmail,
-                password: adminPassword
-            });
-            if (error) throw error;
-            setShowAdminLogin(false);
-            setAdminEmail('');
-            setAdminPassword('');
-        } catch (error: any) {
-            setAdminError(error.message || '로그인 실패');
-        }
-    };
+    }, [isAdmin, showConfirm, showPrompt, showAlert]);
 
     const handleAdminLogout = async () => {
         try {
@@ -231,25 +193,38 @@ const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; ad
         }
     };
 
-    const resetForm = () => {
-        setNewTitle('');
-        setNewContent('');
-        setNewAuthor('');
-        setNewPassword('');
-        setIsSecret(false);
-    };
+    const handleInquiryClick = useCallback(async (inquiry: InquirySummary) => {
+        if (inquiry.id.startsWith(PENDING_ID_PREFIX)) return;
+        const needsPassword = inquiry.is_secret && !isAdmin;
+        const inputPwd = needsPassword
+            ? await showPrompt('비밀글입니다. 비밀번호를 입력해주세요.', { isSecret: true, title: '비밀번호 확인' })
+            : null;
+        if (needsPassword && inputPwd === null) return;
 
-    const handleInquiryClick = async (inquiry: Inquiry) => {
-        if (inquiry.is_secret && !isAdmin) {
-            const inputPwd = await showPrompt('비밀글입니다. 비밀번호를 입력해주세요.', { isSecret: true, title: '비밀번호 확인' });
-            if (inputPwd !== inquiry.password) {
-                await showAlert('비밀번호가 일치하지 않습니다.');
-                return;
-            }
+        let detail: Inquiry | null;
+        try {
+            detail = await fetchInquiryDetail(inquiry.id, inputPwd);
+        } catch (error) {
+            if (isAbortError(error)) return; // another inquiry was opened meanwhile
+            await showAlert('문의를 불러오지 못했습니다.');
+            console.error(error);
+            return;
+        }
+        if (!detail) {
+            await showAlert('비밀번호가 일치하지 않습니다.');
+            return;
         }
-        setSelectedInquiry(inquiry);
+        setSelectedInquiry(detail);
         setIsWriteMode(false);
-    };
+    }, [isAdmin, showPrompt, showAlert]);
+
+    const openWriteForm = useCallback(() => {
+        setIsWriteMode(true);
+        setSelectedInquiry(null);
+    }, []);
+
+    const closeDetail = useCallback(() => setSelectedInquiry(null), []);
+    const closeAdminLogin = useCallback(() => setShowAdminLogin(false), []);
 
     return (
         <motion.div
@@ -279,7 +254,7 @@ const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; ad
                             </div>
                         ) : adminEntry ? (
                             <button
-                                onClick={() => { setShowAdminLogin(true); setAdminError(''); }}
+                                onClick={() => setShowAdminLogin(true)}
                                 className="px-3 py-1 rounded text-xs font-bold border border-slate-700 text-slate-500 hover:text-white"
                             >
                                 관리자 로그인
@@ -291,6 +266,7 @@ const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; ad
                     </button>
                 </div>
 
+
                 <div className="flex flex-col lg:flex-row gap-8 min-h-[600px]">
 
                     {/* LEFT COLUMN: List OR Welcome Guide */}
@@ -340,72 +316,15 @@ const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; ad
                             </div>
                         ) : (
                             // Inquiry List (Default View)
-                            <div className="h-full flex flex-col">
-                                <div className="flex justify-between items-center mb-6">
-                                    <h3 className="text-xl font-bold text-slate-300">문의 목록 ({inquiries.length})</h3>
-                                    <button
-                                        onClick={() => { setIsWriteMode(true); setSelectedInquiry(null); }}
-                                        className="flex items-center gap-2 bg-[#1F2833] hover:bg-[#45A29E] text-[#66FCF1] hover:text-white px-4 py-2 rounded-lg text-sm font-bold transition-all"
-                                    >
-                                        <Plus size={16} /> 문의하기
-                                    </button>
-                                </div>
-
-                                {/* List Container - Removing inner scroll and fixed height for natural scrolling */}
-                                <div className="space-y-3">
-                                    {loading ? (
-                                        <div className="flex justify-center items-center py-20">
-                                            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-[#66FCF1]"></div>
-                                        </div>
-                                    ) : inquiries.length === 0 ? (
-                                        <motion.div
-                                            initial={{ opacity: 0, scale: 0.9 }}
-                                            animate={{ opacity: 1, scale: 1 }}
-                                            className="flex flex-col items-center justify-center py-16 text-center bg-[#1F2833]/30 rounded-xl border border-dashed border-slate-700"
-                                        >
-                                            <div className="w-16 h-16 bg-[#1F2833] rounded-full flex items-center justify-center mb-4 text-slate-500">
-                                                <MessageSquare size={32} />
-                                            </div>
-                                            <h4 className="text-lg font-bold text-white mb-2">등록된 문의가 없습니다</h4>
-                                            <p className="text-slate-500 text-sm mb-6 max-w-[250px]">
-                                                궁금한 점이나 건의사항이 있으신가요?<br />
-                                                첫 번째 문의를 남겨보세요!
-                                            </p>
-                                            <button
-                                                onClick={() => { setIsWriteMode(true); setSelectedInquiry(null); }}
-                                                className="px-5 py-2 bg-[#66FCF1]/10 hover:bg-[#66FCF1]/20 text-[#66FCF1] border border-[#66FCF1]/50 rounded-lg text-sm font-bold transition-all"
-                                            >
-                                                문의 작성하기
-                                            </button>
-                                        </motion.div>
-                                    ) : (
-                                        inquiries.map((item) => (
-                                            <motion.div
-                                                key={item.id}
-                                                onClick={() => handleInquiryClick(item)}
-                                                className={`p-5 rounded-xl bg-[#1F2833]/30 border border-[#45A29E]/10 cursor-pointer hover:bg-[#1F2833] hover:border-[#66FCF1]/30 transition-all group ${selectedInquiry?.id === item.id ? 'border-[#66FCF1] bg-[#1F2833]' : ''}`}
-                                            >
-                                                <div className="flex justify-between items-start mb-2">
-                                                    <div className="flex items-center gap-2">
-                                                        {item.is_secret && <Lock size={14} className="text-[#FF6B6B]" />}
-                                                        <span className={`font-bold text-lg ${item.is_secret && !isAdmin ? 'text-slate-500' : 'text-white'}`}>
-                                                            {item.is_secret && !isAdmin ? '비밀글입니다.' : item.title}
-                                                        </span>
-                                                    </div>
-                                                    {item.status === 'answered' ? (
-                                                        <span className="text-[#66FCF1] text-xs font-bold px-2 py-1 bg-[#66FCF1]/10 rounded border border-[#66FCF1]/30">답변완료</span>
-                                                    ) : (
-                                                        <span className="text-slate-500 text-xs font-bold px-2 py-1 bg-slate-800 rounded border border-slate-700">대기중</span>
-                                                    )}
-                                                </div>
-                                                <div className="flex justify-between text-sm text-slate-500">
-                                                    <span>{item.author}</span>
-                                                    <span>{new Date(item.created_at).toLocaleDateString()}</span>
-                                                </div>
-                                            </motion.div>
-                                        )))}
-                                </div>
-                            </div>
+                            <InquiryList
+                                isAdmin={isAdmin}
+                                loading={loading}
+                                refreshing={refreshing}
+                                selectedId={selectedInquiry?.id ?? null}
+                                onRefresh={fetchInquiries}
+                                onSelect={handleInquiryClick}
+                                onWrite={openWriteForm}
+                            />
                         )}
                     </div>
 
@@ -417,206 +336,24 @@ const InquiryBoard = ({ onClose, adminEntry = false }: { onClose: () => void; ad
                             className="flex-1 lg:max-w-2xl bg-[#1F2833]/50 border border-[#45A29E]/20 rounded-2xl p-8 h-fit min-h-[600px]"
                         >
                             {isWriteMode ? (
-                                <form onSubmit={handleSubmit} className="space-y-6">
-                                    <h3 className="text-2xl font-bold text-white mb-6">새로운 문의 작성</h3>
-
-                                    <div className="space-y-2">
-                                        <label className="text-sm font-bold text-slate-400">제목</label>
-                                        <input
-                                            type="text" required
-                                            value={newTitle} onChange={e => setNewTitle(e.target.value)}
-                                            placeholder="문의 제목을 입력해주세요"
-                                            className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
-                                        />
-                                    </div>
-
-                                    <div className="grid grid-cols-2 gap-4">
-                                        <div className="space-y-2">
-                                            <label className="text-sm font-bold text-slate-400">작성자</label>
-                                            <input
-                                                type="text" required
-                                                value={newAuthor} onChange={e => setNewAuthor(e.target.value)}
-                                                placeholder="닉네임"
-                                                className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
-                                            />
-                                        </div>
-                                        <div className="space-y-2">
-                                            <label className="text-sm font-bold text-slate-400">비밀번호</label>
-                                            <input
-                                                type="password" required
-                                                value={newPassword} onChange={e => setNewPassword(e.target.value)}
-                                                placeholder="수정/삭제 시 필요"
-                                                className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
-                                            />
-                                        </div>
-                                    </div>
-
-                                    <div className="space-y-2">
-                                        <label className="text-sm font-bold text-slate-400">내용</label>
-                                        <textarea
-                                            required rows={8}
-                                            value={newContent} onChange={e => setNewContent(e.target.value)}
-                                            placeholder="오류 제보 시 발생 상황을 구체적으로 적어주시면 큰 도움이 됩니다."
-                                            className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none resize-none placeholder:text-slate-600"
-                                        ></textarea>
-                                    </div>
-
-                                    <div className="flex items-center gap-2 bg-[#0B0C10] p-3 rounded-lg border border-slate-800">
-                                        <input
-                                            type="checkbox" id="secret"
-                                            checked={isSecret} onChange={e => setIsSecret(e.target.checked)}
-                                            className="w-4 h-4 rounded border-slate-700 bg-[#0B0C10] text-[#66FCF1] accent-[#66FCF1]"
-                                        />
-                                        <label htmlFor="secret" className="text-sm text-slate-300 cursor-pointer select-none font-medium">비밀글로 작성 (관리자와 본인만 확인 가능)</label>
-                                    </div>
-
-                                    <div className="flex gap-3 pt-6">
-                                        <button type="submit" className="flex-1 bg-[#66FCF1] hover:bg-[#45A29E] text-[#0B0C10] font-bold py-3 rounded-lg transition-colors shadow-lg shadow-[#66FCF1]/20">
-                                            등록하기
-                                        </button>
-                                        <button type="button" onClick={() => setIsWriteMode(false)} className="px-6 py-3 border border-slate-700 text-slate-400 font-bold rounded-lg hover:bg-slate-800 transition-colors">
-                                            취소
-                                        </button>
-                                    </div>
-                                </form>
+                                <InquiryWriteForm initial={draft} onSubmit={handleSubmit} onCancel={handleCancelWrite} />
                             ) : selectedInquiry && (
-                                <div className="space-y-6 relative h-full flex flex-col">
-                                    <div className="flex items-start justify-between gap-4">
-                                        <div className="flex flex-col gap-2">
-                                            <div className="flex items-center gap-2">
-                                                {selectedInquiry.is_secret && <Lock size={16} className="text-[#FF6B6B]" />}
-                                                <span className="text-xs font-bold text-[#66FCF1] px-2 py-1 bg-[#66FCF1]/10 rounded border border-[#66FCF1]/20">
-                                                    {selectedInquiry.status === 'answered' ? '답변완료' : '대기중'}
-                                                </span>
-                                                <span className="text-xs text-slate-500">{new Date(selectedInquiry.created_at).toLocaleString()}</span>
-                                            </div>
-                                            <h3 className="text-2xl font-bold text-white leading-relaxed">{selectedInquiry.title}</h3>
-                                        </div>
-
-                                        {/* Delete Button Moved Here for better visibility */}
-                                        <button
-                                            onClick={handleDeleteInquiry}
-                                            className="shrink-0 px-3 py-1.5 bg-red-500/10 border border-red-500/30 hover:border-red-500 hover:bg-red-500/20 text-red-500 rounded text-xs font-bold transition-all"
-                                        >
-                                            삭제
-                                        </button>
-                                    </div>
-
-                                    <div className="flex items-center gap-2 pb-6 border-b border-slate-700">
-                                        <div className="w-8 h-8 rounded-full bg-slate-700 flex items-center justify-center text-xs font-bold text-slate-300">
-                                            {selectedInquiry.author[0]}
-                                        </div>
-                                        <span className="font-bold text-slate-400">{selectedInquiry.author}</span>
-                                    </div>
-
-                                    <div className="py-4 text-slate-300 leading-relaxed whitespace-pre-wrap min-h-[100px] flex-1">
-                                        {selectedInquiry.content}
-                                    </div>
-
-                                    {/* Admin Filter for Password */}
-                                    {isAdmin && (
-                                        <div className="text-xs text-slate-600 font-mono mt-2 bg-[#000] p-2 rounded">
-                                            Admin Info - Password: {selectedInquiry.password}
-                                        </div>
-                                    )}
-
-                                    {/* Answer Section */}
-                                    {selectedInquiry.reply ? (
-                                        <div className="mt-8 bg-[#66FCF1]/5 border border-[#66FCF1]/20 rounded-xl p-6 relative group">
-                                            <div className="flex items-center gap-2 mb-4">
-                                                <div className="w-6 h-6 rounded bg-[#66FCF1] flex items-center justify-center">
-                                                    <CheckCircle size={14} className="text-[#0B0C10]" />
-                                                </div>
-                                                <span className="font-bold text-[#66FCF1]">관리자 답변</span>
-                                                <span className="text-xs text-[#66FCF1]/50 ml-auto">Verified Staff</span>
-                                            </div>
-                                            <p className="text-slate-300 leading-relaxed">{selectedInquiry.reply}</p>
-
-                                            {/* Delete Reply Button */}
-                                            {isAdmin && (
-                                                <button
-                                                    onClick={handleDeleteReply}
-                                                    className="absolute top-4 right-4 text-slate-600 hover:text-red-500 opacity-0 group-hover:opacity-100 transition-opacity"
-                                                    title="답변 삭제"
-                                                >
-                                                    <X size={16} />
-                                                </button>
-                                            )}
-                                        </div>
-                                    ) : (
-                                        <div className="mt-8">
-                                            {isAdmin ? (
-                                                <div className="space-y-3">
-                                                    <label className="text-sm font-bold text-[#66FCF1]">답변 작성 (관리자)</label>
-                                                    <textarea
-                                                        value={replyContent} onChange={e => setReplyContent(e.target.value)}
-                                                        className="w-full bg-[#0B0C10] border border-[#66FCF1]/30 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none resize-none form-textarea"
-                                                        rows={4}
-                                                        placeholder="답변을 입력하세요..."
-                                                    ></textarea>
-                                                    <button onClick={handleReply} className="w-full bg-[#1F2833] hover:bg-[#66FCF1] border border-[#66FCF1] text-[#66FCF1] hover:text-[#0B0C10] font-bold py-3 rounded-lg transition-colors">
-                                                        답변 등록
-                                                    </button>
-                                                </div>
-                                            ) : (
-                                                <div className="p-6 bg-slate-800/30 rounded-xl text-center text-slate-500 text-sm border border-slate-700/50">
-                                                    아직 답변이 등록되지 않았습니다.
-                                                </div>
-                                            )}
-                                        </div>
-                                    )}
-
-                                    <button onClick={() => setSelectedInquiry(null)} className="lg:hidden w-full mt-6 py-3 border border-slate-700 rounded-lg text-slate-400">
-                                        목록으로 돌아가기
-                                    </button>
-                                </div>
+                                <InquiryDetail
+                                    inquiry={selectedInquiry}
+                                    isAdmin={isAdmin}
+                                    replyDraft={replyDraft?.id === selectedInquiry.id ? replyDraft.reply : ''}
+                                    onReply={handleReply}
+                                    onDeleteReply={handleDeleteReply}
+                                    onDelete={handleDeleteInquiry}
+                                    onBack={closeDetail}
+                                />
                             )}
                         </motion.div>
                     )}
                 </div>
             </div>
 
-            {showAdminLogin && (
-                <div className="fixed inset-0 z-[80] flex items-center justify-center bg-black/70 px-6">
-                    <div className="w-full max-w-md rounded-2xl border border-[#45A29E]/20 bg-[#0B0C10] p-6 shadow-xl">
-                        <div className="flex items-center justify-between mb-4">
-                            <h3 className="text-lg font-bold text-white">관리자 로그인</h3>
-                            <button onClick={() => setShowAdminLogin(false)} className="p-1 hover:bg-[#1F2833] rounded">
-                                <X className="w-5 h-5 text-slate-400 hover:text-white" />
-                            </button>
-                        </div>
-                        <form onSubmit={handleAdminLogin} className="space-y-4">
-                            <div className="space-y-2">
-                                <label className="text-sm font-bold text-slate-400">이메일</label>
-                                <input
-                                    type="email" required
-                                    value={adminEmail} onChange={e => setAdminEmail(e.target.value)}
-                                    placeholder="admin@example.com"
-                                    className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
-                                />
-                            </div>
-                            <div className="space-y-2">
-                                <label className="text-sm font-bold text-slate-400">비밀번호</label>
-                                <input
-                                    type="password" required
-                                    value={adminPassword} onChange={e => setAdminPassword(e.target.value)}
-                                    placeholder="비밀번호"
-                                    className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
-                                />
-                            </div>
-                            {adminError && (
-                                <div className="text-xs text-red-400">{adminError}</div>
-                            )}
-                            <button
-                                type="submit"
-                                className="w-full bg-[#66FCF1] hover:bg-[#45A29E] text-[#0B0C10] font-bold py-3 rounded-lg transition-colors shadow-lg shadow-[#66FCF1]/20"
-                            >
-                                로그인
-                            </button>
-                        </form>
-                    </div>
-                </div>
-            )}
+            {showAdminLogin && <AdminLoginDialog onClose={closeAdminLogin} />}
         </motion.div>
     );
 };
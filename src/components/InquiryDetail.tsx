@@ -0,0 +1,93 @@
+import { memo } from 'react';
+import { CheckCircle, Lock, X } from 'lucide-react';
+import InquiryReplyEditor from './InquiryReplyEditor';
+import type { Inquiry } from '../lib/inquiries';
+
+interface InquiryDetailProps {
+    inquiry: Inquiry;
+    isAdmin: boolean;
+    // Reply text to restore in the editor after a failed submit.
+    replyDraft: string;
+    onReply: (inquiry: Inquiry, reply: string) => void;
+    onDeleteReply: (inquiry: Inquiry) => void;
+    onDelete: (inquiry: Inquiry) => void;
+    onBack: () => void;
+}
+
+const InquiryDetail = memo(({ inquiry, isAdmin, replyDraft, onReply, onDeleteReply, onDelete, onBack }: InquiryDetailProps) => (
+    <div className="space-y-6 relative h-full flex flex-col">
+        <div className="flex items-start justify-between gap-4">
+            <div className="flex flex-col gap-2">
+                <div className="flex items-center gap-2">
+                    {inquiry.is_secret && <Lock size={16} className="text-[#FF6B6B]" />}
+                    <span className="text-xs font-bold text-[#66FCF1] px-2 py-1 bg-[#66FCF1]/10 rounded border border-[#66FCF1]/20">
+                        {inquiry.status === 'answered' ? '답변완료' : '대기중'}
+                    </span>
+                    <span className="text-xs text-slate-500">{new Date(inquiry.created_at).toLocaleString()}</span>
+                </div>
+                <h3 className="text-2xl font-bold text-white leading-relaxed">{inquiry.title}</h3>
+            </div>
+
+            {/* Delete Button Moved Here for better visibility */}
+            <button
+                onClick={() => onDelete(inquiry)}
+                className="shrink-0 px-3 py-1.5 bg-red-500/10 border border-red-500/30 hover:border-red-500 hover:bg-red-500/20 text-red-500 rounded text-xs font-bold transition-all"
+            >
+                삭제
+            </button>
+        </div>
+
+        <div className="flex items-center gap-2 pb-6 border-b border-slate-700">
+            <div className="w-8 h-8 rounded-full bg-slate-700 flex items-center justify-center text-xs font-bold text-slate-300">
+                {inquiry.author[0]}
+            </div>
+            <span className="font-bold text-slate-400">{inquiry.author}</span>
+        </div>
+
+        <div className="py-4 text-slate-300 leading-relaxed whitespace-pre-wrap min-h-[100px] flex-1">
+            {inquiry.content}
+        </div>
+
+        {/* Answer Section */}
+        {inquiry.reply ? (
+            <div className="mt-8 bg-[#66FCF1]/5 border border-[#66FCF1]/20 rounded-xl p-6 relative group">
+                <div className="flex items-center gap-2 mb-4">
+                    <div className="w-6 h-6 rounded bg-[#66FCF1] flex items-center justify-center">
+                        <CheckCircle size={14} className="text-[#0B0C10]" />
+                    </div>
+                    <span className="font-bold text-[#66FCF1]">관리자 답변</span>
+                    <span className="text-xs text-[#66FCF1]/50 ml-auto">Verified Staff</span>
+                </div>
+                <p className="text-slate-300 leading-relaxed">{inquiry.reply}</p>
+
+                {/* Delete Reply Button */}
+                {isAdmin && (
+                    <button
+                        onClick={() => onDeleteReply(inquiry)}
+                        className="absolute top-4 right-4 text-slate-600 hover:text-red-500 opacity-0 group-hover:opacity-100 transition-opacity"
+                        title="답변 삭제"
+                    >
+                        <X size={16} />
+                    </button>
+                )}
+            </div>
+        ) : (
+            <div className="mt-8">
+                {isAdmin ? (
+                    // Keyed so a half-written reply does not carry over to another inquiry.
+                    <InquiryReplyEditor key={inquiry.id} initial={replyDraft} onSubmit={(reply) => onReply(inquiry, reply)} />
+                ) : (
+                    <div className="p-6 bg-slate-800/30 rounded-xl text-center text-slate-500 text-sm border border-slate-700/50">
+                        아직 답변이 등록되지 않았습니다.
+                    </div>
+                )}
+            </div>
+        )}
+
+        <button onClick={onBack} className="lg:hidden w-full mt-6 py-3 border border-slate-700 rounded-lg text-slate-400">
+            목록으로 돌아가기
+        </button>
+    </div>
+));
+
+export default InquiryDetail;
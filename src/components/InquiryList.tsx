@@ -0,0 +1,274 @@
+import { memo, useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import { motion } from 'framer-motion';
+import { MessageSquare, Plus, RefreshCw, Search } from 'lucide-react';
+import { useInquiryList } from '../hooks/useInquiryList';
+import InquiryRow from './InquiryRow';
+import VirtualList from './VirtualList';
+import { searchInquiries } from '../lib/inquirySearch';
+import { isAbortError } from '../lib/dataAccess';
+import {
+    fetchInquiryPage,
+    searchInquiryPage,
+    type Inquiry,
+    type InquiryPage,
+    type InquirySearch,
+    type InquirySummary,
+} from '../lib/inquiries';
+import { appendInquiryPage } from '../lib/inquiryStore';
+
+// Typical rendered row height plus the 12px gap; the list measures real ones.
+const INQUIRY_ROW_ESTIMATE = 110;
+const SEARCH_DEBOUNCE_MS = 150;
+const inquiryKey = (item: InquirySummary) => item.id;
+
+interface InquiryListProps {
+    isAdmin: boolean;
+    loading: boolean;
+    refreshing: boolean;
+    selectedId: string | null;
+    onRefresh: () => void;
+    onSelect: (item: InquirySummary) => void;
+    onWrite: () => void;
+}
+
+// The list column: search, admin filters, paging and the rows. It is the
+// only part of the board that follows the inquiry store, and the search
+// fields are its own state, so neither store updates nor typing here
+// re-render the rest of the board.
+const InquiryList = memo(({ isAdmin, loading, refreshing, selectedId, onRefresh, onSelect, onWrite }: InquiryListProps) => {
+    const { inquiries, byId, nextCursor } = useInquiryList();
+    const [searchQuery, setSearchQuery] = useState('');
+    const [searchResponse, setSearchResponse] = useState<{ ids: string[]; total: number } | null>(null);
+    // Admin filters; setting any of them searches the whole history on the
+    // server instead of the loaded rows.
+    const [statusFilter, setStatusFilter] = useState<Inquiry['status'] | ''>('');
+    const [fromDate, setFromDate] = useState('');
+    const [toDate, setToDate] = useState('');
+    const [serverPage, setServerPage] = useState<(InquiryPage & { search: InquirySearch }) | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const sentinelRef = useRef<HTMLDivElement>(null);
+
+    const serverSearch = useMemo<InquirySearch | null>(
+        () =>
+            isAdmin && (statusFilter || fromDate || toDate)
+                ? { query: searchQuery, status: statusFilter || null, from: fromDate || null, to: toDate || null }
+                : null,
+        [isAdmin, searchQuery, statusFilter, fromDate, toDate]
+    );
+
+    // Searches once typing pauses, and again when the list changes under an
+    // active query. Responses for an outdated query are dropped.
+    useEffect(() => {
+        const query = searchQuery.trim();
+        if (!query || serverSearch) return;
+        let current = true;
+        const timer = setTimeout(async () => {
+            const { hits, total } = await searchInquiries(query);
+            if (current) setSearchResponse({ ids: hits.map((hit) => hit.id), total });
+        }, SEARCH_DEBOUNCE_MS);
+        return () => {
+            current = false;
+            clearTimeout(timer);
+        };
+    }, [searchQuery, inquiries, isAdmin, serverSearch]);
+
+    useEffect(() => {
+        if (!serverSearch) return;
+        let current = true;
+        const timer = setTimeout(async () => {
+            try {
+                const page = await searchInquiryPage(serverSearch, null);
+                if (current) setServerPage({ ...page, search: serverSearch });
+            } catch (error) {
+                if (!isAbortError(error)) console.error('Failed to search inquiries', error);
+            }
+        }, SEARCH_DEBOUNCE_MS);
+        return () => {
+            current = false;
+            clearTimeout(timer);
+        };
+    }, [serverSearch]);
+
+    // The last response stays up while the next query is pending.
+    const serverResult = serverSearch ? serverPage : null;
+    const searchResult = searchQuery.trim() && !serverSearch ? searchResponse : null;
+    const searchHits = useMemo(
+        () => searchResult && searchResult.ids.map((id) => byId[id]).filter((row) => row !== undefined),
+        [searchResult, byId]
+    );
+    const results = serverResult ? serverResult.rows : searchHits;
+    const visibleInquiries = results ?? inquiries;
+    // Local search covers the loaded rows only, so it has no further pages.
+    let moreCursor = searchResult ? null : nextCursor;
+    if (serverResult) moreCursor = serverResult.search === serverSearch ? serverResult.nextCursor : null;
+
+    const loadMoreInquiries = useCallback(async () => {
+        // A reload supersedes page requests (see fetchInquiryPage), so none
+        // starts while one is running.
+        if (!moreCursor || loadingMore || refreshing) return;
+        setLoadingMore(true);
+        try {
+            if (serverResult) {
+                const { search } = serverResult;
+                const page = await searchInquiryPage(search, moreCursor);
+                setServerPage((previous) =>
+                    previous?.search === search ? { ...page, rows: [...previous.rows, ...page.rows], search } : previous
+                );
+            } else {
+                appendInquiryPage(await fetchInquiryPage(moreCursor));
+            }
+        } catch (error) {
+            if (!isAbortError(error)) console.error('Failed to fetch more inquiries', error);
+        } finally {
+            setLoadingMore(false);
+        }
+    }, [moreCursor, loadingMore, refreshing, serverResult]);
+
+    // Infinite scroll: load the next page once the sentinel below the list
+    // comes within 400px of the viewport.
+    useEffect(() => {
+        const sentinel = sentinelRef.current;
+        if (!sentinel || !moreCursor || loadingMore || refreshing) return;
+        const observer = new IntersectionObserver((entries) => {
+            if (entries[0]?.isIntersecting) loadMoreInquiries();
+        }, { rootMargin: '400px' });
+        observer.observe(sentinel);
+        return () => observer.disconnect();
+    }, [moreCursor, loadingMore, refreshing, loadMoreInquiries]);
+
+    return (
+        <div className="h-full flex flex-col">
+            <div className="flex justify-between items-center mb-4">
+                <div className="flex items-center gap-2">
+                    <h3 className="text-xl font-bold text-slate-300">
+                        {serverResult
+                            ? `검색 결과 (${serverResult.rows.length}${serverResult.nextCursor ? '+' : ''})`
+                            : searchResult
+                                ? `검색 결과 (${searchResult.total})`
+                                : `문의 목록 (${inquiries.length}${nextCursor ? '+' : ''})`}
+                    </h3>
+                    <button
+                        onClick={onRefresh}
+                        disabled={refreshing}
+                        aria-label="새로고침"
+                        className="p-1.5 rounded-lg text-slate-500 hover:text-[#66FCF1] hover:bg-[#1F2833] transition-colors disabled:opacity-50"
+                    >
+                        <RefreshCw size={16} className={refreshing ? 'animate-spin' : ''} />
+                    </button>
+                </div>
+                <button
+                    onClick={onWrite}
+                    className="flex items-center gap-2 bg-[#1F2833] hover:bg-[#45A29E] text-[#66FCF1] hover:text-white px-4 py-2 rounded-lg text-sm font-bold transition-all"
+                >
+                    <Plus size={16} /> 문의하기
+                </button>
+            </div>
+            <div className={`relative ${isAdmin ? 'mb-3' : 'mb-6'}`}>
+                <Search size={16} className="absolute left-3 top-1/2 -translate-y-1/2 text-slate-500" />
+                <input
+                    type="search"
+                    value={searchQuery}
+                    onChange={(e) => setSearchQuery(e.target.value)}
+                    placeholder={serverSearch ? '제목, 작성자, 내용으로 검색' : '제목 또는 작성자로 검색'}
+                    aria-label="문의 검색"
+                    className="w-full bg-[#0B0C10] border border-[#45A29E]/30 rounded-lg pl-9 pr-4 py-2 text-sm text-white focus:outline-none focus:border-[#66FCF1] transition-colors"
+                />
+            </div>
+            {isAdmin && (
+                <div className="flex flex-wrap items-center gap-2 mb-6 text-sm">
+                    <select
+                        value={statusFilter}
+                        onChange={(e) => setStatusFilter(e.target.value as Inquiry['status'] | '')}
+                        aria-label="답변 상태"
+                        className="bg-[#0B0C10] border border-[#45A29E]/30 rounded-lg px-3 py-2 text-slate-300 focus:outline-none focus:border-[#66FCF1]"
+                    >
+                        <option value="">전체 상태</option>
+                        <option value="pending">대기중</option>
+                        <option value="answered">답변완료</option>
+                    </select>
+                    <input
+                        type="date"
+                        value={fromDate}
+                        max={toDate || undefined}
+                        onChange={(e) => setFromDate(e.target.value)}
+                        aria-label="시작일"
+                        className="bg-[#0B0C10] border border-[#45A29E]/30 rounded-lg px-3 py-2 text-slate-300 focus:outline-none focus:border-[#66FCF1]"
+                    />
+                    <span className="text-slate-500">~</span>
+                    <input
+                        type="date"
+                        value={toDate}
+                        min={fromDate || undefined}
+                        onChange={(e) => setToDate(e.target.value)}
+                        aria-label="종료일"
+                        className="bg-[#0B0C10] border border-[#45A29E]/30 rounded-lg px-3 py-2 text-slate-300 focus:outline-none focus:border-[#66FCF1]"
+                    />
+                    {serverSearch && (
+                        <button
+                            onClick={() => { setStatusFilter(''); setFromDate(''); setToDate(''); }}
+                            className="px-3 py-2 text-slate-500 hover:text-[#66FCF1] transition-colors"
+                        >
+                            필터 해제
+                        </button>
+                    )}
+                </div>
+            )}
+
+            {/* List Container - Removing inner scroll and fixed height for natural scrolling */}
+            <div data-testid="inquiry-list" aria-busy={loading} className="space-y-3">
+                {loading ? (
+                    <div className="flex justify-center items-center py-20">
+                        <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-[#66FCF1]"></div>
+                    </div>
+                ) : results && results.length === 0 ? (
+                    <div className="py-16 text-center text-slate-500 text-sm">검색 결과가 없습니다.</div>
+                ) : inquiries.length === 0 ? (
+                    <motion.div
+                        initial={{ opacity: 0, scale: 0.9 }}
+                        animate={{ opacity: 1, scale: 1 }}
+                        className="flex flex-col items-center justify-center py-16 text-center bg-[#1F2833]/30 rounded-xl border border-dashed border-slate-700"
+                    >
+                        <div className="w-16 h-16 bg-[#1F2833] rounded-full flex items-center justify-center mb-4 text-slate-500">
+                            <MessageSquare size={32} />
+                        </div>
+                        <h4 className="text-lg font-bold text-white mb-2">등록된 문의가 없습니다</h4>
+                        <p className="text-slate-500 text-sm mb-6 max-w-[250px]">
+                            궁금한 점이나 건의사항이 있으신가요?<br />
+                            첫 번째 문의를 남겨보세요!
+                        </p>
+                        <button
+                            onClick={onWrite}
+                            className="px-5 py-2 bg-[#66FCF1]/10 hover:bg-[#66FCF1]/20 text-[#66FCF1] border border-[#66FCF1]/50 rounded-lg text-sm font-bold transition-all"
+                        >
+                            문의 작성하기
+                        </button>
+                    </motion.div>
+                ) : (
+                    <VirtualList
+                        items={visibleInquiries}
+                        getKey={inquiryKey}
+                        estimateHeight={INQUIRY_ROW_ESTIMATE}
+                        gap={12}
+                        renderItem={(item) => (
+                            <InquiryRow
+                                item={item}
+                                selected={selectedId === item.id}
+                                isAdmin={isAdmin}
+                                onSelect={onSelect}
+                            />
+                        )}
+                    />
+                )}
+                {!loading && moreCursor && (
+                    <div ref={sentinelRef} className="flex justify-center py-6">
+                        {loadingMore && (
+                            <div className="animate-spin rounded-full h-6 w-6 border-b-2 border-[#66FCF1]"></div>
+                        )}
+                    </div>
+                )}
+            </div>
+        </div>
+    );
+});
+
+export default InquiryList;
@@ -0,0 +1,30 @@
+import { memo, useState } from 'react';
+
+interface InquiryReplyEditorProps {
+    // Text to start from, e.g. a reply whose submit failed.
+    initial: string;
+    onSubmit: (reply: string) => void;
+}
+
+// Admin reply box. Keeps its own text so typing does not re-render the
+// detail pane or the list beside it.
+const InquiryReplyEditor = memo(({ initial, onSubmit }: InquiryReplyEditorProps) => {
+    const [reply, setReply] = useState(initial);
+
+    return (
+        <div className="space-y-3">
+            <label className="text-sm font-bold text-[#66FCF1]">답변 작성 (관리자)</label>
+            <textarea
+                value={reply} onChange={e => setReply(e.target.value)}
+                className="w-full bg-[#0B0C10] border border-[#66FCF1]/30 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none resize-none form-textarea"
+                rows={4}
+                placeholder="답변을 입력하세요..."
+            ></textarea>
+            <button onClick={() => onSubmit(reply)} className="w-full bg-[#1F2833] hover:bg-[#66FCF1] border border-[#66FCF1] text-[#66FCF1] hover:text-[#0B0C10] font-bold py-3 rounded-lg transition-colors">
+                답변 등록
+            </button>
+        </div>
+    );
+});
+
+export default InquiryReplyEditor;
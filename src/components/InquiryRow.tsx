@@ -0,0 +1,39 @@
+import { memo } from 'react';
+import { Lock } from 'lucide-react';
+import type { InquirySummary } from '../lib/inquiries';
+
+interface InquiryRowProps {
+    item: InquirySummary;
+    selected: boolean;
+    isAdmin: boolean;
+    onSelect: (item: InquirySummary) => void;
+}
+
+// Plain element with CSS transitions: rows are mounted and unmounted
+// constantly while scrolling, so they carry no framer-motion state.
+const InquiryRow = memo(({ item, selected, isAdmin, onSelect }: InquiryRowProps) => (
+    <div
+        onClick={() => onSelect(item)}
+        className={`p-5 rounded-xl bg-[#1F2833]/30 border border-[#45A29E]/10 cursor-pointer hover:bg-[#1F2833] hover:border-[#66FCF1]/30 transition-all group ${selected ? 'border-[#66FCF1] bg-[#1F2833]' : ''}`}
+    >
+        <div className="flex justify-between items-start mb-2">
+            <div className="flex items-center gap-2">
+                {item.is_secret && <Lock size={14} className="text-[#FF6B6B]" />}
+                <span className={`font-bold text-lg ${item.is_secret && !isAdmin ? 'text-slate-500' : 'text-white'}`}>
+                    {item.is_secret && !isAdmin ? '비밀글입니다.' : item.title}
+                </span>
+            </div>
+            {item.status === 'answered' ? (
+                <span className="text-[#66FCF1] text-xs font-bold px-2 py-1 bg-[#66FCF1]/10 rounded border border-[#66FCF1]/30">답변완료</span>
+            ) : (
+                <span className="text-slate-500 text-xs font-bold px-2 py-1 bg-slate-800 rounded border border-slate-700">대기중</span>
+            )}
+        </div>
+        <div className="flex justify-between text-sm text-slate-500">
+            <span>{item.author}</span>
+            <span>{new Date(item.created_at).toLocaleDateString()}</span>
+        </div>
+    </div>
+));
+
+export default InquiryRow;
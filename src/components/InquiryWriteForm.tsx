@@ -0,0 +1,93 @@
+import { memo, useState } from 'react';
+import type { NewInquiry } from '../lib/inquiries';
+
+export type InquiryDraft = Pick<NewInquiry, 'title' | 'content' | 'author' | 'password' | 'is_secret'>;
+
+interface InquiryWriteFormProps {
+    // Values to start from, e.g. a draft kept after cancelling or a failed submit.
+    initial: InquiryDraft | null;
+    onSubmit: (draft: InquiryDraft) => void;
+    onCancel: (draft: InquiryDraft) => void;
+}
+
+const EMPTY_DRAFT: InquiryDraft = { title: '', content: '', author: '', password: '', is_secret: false };
+
+// The fields live here, so typing re-renders this form and nothing else on
+// the board.
+const InquiryWriteForm = memo(({ initial, onSubmit, onCancel }: InquiryWriteFormProps) => {
+    const [draft, setDraft] = useState(initial ?? EMPTY_DRAFT);
+    const update = <K extends keyof InquiryDraft>(field: K, value: InquiryDraft[K]) =>
+        setDraft((current) => ({ ...current, [field]: value }));
+
+    const handleSubmit = (e: React.FormEvent) => {
+        e.preventDefault();
+        onSubmit(draft);
+    };
+
+    return (
+        <form onSubmit={handleSubmit} className="space-y-6">
+            <h3 className="text-2xl font-bold text-white mb-6">새로운 문의 작성</h3>
+
+            <div className="space-y-2">
+                <label className="text-sm font-bold text-slate-400">제목</label>
+                <input
+                    type="text" required
+                    value={draft.title} onChange={e => update('title', e.target.value)}
+                    placeholder="문의 제목을 입력해주세요"
+                    className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
+                />
+            </div>
+
+            <div className="grid grid-cols-2 gap-4">
+                <div className="space-y-2">
+                    <label className="text-sm font-bold text-slate-400">작성자</label>
+                    <input
+                        type="text" required
+                        value={draft.author} onChange={e => update('author', e.target.value)}
+                        placeholder="닉네임"
+                        className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
+                    />
+                </div>
+                <div className="space-y-2">
+                    <label className="text-sm font-bold text-slate-400">비밀번호</label>
+                    <input
+                        type="password" required
+                        value={draft.password} onChange={e => update('password', e.target.value)}
+                        placeholder="수정/삭제 시 필요"
+                        className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none placeholder:text-slate-600"
+                    />
+                </div>
+            </div>
+
+            <div className="space-y-2">
+                <label className="text-sm font-bold text-slate-400">내용</label>
+                <textarea
+                    required rows={8}
+                    value={draft.content} onChange={e => update('content', e.target.value)}
+                    placeholder="오류 제보 시 발생 상황을 구체적으로 적어주시면 큰 도움이 됩니다."
+                    className="w-full bg-[#0B0C10] border border-slate-700 rounded-lg p-3 text-white focus:border-[#66FCF1] focus:outline-none resize-none placeholder:text-slate-600"
+                ></textarea>
+            </div>
+
+            <div className="flex items-center gap-2 bg-[#0B0C10] p-3 rounded-lg border border-slate-800">
+                <input
+                    type="checkbox" id="secret"
+                    checked={draft.is_secret} onChange={e => update('is_secret', e.target.checked)}
+                    className="w-4 h-4 rounded border-slate-700 bg-[#0B0C10] text-[#66FCF1] accent-[#66FCF1]"
+                />
+                <label htmlFor="secret" className="text-sm text-slate-300 cursor-pointer select-none font-medium">비밀글로 작성 (관리자와 본인만 확인 가능)</label>
+            </div>
+
+            <div className="flex gap-3 pt-6">
+                <button type="submit" className="flex-1 bg-[#66FCF1] hover:bg-[#45A29E] text-[#0B0C10] font-bold py-3 rounded-lg transition-colors shadow-lg shadow-[#66FCF1]/20">
+                    등록하기
+                </button>
+                <button type="button" onClick={() => onCancel(draft)} className="px-6 py-3 border border-slate-700 text-slate-400 font-bold rounded-lg hover:bg-slate-800 transition-colors">
+                    취소
+                </button>
+            </div>
+        </form>
+    );
+});
+
+export default InquiryWriteForm;
@@ -1,38 +1,44 @@
 import React, { useEffect, useState } from 'react';
 import { motion } from 'framer-motion';
+import { hasPreloadedBefore, landingPreloadTasks, preloadAssets } from '../lib/preloadAssets';
 
 interface IntroOverlayProps {
     onComplete: () => void;
+    // Shortest time the overlay stays up on a first visit, so the brand is
+    // seen rather than flashed. Visits with warm caches skip it.
+    minDurationMs?: number;
 }
 
-const IntroOverlay: React.FC<IntroOverlayProps> = ({ onComplete }) => {
+const configuredMinDuration = import.meta.env.VITE_INTRO_MIN_MS;
+const DEFAULT_MIN_DURATION_MS = configuredMinDuration ? Number(configuredMinDuration) : 800;
+
+const IntroOverlay: React.FC<IntroOverlayProps> = ({ onComplete, minDurationMs = DEFAULT_MIN_DURATION_MS }) => {
     const [progress, setProgress] = useState(0);
 
     useEffect(() => {
-        // Simulate loading progress
-        const duration = 2000; // 2 seconds total load time
-        const interval = 20; // Update every 20ms
-        const steps = duration / interval;
-        const increment = 100 / steps;
+        // Progress moves as preload tasks settle, not on a clock, so the
+        // overlay renders once per task and leaves as soon as they are done.
+        const started = performance.now();
+        const minimum = hasPreloadedBefore() ? 0 : minDurationMs;
+        let cancelled = false;
+        let timer: ReturnType<typeof setTimeout> | undefined;
 
-        const timer = setInterval(() => {
-            setProgress((prev) => {
-                const next = prev + increment;
-                if (next >= 100) {
-                    clearInterval(timer);
-                    // Small delay before triggering completion to ensure user sees 100%
-                    setTimeout(onComplete, 200);
-                    return 100;
-                }
-                return next;
-            });
-        }, interval);
+        preloadAssets(landingPreloadTasks(), (fraction) => {
+            if (!cancelled) setProgress(fraction * 100);
+        }).then(() => {
+            if (cancelled) return;
+            timer = setTimeout(onComplete, Math.max(0, minimum - (performance.now() - started)));
+        });
 
-        return () => clearInterval(timer);
-    }, [onComplete]);
+        return () => {
+            cancelled = true;
+            clearTimeout(timer);
+        };
+    }, [onComplete, minDurationMs]);
 
     return (
         <motion.div
+            data-testid="intro-overlay"
             className="fixed inset-0 z-50 flex flex-col items-center justify-center bg-[#0B0C10]"
             initial={{ y: 0 }}
             exit={{ y: '-100%' }}
@@ -60,7 +66,7 @@ const IntroOverlay: React.FC<IntroOverlayProps> = ({ onComplete }) => {
                         className="absolute top-0 left-0 h-full bg-[#66FCF1] shadow-[0_0_10px_#66FCF1]"
                         initial={{ width: "0%" }}
                         animate={{ width: `${progress}%` }}
-                        transition={{ duration: 0.1, ease: "linear" }}
+                        transition={{ duration: 0.3, ease: "easeOut" }}
                     />
                 </div>
 
@@ -0,0 +1,139 @@
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState, type ReactNode } from 'react';
+
+interface VirtualListProps<T> {
+    items: T[];
+    // Must be stable across renders (e.g. defined at module level).
+    getKey: (item: T) => string;
+    renderItem: (item: T) => ReactNode;
+    // Height assumed for rows not yet measured, gap included.
+    estimateHeight: number;
+    gap?: number;
+    // Pixels rendered beyond each edge of the viewport.
+    overscan?: number;
+}
+
+interface Range {
+    start: number;
+    end: number;
+}
+
+// Largest i with offsets[i] <= y.
+const rowAt = (offsets: Float64Array, y: number) => {
+    let low = 0;
+    let high = offsets.length - 1;
+    while (low < high) {
+        const mid = (low + high + 1) >> 1;
+        if (offsets[mid] <= y) low = mid;
+        else high = mid - 1;
+    }
+    return low;
+};
+
+/**
+ * Window-scrolled list that mounts only the rows near the viewport. Rows
+ * may have any height: each mounted row is measured with a ResizeObserver,
+ * and rows never mounted count as `estimateHeight`. Spacers above and below
+ * keep the page height right, and the rows stay in normal flow so the
+ * browser's scroll anchoring absorbs measurement corrections.
+ */
+const VirtualList = <T,>({ items, getKey, renderItem, estimateHeight, gap = 0, overscan = 800 }: VirtualListProps<T>) => {
+    const containerRef = useRef<HTMLDivElement>(null);
+    // Measured heights by key; mutated in place, `measured` signals changes.
+    const [heights] = useState(() => new Map<string, number>());
+    const [measured, setMeasured] = useState(0);
+    const [range, setRange] = useState<Range>({ start: 0, end: 0 });
+
+    // offsets[i] is the top of row i; offsets[items.length] the total height.
+    const offsets = useMemo(() => {
+        const result = new Float64Array(items.length + 1);
+        for (let i = 0; i < items.length; i++) {
+            result[i + 1] = result[i] + (heights.get(getKey(items[i])) ?? estimateHeight);
+        }
+        return result;
+    }, [items, heights, measured, getKey, estimateHeight]);
+    const offsetsRef = useRef(offsets);
+
+    const updateRange = useCallback(() => {
+        const container = containerRef.current;
+        if (!container) return;
+        const current = offsetsRef.current;
+        const count = current.length - 1;
+        const top = -container.getBoundingClientRect().top;
+        const start = Math.min(rowAt(current, top - overscan), count);
+        const end = Math.min(rowAt(current, top + window.innerHeight + overscan) + 1, count);
+        setRange((previous) => (previous.start === start && previous.end === end ? previous : { start, end }));
+    }, [overscan]);
+
+    useLayoutEffect(() => {
+        offsetsRef.current = offsets;
+        updateRange();
+    }, [offsets, updateRange]);
+
+    useEffect(() => {
+        let frame = 0;
+        const schedule = () => {
+            if (!frame) {
+                frame = requestAnimationFrame(() => {
+                    frame = 0;
+                    updateRange();
+                });
+            }
+        };
+        window.addEventListener('scroll', schedule, { passive: true });
+        window.addEventListener('resize', schedule);
+        return () => {
+            cancelAnimationFrame(frame);
+            window.removeEventListener('scroll', schedule);
+            window.removeEventListener('resize', schedule);
+        };
+    }, [updateRange]);
+
+    const observer = useMemo(
+        () =>
+            typeof ResizeObserver === 'undefined'
+                ? null
+                : new ResizeObserver((entries) => {
+                    let changed = false;
+                    for (const entry of entries) {
+                        const key = (entry.target as HTMLElement).dataset.key;
+                        const height = entry.borderBoxSize?.[0]?.blockSize ?? (entry.target as HTMLElement).offsetHeight;
+                        if (key !== undefined && height > 0 && heights.get(key) !== height) {
+                            heights.set(key, height);
+                            changed = true;
+                        }
+                    }
+                    if (changed) setMeasured((version) => version + 1);
+                }),
+        [heights]
+    );
+    useEffect(() => () => observer?.disconnect(), [observer]);
+
+    const measureRef = useCallback(
+        (element: HTMLDivElement | null) => {
+            if (!element || !observer) return;
+            observer.observe(element);
+            return () => observer.unobserve(element);
+        },
+        [observer]
+    );
+
+    // The range can lag one render behind a shrinking list.
+    const end = Math.min(range.end, items.length);
+    const start = Math.min(range.start, end);
+    return (
+        <div ref={containerRef}>
+            <div style={{ height: offsets[start] }} />
+            {items.slice(start, end).map((item) => {
+                const key = getKey(item);
+                return (
+                    <div key={key} data-key={key} ref={measureRef} style={{ paddingBottom: gap }}>
+                        {renderItem(item)}
+                    </div>
+                );
+            })}
+            <div style={{ height: offsets[items.length] - offsets[end] }} />
+        </div>
+    );
+};
+
+export default VirtualList;
@@ -1,6 +1,5 @@
-import { createContext, useState, useCallback, type ReactNode } from 'react';
-
-type ModalType = 'alert' | 'confirm' | 'prompt';
+import { createContext, useState, useCallback, useEffect, useMemo, type ReactNode } from 'react';
+import { createModalQueue, type QueuedModal } from '../lib/modalQueue';
 
 interface ModalOptions {
     title?: string;
@@ -11,27 +10,39 @@ interface ModalOptions {
     isSecret?: boolean; // For password prompt
 }
 
-interface ModalContextType {
+// What callers use to open modals and GlobalModal to close them. The value
+// never changes, so components that only open modals (App, InquiryBoard) do
+// not re-render when one opens or closes.
+interface ModalActions {
     showAlert: (message: string, options?: ModalOptions) => Promise<void>;
     showConfirm: (message: string, options?: ModalOptions) => Promise<boolean>;
     showPrompt: (message: string, options?: ModalOptions) => Promise<string | null>;
-    modalState: ModalState | null;
     closeModal: (result: any) => void;
 }
 
-interface ModalState extends ModalOptions {
-    type: ModalType;
-    resolve: (value: any) => void;
-}
+export interface ModalState extends ModalOptions, QueuedModal {}
 
-export const ModalContext = createContext<ModalContextType | undefined>(undefined);
+export const ModalActionsContext = createContext<ModalActions | undefined>(undefined);
+// The open modal, read by GlobalModal alone.
+export const ModalStateContext = createContext<ModalState | null>(null);
 
 export const ModalProvider = ({ children }: { children: ReactNode }) => {
     const [modalState, setModalState] = useState<ModalState | null>(null);
+    // Owns the open modal and the ones waiting behind it; modalState
+    // follows it.
+    const [queue] = useState(() => createModalQueue<ModalState>(setModalState));
+
+    // Nothing is left pending when the provider goes away.
+    useEffect(() => {
+        queue.reopen();
+        return queue.close;
+    }, [queue]);
+
+    const open = queue.push;
 
     const showAlert = useCallback((message: string, options?: ModalOptions) => {
         return new Promise<void>((resolve) => {
-            setModalState({
+            open({
                 type: 'alert',
                 message,
                 resolve,
@@ -40,11 +51,11 @@ export const ModalProvider = ({ children }: { children: ReactNode }) => {
                 ...options
             });
         });
-    }, []);
+    }, [open]);
 
     const showConfirm = useCallback((message: string, options?: ModalOptions) => {
         return new Promise<boolean>((resolve) => {
-            setModalState({
+            open({
                 type: 'confirm',
                 message,
                 resolve,
@@ -54,11 +65,11 @@ export const ModalProvider = ({ children }: { children: ReactNode }) => {
                 ...options
             });
         });
-    }, []);
+    }, [open]);
 
     const showPrompt = useCallback((message: string, options?: ModalOptions) => {
         return new Promise<string | null>((resolve) => {
-            setModalState({
+            open({
                 type: 'prompt',
                 message,
                 resolve,
@@ -70,18 +81,20 @@ export const ModalProvider = ({ children }: { children: ReactNode }) => {
                 ...options
             });
         });
-    }, []);
+    }, [open]);
+
+    const closeModal = queue.settle;
 
-    const closeModal = useCallback((result: any) => {
-        if (modalState) {
-            modalState.resolve(result);
-            setModalState(null);
-        }
-    }, [modalState]);
+    const actions = useMemo(
+        () => ({ showAlert, showConfirm, showPrompt, closeModal }),
+        [showAlert, showConfirm, showPrompt, closeModal]
+    );
 
     return (
-        <ModalContext.Provider value={{ showAlert, showConfirm, showPrompt, modalState, closeModal }}>
-            {children}
-        </ModalContext.Provider>
+        <ModalActionsContext.Provider value={actions}>
+            <ModalStateContext.Provider value={modalState}>
+                {children}
+            </ModalStateContext.Provider>
+        </ModalActionsContext.Provider>
     );
 };
@@ -0,0 +1,4 @@
+import { useSyncExternalStore } from 'react';
+import { getAuthSnapshot, subscribeAuth } from '../lib/authStore';
+
+export const useAuth = () => useSyncExternalStore(subscribeAuth, getAuthSnapshot);
@@ -0,0 +1,8 @@
+import { useMemo, useSyncExternalStore } from 'react';
+import { getInquiriesSnapshot, subscribeInquiries } from '../lib/inquiryStore';
+
+export const useInquiryList = () => {
+    const snapshot = useSyncExternalStore(subscribeInquiries, getInquiriesSnapshot);
+    const inquiries = useMemo(() => snapshot.ids.map((id) => snapshot.byId[id]), [snapshot]);
+    return { inquiries, byId: snapshot.byId, nextCursor: snapshot.nextCursor };
+};
@@ -1,10 +1,19 @@
 import { useContext } from 'react';
-import { ModalContext } from '../context/ModalContext';
+import { ModalActionsContext, ModalStateContext } from '../context/ModalContext';
 
+// Opening modals. Stable across modal changes, so callers do not re-render
+// when one opens or closes.
 export const useModal = () => {
-    const context = useContext(ModalContext);
+    const context = useContext(ModalActionsContext);
     if (!context) {
         throw new Error('useModal must be used within a ModalProvider');
     }
     return context;
 };
+
+// The open modal, for the component that renders it.
+export const useModalState = () => {
+    const modalState = useContext(ModalStateContext);
+    const { closeModal } = useModal();
+    return { modalState, closeModal };
+};
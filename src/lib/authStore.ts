@@ -0,0 +1,107 @@
+import type { AuthChangeEvent, Session } from '@supabase/supabase-js';
+import { supabase } from './supabase';
+import { runQuery } from './dataAccess';
+import { createSwrCache } from './swrCache';
+
+// Session and admin role shared by every board mount, resolved once per
+// page instead of once per mount. The role is cached per user id (also
+// across reloads, through the SWR cache) so a reopened board renders its
+// header at once; it is re-checked in the background when stale and
+// dropped on sign-in and sign-out. The database enforces admin rights on
+// its own, so a stale role only affects what the UI offers.
+export interface AuthState {
+    ready: boolean; // session known and its role resolved, possibly from cache
+    userId: string | null;
+    email: string | null;
+    isAdmin: boolean;
+}
+
+const ROLE_TTL_MS = 24 * 60 * 60 * 1000;
+const ROLE_REVALIDATE_AFTER_MS = 5 * 60 * 1000;
+
+const roleCache = createSwrCache<boolean>('admin-role', { ttlMs: ROLE_TTL_MS, maxEntries: 8 });
+roleCache.hydrate();
+
+let state: AuthState = { ready: false, userId: null, email: null, isAdmin: false };
+const listeners = new Set<() => void>();
+let started = false;
+
+const setState = (patch: Partial<AuthState>) => {
+    const next = { ...state, ...patch };
+    if (
+        next.ready === state.ready &&
+        next.userId === state.userId &&
+        next.email === state.email &&
+        next.isAdmin === state.isAdmin
+    ) {
+        return;
+    }
+    state = next;
+    listeners.forEach((listener) => listener());
+};
+
+// Concurrent checks for one user share a single query (see dataAccess).
+const fetchRole = async (userId: string) => {
+    const data = await runQuery('admins.role', userId, (signal) =>
+        supabase.from('admins').select('user_id').eq('user_id', userId).abortSignal(signal).maybeSingle()
+    );
+    return !!data;
+};
+
+const resolveRole = async (userId: string, fresh: boolean) => {
+    if (!fresh) {
+        await roleCache.hydrate();
+        const cached = roleCache.get(userId);
+        if (cached && state.userId === userId) setState({ ready: true, isAdmin: cached.value });
+        if (cached && Date.now() - cached.storedAt < ROLE_REVALIDATE_AFTER_MS) return;
+    }
+    try {
+        const isAdmin = await fetchRole(userId);
+        roleCache.set(userId, isAdmin);
+        if (state.userId === userId) setState({ ready: true, isAdmin });
+    } catch (error) {
+        console.error('Failed to check admin', error);
+        if (state.userId === userId && !state.ready) setState({ ready: true, isAdmin: false });
+    }
+};
+
+const applySession = (event: AuthChangeEvent, session: Session | null) => {
+    const user = session?.user ?? null;
+    if (event === 'SIGNED_OUT' && state.userId) roleCache.remove(state.userId);
+    if (!user) {
+        setState({ ready: true, userId: null, email: null, isAdmin: false });
+        return;
+    }
+    if (user.id === state.userId && state.ready) {
+        // Token refreshes and tab refocus (which Supabase reports as
+        // SIGNED_IN) keep the snapshot; a sign-in still re-checks the role.
+        setState({ email: user.email ?? null });
+        if (event === 'SIGNED_IN') resolveRole(user.id, true);
+        return;
+    }
+    if (event === 'SIGNED_IN') roleCache.remove(user.id);
+    const cached = roleCache.get(user.id);
+    setState({ ready: !!cached, userId: user.id, email: user.email ?? null, isAdmin: cached?.value ?? false });
+    resolveRole(user.id, event === 'SIGNED_IN');
+};
+
+// INITIAL_SESSION stands in for getSession(), so the session is read once.
+const start = () => {
+    if (started) return;
+    started = true;
+    supabase.auth.onAuthStateChange((event, session) => {
+        // Supabase calls made inside this callback can deadlock on its auth
+        // lock; run them after it returns.
+        setTimeout(() => applySession(event, session), 0);
+    });
+};
+
+export const subscribeAuth = (listener: () => void) => {
+    start();
+    listeners.add(listener);
+    return () => {
+        listeners.delete(listener);
+    };
+};
+
+export const getAuthSnapshot = () => state;
@@ -0,0 +1,116 @@
+// Read path between the app's data functions and the Supabase client.
+//
+// - Identical reads in flight at the same time share one request (StrictMode
+//   double effects, a board reopened before its first load finished).
+// - Reads on a channel supersede each other: starting one aborts the
+//   previous, whose callers get a QueryAbortedError instead of a response
+//   that would land after, and overwrite, the newer one.
+// - Every request is timed, per label, in getQueryStats() and as a
+//   `query <label>` performance measure (DevTools > Performance).
+//
+// Writes go to the client directly: two identical inserts are two inserts.
+
+export interface QueryStats {
+    label: string;
+    requests: number; // sent to the server
+    coalesced: number; // answered by a request already in flight
+    aborted: number;
+    failed: number;
+    lastMs: number;
+    totalMs: number;
+}
+
+interface QueryOptions {
+    // Requests on the same channel supersede each other.
+    channel?: string;
+}
+
+interface InFlight {
+    promise: Promise<unknown>;
+    controller: AbortController;
+}
+
+export class QueryAbortedError extends Error {
+    constructor(label: string) {
+        super(`Query ${label} was superseded`);
+        this.name = 'AbortError';
+    }
+}
+
+export const isAbortError = (error: unknown) => error instanceof QueryAbortedError;
+
+const inFlight = new Map<string, InFlight>();
+const latestByChannel = new Map<string, string>();
+const stats = new Map<string, QueryStats>();
+
+const statsFor = (label: string) => {
+    let entry = stats.get(label);
+    if (!entry) {
+        entry = { label, requests: 0, coalesced: 0, aborted: 0, failed: 0, lastMs: 0, totalMs: 0 };
+        stats.set(label, entry);
+    }
+    return entry;
+};
+
+const abort = (key: string) => {
+    const request = inFlight.get(key);
+    if (!request) return;
+    // Forget it now so an identical read issued later starts afresh.
+    inFlight.delete(key);
+    request.controller.abort();
+};
+
+/**
+ * Runs `run` unless an identical read (`label` and `params`) is in flight,
+ * and resolves to its `data`, or throws its `error`. `run` gets the signal
+ * to pass to the builder's `.abortSignal()`.
+ */
+export const runQuery = <T>(
+    label: string,
+    params: unknown,
+    run: (signal: AbortSignal) => PromiseLike<{ data: T | null; error: unknown }>,
+    { channel }: QueryOptions = {}
+): Promise<T | null> => {
+    const key = `${label}:${JSON.stringify(params ?? null)}`;
+    const stat = statsFor(label);
+    if (channel) {
+        const previous = latestByChannel.get(channel);
+        if (previous !== undefined && previous !== key) abort(previous);
+        latestByChannel.set(channel, key);
+    }
+    const existing = inFlight.get(key);
+    if (existing) {
+        stat.coalesced++;
+        return existing.promise as Promise<T | null>;
+    }
+
+    const controller = new AbortController();
+    const started = performance.now();
+    stat.requests++;
+    const promise = (async () => {
+        try {
+            const { data, error } = await run(controller.signal);
+            if (controller.signal.aborted) throw new QueryAbortedError(label);
+            if (error) throw error;
+            return data;
+        } catch (error) {
+            if (controller.signal.aborted) {
+                stat.aborted++;
+                throw error instanceof QueryAbortedError ? error : new QueryAbortedError(label);
+            }
+            stat.failed++;
+            throw error;
+        } finally {
+            const end = performance.now();
+            stat.lastMs = end - started;
+            stat.totalMs += stat.lastMs;
+            performance.measure?.(`query ${label}`, { start: started, end });
+            if (inFlight.get(key)?.controller === controller) inFlight.delete(key);
+            if (channel && latestByChannel.get(channel) === key && !inFlight.has(key)) latestByChannel.delete(channel);
+        }
+    })();
+    inFlight.set(key, { promise, controller });
+    return promise;
+};
+
+export const getQueryStats = (): QueryStats[] => [...stats.values()].map((entry) => ({ ...entry }));
@@ -0,0 +1,158 @@
+import { supabase } from './supabase';
+import { runQuery } from './dataAccess';
+
+// Interfaces for Type Safety (Supabase Schema Match)
+export interface Inquiry {
+    id: string;
+    title: string;
+    content: string;
+    author: string;
+    is_secret: boolean;
+    created_at: string; // ISO String from Supabase
+    status: 'pending' | 'answered';
+    reply: string | null;
+}
+
+// Keyset position of the last row on a page: (created_at, id) is unique and
+// matches the list order, so the next page never skips or repeats rows.
+export interface InquiryCursor {
+    created_at: string;
+    id: string;
+}
+
+// The list only renders these; content, reply and password are fetched per
+// inquiry when a detail is opened.
+export const INQUIRY_LIST_COLUMNS = 'id,title,author,created_at,status,is_secret';
+
+export type InquirySummary = Pick<Inquiry, 'id' | 'title' | 'author' | 'created_at' | 'status' | 'is_secret'>;
+
+export type NewInquiry = Pick<Inquiry, 'title' | 'content' | 'author' | 'is_secret' | 'status' | 'reply'> & {
+    password: string;
+};
+
+export class InquiryPasswordError extends Error {
+    constructor() {
+        super('Inquiry password does not match');
+        this.name = 'InquiryPasswordError';
+    }
+}
+
+export const toSummary = ({ id, title, author, created_at, status, is_secret }: Inquiry): InquirySummary => ({
+    id, title, author, created_at, status, is_secret,
+});
+
+export interface InquiryPage {
+    rows: InquirySummary[];
+    nextCursor: InquiryCursor | null;
+}
+
+// A full page means there may be more: continue after its last row.
+const toPage = (rows: InquirySummary[], pageSize: number): InquiryPage => {
+    const last = rows[rows.length - 1];
+    return {
+        rows,
+        nextCursor: rows.length === pageSize && last ? { created_at: last.created_at, id: last.id } : null,
+    };
+};
+
+export const INQUIRY_PAGE_SIZE = Number(import.meta.env.VITE_INQUIRY_PAGE_SIZE) || 20;
+
+// Reloads and further pages share a channel, so a reload drops a page
+// request still in flight instead of appending it to the new list.
+export const fetchInquiryPage = async (
+    cursor: InquiryCursor | null,
+    pageSize: number = INQUIRY_PAGE_SIZE
+): Promise<InquiryPage> => {
+    const data = await runQuery('inquiries.page', { cursor, pageSize }, (signal) => {
+        let query = supabase.from('inquiries').select(INQUIRY_LIST_COLUMNS);
+        if (cursor) {
+            // Timestamps contain '.' and ':', which PostgREST only accepts quoted.
+            query = query.or(
+                `created_at.lt."${cursor.created_at}",and(created_at.eq."${cursor.created_at}",id.lt."${cursor.id}")`
+            );
+        }
+        return query
+            .order('created_at', { ascending: false })
+            .order('id', { ascending: false })
+            .limit(pageSize)
+            .abortSignal(signal);
+    }, { channel: 'inquiry-list' });
+    return toPage((data ?? []) as InquirySummary[], pageSize);
+};
+
+// Filters of the admin search; empty ones do not filter. Dates are
+// 'YYYY-MM-DD' UTC days, both inclusive.
+export interface InquirySearch {
+    query: string;
+    status: Inquiry['status'] | null;
+    from: string | null;
+    to: string | null;
+}
+
+// Searches the whole history through the search_inquiries RPC (keyword over
+// title, author, content and reply; see supabase/migrations), in the same
+// keyset order and pages as fetchInquiryPage.
+export const searchInquiryPage = async (
+    search: InquirySearch,
+    cursor: InquiryCursor | null,
+    pageSize: number = INQUIRY_PAGE_SIZE
+): Promise<InquiryPage> => {
+    const params = {
+        p_query: search.query.trim() || null,
+        p_status: search.status,
+        p_from: search.from,
+        p_to: search.to,
+        p_before_created_at: cursor?.created_at ?? null,
+        p_before_id: cursor?.id ?? null,
+        p_limit: pageSize,
+    };
+    const data = await runQuery(
+        'inquiries.search',
+        params,
+        (signal) => supabase.rpc('search_inquiries', params).abortSignal(signal),
+        { channel: 'inquiry-search' }
+    );
+    return toPage((data ?? []) as InquirySummary[], pageSize);
+};
+
+// Passwords never leave the database: these RPCs compare against a bcrypt
+// hash server-side and only then return (or delete) the row. Admins pass
+// without a password. See supabase/migrations.
+export const fetchInquiryDetail = async (id: string, password: string | null = null): Promise<Inquiry | null> => {
+    const params = { p_id: id, p_password: password };
+    const data = await runQuery(
+        'inquiries.detail',
+        params,
+        (signal) => supabase.rpc('get_inquiry', params).abortSignal(signal),
+        { channel: 'inquiry-detail' }
+    );
+    return (data as Inquiry | null) ?? null;
+};
+
+export const deleteInquiry = async (id: string, password: string | null = null): Promise<void> => {
+    const { data, error } = await supabase.rpc('delete_inquiry', { p_id: id, p_password: password });
+    if (error) throw error;
+    if (data !== true) throw new InquiryPasswordError();
+};
+
+// Writes return the stored row's list columns so the caller can patch the
+// client-side list (see inquiryStore) instead of refetching it.
+export const createInquiry = async (fields: NewInquiry): Promise<InquirySummary> => {
+    const { data, error } = await supabase.from('inquiries').insert([fields]).select(INQUIRY_LIST_COLUMNS).single();
+    if (error) throw error;
+    return data as InquirySummary;
+};
+
+export const updateInquiry = async (
+    id: string,
+    patch: Partial<Pick<Inquiry, 'reply' | 'status'>>
+): Promise<InquirySummary> => {
+    const { data, error } = await supabase
+        .from('inquiries')
+        .update(patch)
+        .eq('id', id)
+        .select(INQUIRY_LIST_COLUMNS)
+        .single();
+    if (error) throw error;
+    return data as InquirySummary;
+};
@@ -0,0 +1,46 @@
+// InquiryBoard and everything only it uses (the Supabase client, the
+// inquiry store, search) build into their own chunk, which the landing page
+// fetches on demand. All callers share one request, so prefetching and then
+// rendering downloads it once.
+
+type InquiryBoardModule = typeof import('../components/InquiryBoard');
+
+interface NavigatorWithConnection extends Navigator {
+    connection?: { saveData?: boolean };
+}
+
+// Idle prefetch waits at most this long for an idle period.
+const IDLE_TIMEOUT_MS = 5000;
+// Where requestIdleCallback is missing (Safari).
+const IDLE_FALLBACK_MS = 2000;
+
+let chunk: Promise<InquiryBoardModule> | null = null;
+
+export const loadInquiryBoard = () => {
+    if (!chunk) {
+        chunk = import('../components/InquiryBoard');
+        // Let a failed download (offline, new deploy) be retried.
+        chunk.catch(() => {
+            chunk = null;
+        });
+    }
+    return chunk;
+};
+
+export const prefetchInquiryBoard = () => {
+    loadInquiryBoard().catch(() => {});
+};
+
+/**
+ * Prefetches the board once the browser is idle, unless the visitor asked
+ * to save data. Returns a cancel function.
+ */
+export const prefetchInquiryBoardWhenIdle = () => {
+    if ((navigator as NavigatorWithConnection).connection?.saveData) return () => {};
+    if ('requestIdleCallback' in window) {
+        const handle = requestIdleCallback(prefetchInquiryBoard, { timeout: IDLE_TIMEOUT_MS });
+        return () => cancelIdleCallback(handle);
+    }
+    const timer = setTimeout(prefetchInquiryBoard, IDLE_FALLBACK_MS);
+    return () => clearTimeout(timer);
+};
@@ -0,0 +1,125 @@
+import { supabase } from './supabase';
+import { runQuery } from './dataAccess';
+import type { InquirySummary } from './inquiries';
+import { removeInquiry, upsertInquiry } from './inquiryStore';
+
+// Row of public.inquiry_events (see supabase/migrations).
+interface InquiryEvent {
+    id: number;
+    op: 'insert' | 'update' | 'delete';
+    inquiry_id: string;
+    row: InquirySummary | null;
+}
+
+// Replaying more than this after a reconnect costs more than reloading.
+const CATCH_UP_LIMIT = 500;
+// Event ids come from an identity column: they are taken at insert time but
+// become visible at commit, so a lower id can show up after a higher one.
+// A catch-up therefore rereads this many ids below the newest one applied,
+// and events are deduplicated by id rather than by position.
+const CATCH_UP_LOOKBACK = 100;
+// Ids remembered for deduplication, counting down from the newest applied.
+// Events older than that are taken to have been applied already.
+const APPLIED_WINDOW = 1000;
+
+// Newest event applied to the inquiry store, and the ids applied near it.
+// Module-level so a board that is closed and reopened resumes where the
+// previous one stopped.
+let lastEventId: number | null = null;
+const applied = new Set<number>();
+let catchingUp = false;
+let held: InquiryEvent[] = [];
+
+const applyEvent = (event: InquiryEvent) => {
+    if (applied.has(event.id)) return;
+    if (lastEventId !== null && event.id <= lastEventId - APPLIED_WINDOW) return;
+    applied.add(event.id);
+    if (lastEventId === null || event.id > lastEventId) lastEventId = event.id;
+    const floor = lastEventId - APPLIED_WINDOW;
+    for (const id of applied) {
+        if (id <= floor) applied.delete(id);
+    }
+    if (event.op === 'delete') removeInquiry(event.inquiry_id);
+    else if (event.row) upsertInquiry(event.row);
+};
+
+const receiveEvent = (event: InquiryEvent) => {
+    // Live events that overtake the catch-up query wait for it, so replayed
+    // and live events are applied in id order.
+    if (catchingUp) held.push(event);
+    else applyEvent(event);
+};
+
+// Applies the events missed while disconnected. Resolves to false when they
+// cannot all be replayed and the list has to be reloaded instead.
+const catchUp = async (): Promise<boolean> => {
+    if (lastEventId === null) {
+        const data = await runQuery('inquiry_events.head', null, (signal) =>
+            supabase.from('inquiry_events').select('id').order('id', { ascending: false }).limit(1).abortSignal(signal)
+        );
+        lastEventId = data?.[0]?.id ?? 0;
+        return false; // no position yet: load the list as of this event
+    }
+
+    const after = Math.max(0, lastEventId - CATCH_UP_LOOKBACK);
+    const [data, pruned] = await Promise.all([
+        runQuery('inquiry_events.since', after, (signal) =>
+            supabase
+                .from('inquiry_events')
+                .select('*')
+                .gt('id', after)
+                .order('id', { ascending: true })
+                .limit(CATCH_UP_LIMIT)
+                .abortSignal(signal)
+        ),
+        // Ids up to through_id may have been deleted by prune_inquiry_events().
+        runQuery('inquiry_events_pruned', null, (signal) =>
+            supabase.from('inquiry_events_pruned').select('through_id').abortSignal(signal).maybeSingle()
+        ),
+    ]);
+    const events = (data ?? []) as InquiryEvent[];
+    // Gaps in the ids are normal (rolled-back inserts, identity caching);
+    // only pruning past our position or too long a backlog means loss.
+    if ((pruned?.through_id ?? 0) > after || events.length === CATCH_UP_LIMIT) {
+        if (events.length > 0) lastEventId = Math.max(lastEventId, events[events.length - 1].id);
+        return false;
+    }
+    events.forEach(applyEvent);
+    return true;
+};
+
+const resume = async (reload: () => void) => {
+    catchingUp = true;
+    try {
+        if (!await catchUp()) reload();
+    } catch (error) {
+        console.error('Failed to resume inquiry feed', error);
+        reload();
+    } finally {
+        catchingUp = false;
+        const pending = held.sort((a, b) => a.id - b.id);
+        held = [];
+        pending.forEach(applyEvent);
+    }
+};
+
+/**
+ * Keeps the inquiry store in sync with inserts, updates and deletes made by
+ * anyone. Every (re)subscription first replays what was missed; `reload`
+ * runs when that is not possible. Returns the unsubscribe function.
+ */
+export const startInquiryFeed = (reload: () => void) => {
+    const channel = supabase
+        .channel('inquiry-events')
+        .on(
+            'postgres_changes',
+            { event: 'INSERT', schema: 'public', table: 'inquiry_events' },
+            (payload) => receiveEvent(payload.new as InquiryEvent)
+        )
+        .subscribe((status) => {
+            if (status === 'SUBSCRIBED') resume(reload);
+        });
+    return () => {
+        supabase.removeChannel(channel);
+    };
+};
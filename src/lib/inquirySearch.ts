@@ -0,0 +1,85 @@
+import type { InquirySummary } from './inquiries';
+import { getInquiriesSnapshot, subscribeInquiries, type InquiryListState } from './inquiryStore';
+import type { SearchDocument } from './searchIndex';
+import type { SearchWorkerRequest, SearchWorkerResponse } from '../workers/inquirySearch.worker';
+
+// Keeps the search worker's index in step with the inquiry store. The index
+// covers the rows loaded on this client (title and author; content is only
+// fetched per inquiry), and secret rows only when the viewer is an admin:
+// a hit on a secret title would reveal the title the list hides.
+export const SEARCH_RESULT_LIMIT = 50;
+
+let worker: Worker | null = null;
+let includeSecret = false;
+let indexed: InquiryListState['byId'] = {};
+let nextRequestId = 1;
+const pending = new Map<number, (response: SearchWorkerResponse) => void>();
+
+const send = (message: SearchWorkerRequest) => worker!.postMessage(message);
+
+const isSearchable = (row: InquirySummary) => includeSecret || !row.is_secret;
+
+const toDocument = ({ id, title, author, created_at }: InquirySummary): SearchDocument => ({
+    id,
+    title,
+    author,
+    created_at,
+});
+
+const reset = () => {
+    indexed = getInquiriesSnapshot().byId;
+    send({ type: 'reset', docs: Object.values(indexed).filter(isSearchable).map(toDocument) });
+};
+
+// Store updates replace only the rows they touch, so comparing references
+// finds the changes without looking at every field.
+const sync = () => {
+    const { byId } = getInquiriesSnapshot();
+    if (byId === indexed) return;
+    const upserts: SearchDocument[] = [];
+    const removals: string[] = [];
+    for (const id in byId) {
+        const row = byId[id];
+        if (row === indexed[id]) continue;
+        if (isSearchable(row)) upserts.push(toDocument(row));
+        else if (id in indexed) removals.push(id);
+    }
+    for (const id in indexed) {
+        if (!(id in byId)) removals.push(id);
+    }
+    indexed = byId;
+    if (removals.length) send({ type: 'remove', ids: removals });
+    if (upserts.length) send({ type: 'upsert', docs: upserts });
+};
+
+const ensureWorker = () => {
+    if (worker) return;
+    worker = new Worker(new URL('../workers/inquirySearch.worker.ts', import.meta.url), { type: 'module' });
+    worker.onmessage = (event: MessageEvent<SearchWorkerResponse>) => {
+        const resolve = pending.get(event.data.requestId);
+        pending.delete(event.data.requestId);
+        resolve?.(event.data);
+    };
+    subscribeInquiries(sync);
+    reset();
+};
+
+/**
+ * Starts the index on first use and re-indexes when the viewer gains or
+ * loses access to secret inquiries.
+ */
+export const setSearchScope = (isAdmin: boolean) => {
+    if (worker && includeSecret === isAdmin) return;
+    includeSecret = isAdmin;
+    if (worker) reset();
+    else ensureWorker();
+};
+
+export const searchInquiries = (query: string, limit = SEARCH_RESULT_LIMIT): Promise<SearchWorkerResponse> => {
+    ensureWorker();
+    const requestId = nextRequestId++;
+    return new Promise((resolve) => {
+        pending.set(requestId, resolve);
+        send({ type: 'search', requestId, query, limit });
+    });
+};
@@ -0,0 +1,164 @@
+import type { InquiryCursor, InquiryPage, InquirySummary } from './inquiries';
+import { createSwrCache } from './swrCache';
+
+// Normalized client-side copy of the inquiry list, shared by every mounted
+// board through useInquiryList. Writes patch single rows here instead of
+// refetching the list; only an explicit refresh replaces it wholesale.
+//
+// The list outlives the board and is persisted through an SWR cache, so a
+// reopened board (or a reloaded page) paints the last known list at once
+// and revalidates behind it.
+export interface InquiryListState {
+    byId: Record<string, InquirySummary>;
+    ids: string[]; // newest first, the server's (created_at, id) order
+    nextCursor: InquiryCursor | null;
+    loadedAt: number; // when the first page was last fetched; 0 = never
+}
+
+// Opening the board within this long of the last fetch skips revalidation;
+// the change feed covers the gap.
+const REVALIDATE_AFTER_MS = 30_000;
+const CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+// Only the newest rows are persisted; the rest is paged in again on scroll.
+const CACHE_MAX_ROWS = 200;
+const CACHE_PERSIST_DELAY_MS = 1000;
+const LIST_KEY = 'list';
+
+const listCache = createSwrCache<InquiryListState>('inquiries', { ttlMs: CACHE_TTL_MS, maxEntries: 8 });
+listCache.hydrate();
+
+let state: InquiryListState = { byId: {}, ids: [], nextCursor: null, loadedAt: 0 };
+const listeners = new Set<() => void>();
+let persistTimer: ReturnType<typeof setTimeout> | null = null;
+
+const persist = () => {
+    persistTimer = null;
+    if (!state.loadedAt) return;
+    if (state.ids.length <= CACHE_MAX_ROWS) {
+        listCache.set(LIST_KEY, state);
+        return;
+    }
+    const ids = state.ids.slice(0, CACHE_MAX_ROWS);
+    const last = state.byId[ids[ids.length - 1]];
+    listCache.set(LIST_KEY, {
+        byId: Object.fromEntries(ids.map((id) => [id, state.byId[id]])),
+        ids,
+        nextCursor: { created_at: last.created_at, id: last.id },
+        loadedAt: state.loadedAt,
+    });
+};
+
+const setState = (next: InquiryListState) => {
+    state = next;
+    listeners.forEach((listener) => listener());
+    persistTimer ??= setTimeout(persist, CACHE_PERSIST_DELAY_MS);
+};
+
+export const subscribeInquiries = (listener: () => void) => {
+    listeners.add(listener);
+    return () => {
+        listeners.delete(listener);
+    };
+};
+
+export const getInquiriesSnapshot = () => state;
+
+export const isInquiryListStale = () => Date.now() - state.loadedAt > REVALIDATE_AFTER_MS;
+
+/**
+ * Fills the store from the cache when it is empty. Resolves to whether there
+ * is a list to show, i.e. the board can skip its spinner.
+ */
+export const restoreInquiryList = async (): Promise<boolean> => {
+    if (state.loadedAt) return true;
+    await listCache.hydrate();
+    const entry = listCache.get(LIST_KEY);
+    if (entry && !state.loadedAt) setState(entry.value);
+    return state.loadedAt > 0;
+};
+
+const isNewer = (a: InquirySummary, b: InquirySummary) =>
+    a.created_at === b.created_at ? a.id > b.id : a.created_at > b.created_at;
+
+// Index of the first loaded row that `row` sorts before.
+const insertionPoint = (row: InquirySummary) => {
+    let low = 0;
+    let high = state.ids.length;
+    while (low < high) {
+        const mid = (low + high) >> 1;
+        if (isNewer(row, state.byId[state.ids[mid]])) high = mid;
+        else low = mid + 1;
+    }
+    return low;
+};
+
+export const replaceInquiryPage = (page: InquiryPage) => {
+    setState({
+        byId: Object.fromEntries(page.rows.map((row) => [row.id, row])),
+        ids: page.rows.map((row) => row.id),
+        nextCursor: page.nextCursor,
+        loadedAt: Date.now(),
+    });
+};
+
+export const appendInquiryPage = (page: InquiryPage) => {
+    const byId = { ...state.byId };
+    const ids = [...state.ids];
+    for (const row of page.rows) {
+        if (!(row.id in byId)) ids.push(row.id);
+        byId[row.id] = row;
+    }
+    setState({ ...state, byId, ids, nextCursor: page.nextCursor });
+};
+
+export const upsertInquiry = (row: InquirySummary) => {
+    if (row.id in state.byId) {
+        setState({ ...state, byId: { ...state.byId, [row.id]: row } });
+        return;
+    }
+    const index = insertionPoint(row);
+    // Older than everything loaded while more pages remain: it belongs to a
+    // page that has not been fetched yet and will arrive with it.
+    if (index === state.ids.length && state.nextCursor) return;
+    const ids = [...state.ids];
+    ids.splice(index, 0, row.id);
+    setState({ ...state, byId: { ...state.byId, [row.id]: row }, ids });
+};
+
+export const removeInquiry = (id: string) => {
+    if (!(id in state.byId)) return;
+    const byId = { ...state.byId };
+    delete byId[id];
+    setState({ ...state, byId, ids: state.ids.filter((other) => other !== id) });
+};
+
+// Puts a row back at the index it had, bypassing upsertInquiry's check for
+// rows that belong to an unfetched page: the row was loaded, so it stays.
+const restoreInquiry = (row: InquirySummary, index: number) => {
+    const ids = state.ids.filter((other) => other !== row.id);
+    ids.splice(Math.min(Math.max(index, 0), ids.length), 0, row.id);
+    setState({ ...state, byId: { ...state.byId, [row.id]: row }, ids });
+};
+
+/**
+ * Shows `optimistic` (or the row's removal when null) immediately, then runs
+ * `request`. If the request fails the row is put back the way it was and the
+ * error is rethrown.
+ */
+export const mutateInquiry = async <T>(
+    id: string,
+    optimistic: InquirySummary | null,
+    request: () => Promise<T>
+): Promise<T> => {
+    const previous = state.byId[id] ?? null;
+    const previousIndex = state.ids.indexOf(id);
+    if (optimistic) upsertInquiry(optimistic);
+    else removeInquiry(id);
+    try {
+        return await request();
+    } catch (error) {
+        if (previous) restoreInquiry(previous, previousIndex);
+        else removeInquiry(id);
+        throw error;
+    }
+};
@@ -0,0 +1,80 @@
+// Modals requested while one is open wait their turn instead of replacing
+// it, so every showAlert / showConfirm / showPrompt promise settles exactly
+// once. Confirms and prompts (a handler is awaiting a decision) go ahead of
+// queued alerts; within each kind the order is first in, first out. The
+// backlog is bounded: past `limit` waiting modals the oldest alert is
+// dismissed to make room, or, with no alert to drop, the new request is
+// dismissed at once. Dismissing settles with what cancelling would give.
+
+export type ModalType = 'alert' | 'confirm' | 'prompt';
+
+export interface QueuedModal {
+    type: ModalType;
+    resolve: (value: any) => void;
+}
+
+export const DEFAULT_MODAL_BACKLOG = 20;
+
+// The result of closing a modal without answering it.
+export const dismissalOf = (type: ModalType) => (type === 'confirm' ? false : type === 'prompt' ? null : undefined);
+
+export const createModalQueue = <T extends QueuedModal>(
+    onChange: (current: T | null) => void,
+    limit = DEFAULT_MODAL_BACKLOG
+) => {
+    let current: T | null = null;
+    let closed = false;
+    const decisions: T[] = []; // confirm and prompt
+    const alerts: T[] = [];
+
+    const dismiss = (modal: T) => modal.resolve(dismissalOf(modal.type));
+
+    const push = (modal: T) => {
+        if (closed) {
+            dismiss(modal);
+            return;
+        }
+        if (!current) {
+            current = modal;
+            onChange(current);
+            return;
+        }
+        if (decisions.length + alerts.length >= limit) {
+            const dropped = alerts.shift();
+            if (!dropped) {
+                dismiss(modal);
+                return;
+            }
+            dismiss(dropped);
+        }
+        (modal.type === 'alert' ? alerts : decisions).push(modal);
+    };
+
+    // Settles the open modal with `result` and shows the next one.
+    const settle = (result: unknown) => {
+        const settled = current;
+        if (!settled) return;
+        current = decisions.shift() ?? alerts.shift() ?? null;
+        onChange(current);
+        settled.resolve(result);
+    };
+
+    // Dismisses everything, open and waiting; later requests are dismissed
+    // as they arrive. For when the provider unmounts.
+    const close = () => {
+        closed = true;
+        const pending = [...(current ? [current] : []), ...decisions, ...alerts];
+        current = null;
+        decisions.length = 0;
+        alerts.length = 0;
+        pending.forEach(dismiss);
+    };
+
+    // Accepts requests again after close(), for a provider that remounts
+    // (StrictMode runs effects, cleanups and effects again).
+    const reopen = () => {
+        closed = false;
+    };
+
+    return { push, settle, close, reopen, pending: () => decisions.length + alerts.length };
+};
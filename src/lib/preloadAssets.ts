@@ -0,0 +1,87 @@
+// What IntroOverlay waits for before raising the curtain: the images the
+// landing page shows and its web fonts. The inquiry board chunk is not one
+// of them; it is prefetched once the intro is gone (see inquiryBoardChunk).
+// Every task settles, successfully or not, within its timeout, so a slow or
+// missing asset only costs the timeout and never holds the page back.
+
+export type PreloadTask = () => Promise<unknown>;
+
+// Images rendered above the fold. The hero and guide are drawn with icons
+// today; add an entry here when they get screenshots or artwork.
+export const LANDING_IMAGES: string[] = [];
+
+const TASK_TIMEOUT_MS = 4000;
+// Set once a visit has preloaded everything; its caches are then warm.
+const PRELOADED_KEY = 'intro-preloaded';
+
+// Resolves to whether the task finished successfully in time; false when it
+// failed or timed out.
+const withTimeout = (task: PreloadTask, ms: number) =>
+    new Promise<boolean>((resolve) => {
+        const timer = setTimeout(() => resolve(false), ms);
+        task().then(
+            () => {
+                clearTimeout(timer);
+                resolve(true);
+            },
+            () => {
+                clearTimeout(timer);
+                resolve(false);
+            },
+        );
+    });
+
+export const preloadImage = (url: string): PreloadTask => () => {
+    const image = new Image();
+    image.src = url;
+    // decode() also waits for the bytes, and leaves nothing to decode on
+    // first paint.
+    return image.decode();
+};
+
+// Fonts the stylesheet references finish loading (or fail) before this
+// resolves; with only system fonts it resolves at once.
+export const fontsReady: PreloadTask = () => ('fonts' in document ? document.fonts.ready : Promise.resolve());
+
+export const landingPreloadTasks = (): PreloadTask[] => [...LANDING_IMAGES.map(preloadImage), fontsReady];
+
+/**
+ * Runs every task at once and reports the fraction settled (0 to 1) after
+ * each one. Resolves when all have settled or timed out, and marks the
+ * visit as preloaded only if every task finished.
+ */
+export const preloadAssets = async (
+    tasks: PreloadTask[],
+    onProgress: (fraction: number) => void,
+    timeoutMs = TASK_TIMEOUT_MS,
+) => {
+    if (tasks.length === 0) {
+        onProgress(1);
+        return;
+    }
+    let settled = 0;
+    const finished = await Promise.all(
+        tasks.map((task) =>
+            withTimeout(task, timeoutMs).then((ok) => {
+                settled++;
+                onProgress(settled / tasks.length);
+                return ok;
+            }),
+        ),
+    );
+    // A visit where something failed or timed out did not warm the caches.
+    if (!finished.every(Boolean)) return;
+    try {
+        localStorage.setItem(PRELOADED_KEY, '1');
+    } catch {
+        // Storage disabled; the next visit just shows the minimum again.
+    }
+};
+
+export const hasPreloadedBefore = () => {
+    try {
+        return localStorage.getItem(PRELOADED_KEY) === '1';
+    } catch {
+        return false;
+    }
+};
@@ -0,0 +1,93 @@
+// Update offers for visitors who already have the app. The download service
+// (testsprite_tests/harness/downloads.py, GET /updates) answers with the
+// chain of binary patches from their version to the latest build, made by
+// `python -m harness.releases build`.
+//
+// The installed build is known when the desktop app links here with
+// `?installed=1.2.3&installer=<stem>`, or did so on an earlier visit from
+// this browser. A download alone says nothing: it may never be installed.
+// The version on offer is the manifest's latest, as /updates reports it, or
+// CURRENT_VERSION where no download service is configured.
+
+import { runQuery } from './dataAccess';
+
+// Shown until /updates answers, and for good when VITE_DOWNLOAD_BASE is unset.
+export const CURRENT_VERSION = import.meta.env.VITE_APP_VERSION || '1.0.0';
+// The build the landing page links; the app reports its own when it differs.
+export const DEFAULT_INSTALLER_STEM = 'PDF_Converter_Pro_Installer_x64';
+
+export interface ReleaseFile {
+    file: string;
+    size: number;
+    sha256: string;
+}
+
+export interface ReleasePatch extends ReleaseFile {
+    from: string;
+    to: string;
+}
+
+export interface InstalledBuild {
+    version: string;
+    stem: string;
+}
+
+export interface UpdatePlan {
+    latest: string;
+    stem: string;
+    installed: string | null;
+    full: ReleaseFile & { version: string };
+    patches: ReleasePatch[]; // apply in order; empty when the full installer is the better download
+    patch_bytes: number;
+}
+
+// The download service (GET /updates) only exists where this is set.
+const DOWNLOAD_BASE: string = import.meta.env.VITE_DOWNLOAD_BASE ?? '';
+const INSTALLED_KEY = 'installed-version';
+const INSTALLED_STEM_KEY = 'installed-stem';
+const VERSION = /^\d+(\.\d+)+$/;
+const STEM = /^[\w.-]+$/;
+
+const rememberInstalledBuild = ({ version, stem }: InstalledBuild) => {
+    try {
+        localStorage.setItem(INSTALLED_KEY, version);
+        localStorage.setItem(INSTALLED_STEM_KEY, stem);
+    } catch {
+        // Storage disabled; the offer just will not show next time.
+    }
+};
+
+const validStem = (stem: string | null) => (stem && STEM.test(stem) ? stem : DEFAULT_INSTALLER_STEM);
+
+export const getInstalledBuild = (): InstalledBuild | null => {
+    const params = new URLSearchParams(window.location.search);
+    const linked = params.get('installed');
+    if (linked && VERSION.test(linked)) {
+        const build = { version: linked, stem: validStem(params.get('installer')) };
+        rememberInstalledBuild(build);
+        return build;
+    }
+    try {
+        const stored = localStorage.getItem(INSTALLED_KEY);
+        return stored && VERSION.test(stored)
+            ? { version: stored, stem: validStem(localStorage.getItem(INSTALLED_STEM_KEY)) }
+            : null;
+    } catch {
+        return null;
+    }
+};
+
+export const releaseUrl = (file: string) => `${DOWNLOAD_BASE}/${encodeURIComponent(file)}`;
+
+// Without an installed build the plan still names the latest build of the
+// stem the page links. Resolves to null when no download service is set up.
+export const fetchUpdatePlan = (installed: InstalledBuild | null) => {
+    if (!DOWNLOAD_BASE) return Promise.resolve(null);
+    const query = new URLSearchParams({ stem: installed?.stem ?? DEFAULT_INSTALLER_STEM });
+    if (installed) query.set('from', installed.version);
+    return runQuery('update-plan', query.toString(), async (signal) => {
+        const response = await fetch(`${DOWNLOAD_BASE}/updates?${query}`, { signal });
+        if (!response.ok) return { data: null, error: new Error(`GET /updates failed with ${response.status}`) };
+        return { data: (await response.json()) as UpdatePlan, error: null };
+    });
+};
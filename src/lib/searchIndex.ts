@@ -0,0 +1,230 @@
+// Incremental inverted index for inquiry search, run inside a Web Worker
+// (see workers/inquirySearch.worker.ts).
+//
+// Korean has no reliable word boundaries for substring search ("변환오류"
+// should match "변환"), so text is indexed as character bigrams per word:
+// "변환오류" -> 변환, 환오, 오류. A query matches documents containing every
+// bigram of every query word; hits are ranked by summed tf-idf with title
+// matches weighted above author matches.
+
+export interface SearchDocument {
+    id: string;
+    title: string;
+    author: string;
+    created_at: string;
+}
+
+export interface SearchHit {
+    id: string;
+    score: number;
+    created_at: string;
+}
+
+export interface SearchResult {
+    hits: SearchHit[]; // best first, at most `limit`
+    total: number; // every matching document
+}
+
+const TITLE_WEIGHT = 2;
+const AUTHOR_WEIGHT = 1;
+const INITIAL_POSTING_CAPACITY = 8;
+
+const WORD = /[\p{L}\p{N}]+/gu;
+
+export const tokenize = (text: string): string[] => {
+    const grams: string[] = [];
+    for (const [word] of text.normalize('NFKC').toLowerCase().matchAll(WORD)) {
+        if (word.length === 1) {
+            grams.push(word);
+            continue;
+        }
+        for (let i = 0; i < word.length - 1; i++) grams.push(word.slice(i, i + 2));
+    }
+    return grams;
+};
+
+// Slots of the documents containing one gram, ascending, with the weighted
+// term frequency of each. Removed documents stay in place until compaction
+// and are skipped through `alive`.
+interface Posting {
+    slots: Int32Array;
+    tfs: Float32Array;
+    length: number;
+    live: number; // document frequency, excluding removed slots
+}
+
+const appendPosting = (posting: Posting, slot: number, tf: number) => {
+    if (posting.length === posting.slots.length) {
+        const slots = new Int32Array(posting.length * 2);
+        const tfs = new Float32Array(posting.length * 2);
+        slots.set(posting.slots);
+        tfs.set(posting.tfs);
+        posting.slots = slots;
+        posting.tfs = tfs;
+    }
+    posting.slots[posting.length] = slot;
+    posting.tfs[posting.length] = tf;
+    posting.length++;
+    posting.live++;
+};
+
+// First index at or after `from` whose slot is >= `slot`, galloping ahead
+// so that probing a long posting for a few slots stays logarithmic.
+const seek = (slots: Int32Array, length: number, from: number, slot: number) => {
+    let step = 1;
+    let high = from;
+    while (high < length && slots[high] < slot) {
+        from = high + 1;
+        high += step;
+        step *= 2;
+    }
+    high = Math.min(high, length);
+    while (from < high) {
+        const mid = (from + high) >> 1;
+        if (slots[mid] < slot) from = mid + 1;
+        else high = mid;
+    }
+    return from;
+};
+
+// Higher score first, newer first among equal scores.
+const ranksBefore = (score: number, createdAt: string, other: SearchHit) =>
+    score > other.score || (score === other.score && createdAt > other.created_at);
+
+export const createSearchIndex = () => {
+    // Slots only grow, so appending keeps every posting sorted; updates and
+    // removals leave dead slots that compaction renumbers away.
+    const slotById = new Map<string, number>();
+    let docs: (SearchDocument | undefined)[] = [];
+    let termsBySlot: (Map<string, number> | undefined)[] = []; // gram -> weighted tf
+    let alive = new Uint8Array(1024);
+    const postings = new Map<string, Posting>();
+    let dead = 0;
+
+    const add = (doc: SearchDocument, terms: Map<string, number>) => {
+        const slot = docs.length;
+        if (slot === alive.length) {
+            const grown = new Uint8Array(alive.length * 2);
+            grown.set(alive);
+            alive = grown;
+        }
+        slotById.set(doc.id, slot);
+        docs.push(doc);
+        termsBySlot.push(terms);
+        alive[slot] = 1;
+        for (const [gram, tf] of terms) {
+            let posting = postings.get(gram);
+            if (!posting) {
+                posting = {
+                    slots: new Int32Array(INITIAL_POSTING_CAPACITY),
+                    tfs: new Float32Array(INITIAL_POSTING_CAPACITY),
+                    length: 0,
+                    live: 0,
+                };
+                postings.set(gram, posting);
+            }
+            appendPosting(posting, slot, tf);
+        }
+    };
+
+    const compact = () => {
+        const live: [SearchDocument, Map<string, number>][] = [];
+        for (let slot = 0; slot < docs.length; slot++) {
+            if (alive[slot]) live.push([docs[slot]!, termsBySlot[slot]!]);
+        }
+        slotById.clear();
+        postings.clear();
+        docs = [];
+        termsBySlot = [];
+        alive.fill(0);
+        dead = 0;
+        for (const [doc, terms] of live) add(doc, terms);
+    };
+
+    const remove = (id: string) => {
+        const slot = slotById.get(id);
+        if (slot === undefined) return;
+        for (const gram of termsBySlot[slot]!.keys()) {
+            const posting = postings.get(gram)!;
+            posting.live--;
+        }
+        slotById.delete(id);
+        docs[slot] = undefined;
+        termsBySlot[slot] = undefined;
+        alive[slot] = 0;
+        dead++;
+        if (dead > 1024 && dead > slotById.size) compact();
+    };
+
+    const upsert = (doc: SearchDocument) => {
+        const current = slotById.get(doc.id);
+        if (current !== undefined) {
+            const indexed = docs[current]!;
+            if (indexed.title === doc.title && indexed.author === doc.author) {
+                docs[current] = doc;
+                return;
+            }
+            remove(doc.id);
+        }
+        const terms = new Map<string, number>();
+        for (const gram of tokenize(doc.title)) terms.set(gram, (terms.get(gram) ?? 0) + TITLE_WEIGHT);
+        for (const gram of tokenize(doc.author)) terms.set(gram, (terms.get(gram) ?? 0) + AUTHOR_WEIGHT);
+        add(doc, terms);
+    };
+
+    const clear = () => {
+        slotById.clear();
+        postings.clear();
+        docs = [];
+        termsBySlot = [];
+        alive.fill(0);
+        dead = 0;
+    };
+
+    const search = (query: string, limit: number): SearchResult => {
+        const grams = [...new Set(tokenize(query))];
+        const lists: Posting[] = [];
+        for (const gram of grams) {
+            const posting = postings.get(gram);
+            if (!posting || posting.live === 0) return { hits: [], total: 0 };
+            lists.push(posting);
+        }
+        if (lists.length === 0 || limit < 1) return { hits: [], total: 0 };
+        // Walk the rarest gram's postings and seek forward in the others.
+        lists.sort((a, b) => a.live - b.live);
+        const docCount = slotById.size;
+        const idf = lists.map((posting) => Math.log(1 + docCount / posting.live));
+        const cursors = new Array<number>(lists.length).fill(0);
+        const [rarest] = lists;
+
+        // Keep only the best `limit` hits in order instead of sorting every
+        // match; broad queries can match most of the index.
+        const hits: SearchHit[] = [];
+        let total = 0;
+        candidates: for (let i = 0; i < rarest.length; i++) {
+            const slot = rarest.slots[i];
+            if (!alive[slot]) continue;
+            let score = rarest.tfs[i] * idf[0];
+            for (let list = 1; list < lists.length; list++) {
+                const posting = lists[list];
+                const at = seek(posting.slots, posting.length, cursors[list], slot);
+                cursors[list] = at;
+                if (at === posting.length) break candidates;
+                if (posting.slots[at] !== slot) continue candidates;
+                score += posting.tfs[at] * idf[list];
+            }
+            total++;
+            const doc = docs[slot]!;
+            if (hits.length === limit && !ranksBefore(score, doc.created_at, hits[limit - 1])) continue;
+            let index = hits.length === limit ? limit - 1 : hits.length;
+            while (index > 0 && ranksBefore(score, doc.created_at, hits[index - 1])) {
+                hits[index] = hits[index - 1];
+                index--;
+            }
+            hits[index] = { id: doc.id, score, created_at: doc.created_at };
+        }
+        return { hits, total };
+    };
+
+    return { upsert, remove, clear, search, size: () => slotById.size };
+};
@@ -0,0 +1,125 @@
+// Keyed stale-while-revalidate cache. Entries live in memory for instant
+// reads and are mirrored to IndexedDB so a page reload can paint from them
+// too. Entries older than `ttlMs` are dropped on read; beyond `maxEntries`
+// the least recently used one is evicted.
+
+export interface CacheEntry<T> {
+    key: string;
+    value: T;
+    storedAt: number;
+}
+
+interface SwrCacheOptions {
+    ttlMs: number;
+    maxEntries: number;
+}
+
+const DB_NAME = 'pdf-converter-pro';
+const STORE_NAME = 'swr-cache';
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+// Resolves to null where IndexedDB is unavailable (private mode, old
+// browsers); the cache then works from memory only.
+const openDb = () => {
+    dbPromise ??= new Promise((resolve) => {
+        if (typeof indexedDB === 'undefined') {
+            resolve(null);
+            return;
+        }
+        const request = indexedDB.open(DB_NAME, 1);
+        request.onupgradeneeded = () => {
+            request.result.createObjectStore(STORE_NAME, { keyPath: 'key' });
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => resolve(null);
+        request.onblocked = () => resolve(null);
+    });
+    return dbPromise;
+};
+
+const settle = <T>(request: IDBRequest<T>) =>
+    new Promise<T>((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+
+export const createSwrCache = <T>(namespace: string, { ttlMs, maxEntries }: SwrCacheOptions) => {
+    const entries = new Map<string, CacheEntry<T>>(); // oldest use first
+    const dbKey = (key: string) => `${namespace}:${key}`;
+    const isExpired = (entry: CacheEntry<T>) => Date.now() - entry.storedAt > ttlMs;
+
+    const write = async (key: string, entry: CacheEntry<T> | null) => {
+        const db = await openDb();
+        if (!db) return;
+        try {
+            const store = db.transaction(STORE_NAME, 'readwrite').objectStore(STORE_NAME);
+            if (entry) store.put({ ...entry, key: dbKey(key) });
+            else store.delete(dbKey(key));
+        } catch (error) {
+            console.error('Failed to persist cache entry', error);
+        }
+    };
+
+    const remove = (key: string) => {
+        entries.delete(key);
+        write(key, null);
+    };
+
+    const evict = () => {
+        while (entries.size > maxEntries) {
+            remove(entries.keys().next().value as string);
+        }
+    };
+
+    const get = (key: string): CacheEntry<T> | undefined => {
+        const entry = entries.get(key);
+        if (!entry) return undefined;
+        if (isExpired(entry)) {
+            remove(key);
+            return undefined;
+        }
+        entries.delete(key);
+        entries.set(key, entry);
+        return entry;
+    };
+
+    const set = (key: string, value: T) => {
+        const entry = { key, value, storedAt: Date.now() };
+        entries.delete(key);
+        entries.set(key, entry);
+        write(key, entry);
+        evict();
+    };
+
+    // Loads what earlier page loads persisted. Runs once; entries set in
+    // memory meanwhile win over older persisted ones.
+    let hydration: Promise<void> | null = null;
+    const hydrate = () => {
+        hydration ??= (async () => {
+            const db = await openDb();
+            if (!db) return;
+            const range = IDBKeyRange.bound(`${namespace}:`, `${namespace}:\uffff`);
+            const stored = await settle(db.transaction(STORE_NAME).objectStore(STORE_NAME).getAll(range));
+            const persisted = (stored as CacheEntry<T>[])
+                .map((entry) => ({ ...entry, key: entry.key.slice(namespace.length + 1) }))
+                .sort((a, b) => a.storedAt - b.storedAt);
+            const current = [...entries.values()];
+            entries.clear();
+            for (const entry of [...persisted, ...current]) {
+                if (isExpired(entry)) {
+                    remove(entry.key);
+                    continue;
+                }
+                entries.delete(entry.key);
+                entries.set(entry.key, entry);
+            }
+            evict();
+        })().catch((error) => {
+            console.error('Failed to read cache', error);
+        });
+        return hydration;
+    };
+
+    return { get, set, remove, hydrate };
+};
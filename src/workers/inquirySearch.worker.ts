@@ -0,0 +1,43 @@
+// Owns the inquiry search index so that indexing and ranking never run on
+// the main thread. Driven by lib/inquirySearch.ts.
+import { createSearchIndex, type SearchDocument, type SearchResult } from '../lib/searchIndex';
+
+export type SearchWorkerRequest =
+    | { type: 'reset'; docs: SearchDocument[] }
+    | { type: 'upsert'; docs: SearchDocument[] }
+    | { type: 'remove'; ids: string[] }
+    | { type: 'search'; requestId: number; query: string; limit: number };
+
+export interface SearchWorkerResponse extends SearchResult {
+    requestId: number;
+    tookMs: number;
+}
+
+const index = createSearchIndex();
+
+self.onmessage = (event: MessageEvent<SearchWorkerRequest>) => {
+    const message = event.data;
+    switch (message.type) {
+        case 'reset':
+            index.clear();
+            message.docs.forEach(index.upsert);
+            break;
+        case 'upsert':
+            message.docs.forEach(index.upsert);
+            break;
+        case 'remove':
+            message.ids.forEach(index.remove);
+            break;
+        case 'search': {
+            const started = performance.now();
+            const result = index.search(message.query, message.limit);
+            const response: SearchWorkerResponse = {
+                ...result,
+                requestId: message.requestId,
+                tookMs: performance.now() - started,
+            };
+            self.postMessage(response);
+            break;
+        }
+    }
+};
@@ -0,0 +1,92 @@
+-- Verify secret-inquiry passwords in the database instead of the browser.
+--
+-- Passwords are stored as bcrypt hashes and the client can only read the
+-- list columns.  Content, reply and deletion go through get_inquiry and
+-- delete_inquiry, which check the password (or admin membership) first.
+
+create extension if not exists pgcrypto with schema extensions;
+
+alter table public.inquiries add column if not exists password_hash text;
+
+update public.inquiries
+   set password_hash = extensions.crypt(password, extensions.gen_salt('bf')),
+       password = null
+ where password is not null and password <> '';
+
+-- Inserts keep sending `password`; it is hashed and never stored in clear.
+create or replace function public.hash_inquiry_password()
+returns trigger
+language plpgsql
+set search_path = public, extensions
+as $$
+begin
+    if new.password is not null and new.password <> '' then
+        new.password_hash := crypt(new.password, gen_salt('bf'));
+    end if;
+    new.password := null;
+    return new;
+end;
+$$;
+
+drop trigger if exists inquiries_hash_password on public.inquiries;
+create trigger inquiries_hash_password
+    before insert or update of password on public.inquiries
+    for each row execute function public.hash_inquiry_password();
+
+revoke select on public.inquiries from anon, authenticated;
+grant select (id, title, author, created_at, status, is_secret) on public.inquiries to anon, authenticated;
+
+create or replace function public.is_inquiry_admin()
+returns boolean
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    select exists (select 1 from public.admins where user_id = auth.uid());
+$$;
+
+-- crypt() re-hashes the candidate with the stored salt, so the comparison is
+-- between two bcrypt digests and its timing says nothing about the password.
+create or replace function public.inquiry_password_matches(p_hash text, p_password text)
+returns boolean
+language sql
+immutable
+set search_path = public, extensions
+as $$
+    select p_hash is not null and p_hash = crypt(coalesce(p_password, ''), p_hash);
+$$;
+
+create or replace function public.get_inquiry(p_id uuid, p_password text default null)
+returns jsonb
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    select to_jsonb(i) - 'password' - 'password_hash'
+      from public.inquiries i
+     where i.id = p_id
+       and (not i.is_secret
+            or public.is_inquiry_admin()
+            or public.inquiry_password_matches(i.password_hash, p_password));
+$$;
+
+create or replace function public.delete_inquiry(p_id uuid, p_password text default null)
+returns boolean
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    delete from public.inquiries i
+     where i.id = p_id
+       and (public.is_inquiry_admin()
+            or public.inquiry_password_matches(i.password_hash, p_password));
+    return found;
+end;
+$$;
+
+revoke execute on function public.inquiry_password_matches(text, text) from public;
+grant execute on function public.get_inquiry(uuid, text) to anon, authenticated;
+grant execute on function public.delete_inquiry(uuid, text) to anon, authenticated;
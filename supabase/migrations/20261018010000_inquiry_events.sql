@@ -0,0 +1,104 @@
+-- Resumable change feed for the inquiry board.
+--
+-- Every insert, update and delete on inquiries appends a row here carrying
+-- only the list columns.  Clients subscribe to inserts on this table through
+-- Supabase Realtime and, after a reconnect, reread the events from a little
+-- below the newest id they applied instead of reloading the list.  Ids do
+-- not commit in order, so clients deduplicate by id.
+
+create table if not exists public.inquiry_events (
+    id bigint generated always as identity primary key,
+    op text not null check (op in ('insert', 'update', 'delete')),
+    inquiry_id uuid not null,
+    row jsonb,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists inquiry_events_created_at_idx on public.inquiry_events (created_at);
+
+create or replace function public.record_inquiry_event()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    if tg_op = 'DELETE' then
+        insert into public.inquiry_events (op, inquiry_id) values ('delete', old.id);
+        return old;
+    end if;
+    insert into public.inquiry_events (op, inquiry_id, row)
+    values (
+        lower(tg_op),
+        new.id,
+        jsonb_build_object(
+            'id', new.id,
+            'title', new.title,
+            'author', new.author,
+            'created_at', new.created_at,
+            'status', new.status,
+            'is_secret', new.is_secret
+        )
+    );
+    return new;
+end;
+$$;
+
+drop trigger if exists inquiries_record_event on public.inquiries;
+create trigger inquiries_record_event
+    after insert or update or delete on public.inquiries
+    for each row execute function public.record_inquiry_event();
+
+alter table public.inquiry_events enable row level security;
+
+drop policy if exists "inquiry events are public" on public.inquiry_events;
+create policy "inquiry events are public" on public.inquiry_events
+    for select to anon, authenticated using (true);
+
+grant select on public.inquiry_events to anon, authenticated;
+
+do $$
+begin
+    if not exists (
+        select 1 from pg_publication_tables
+        where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = 'inquiry_events'
+    ) then
+        alter publication supabase_realtime add table public.inquiry_events;
+    end if;
+end;
+$$;
+
+-- Low-water mark of the feed: every event with id <= through_id may have
+-- been pruned.  Ids have gaps (rolled-back inserts, identity caching), so
+-- clients compare their position with this rather than looking for holes.
+create table if not exists public.inquiry_events_pruned (
+    singleton boolean primary key default true check (singleton),
+    through_id bigint not null default 0
+);
+
+insert into public.inquiry_events_pruned (singleton) values (true) on conflict do nothing;
+
+alter table public.inquiry_events_pruned enable row level security;
+
+drop policy if exists "inquiry event prune mark is public" on public.inquiry_events_pruned;
+create policy "inquiry event prune mark is public" on public.inquiry_events_pruned
+    for select to anon, authenticated using (true);
+
+grant select on public.inquiry_events_pruned to anon, authenticated;
+
+-- Clients that were away longer than this reload the list instead of
+-- replaying.  Schedule with pg_cron, e.g.
+--   select cron.schedule('prune-inquiry-events', '0 * * * *', 'select public.prune_inquiry_events()');
+create or replace function public.prune_inquiry_events(p_keep interval default interval '7 days')
+returns void
+language sql
+security definer
+set search_path = public
+as $$
+    with pruned as (
+        delete from public.inquiry_events where created_at < now() - p_keep returning id
+    )
+    update public.inquiry_events_pruned
+    set through_id = greatest(through_id, (select max(id) from pruned))
+    where exists (select 1 from pruned);
+$$;
@@ -0,0 +1,91 @@
+-- Keyword, status and date-range search over the whole inquiry history.
+--
+-- Text is tokenized like the client index (src/lib/searchIndex.ts) and the
+-- test stand-in (testsprite_tests/harness/storage.py): character bigrams per
+-- word, so a two-letter Korean keyword matches inside longer words.  Neither
+-- the 'simple' text search parser (whole words only) nor pg_trgm (three
+-- letter grams, so no index use for "변환") can do that.  The bigrams are
+-- stored as a tsvector under a GIN index and matched with an AND tsquery.
+
+create or replace function public.inquiry_bigrams(p_text text)
+returns text[]
+language sql
+immutable
+parallel safe
+as $$
+    select coalesce(array_agg(distinct gram), '{}')
+      from (
+        select case when char_length(word) = 1 then word else substr(word, i, 2) end as gram
+          from regexp_split_to_table(lower(normalize(coalesce(p_text, ''), nfkc)), '[[:space:][:punct:]]+') as word,
+               generate_series(1, greatest(char_length(word) - 1, 1)) as i
+         where word <> ''
+      ) grams;
+$$;
+
+-- Null when the text has no words, i.e. no keyword filter.
+create or replace function public.inquiry_search_query(p_text text)
+returns tsquery
+language sql
+immutable
+parallel safe
+as $$
+    select string_agg(quote_literal(gram), ' & ')::tsquery
+      from unnest(public.inquiry_bigrams(p_text)) as gram;
+$$;
+
+alter table public.inquiries
+    add column if not exists search_vector tsvector
+    generated always as (
+        array_to_tsvector(public.inquiry_bigrams(
+            coalesce(title, '') || ' ' || coalesce(author, '') || ' ' ||
+            coalesce(content, '') || ' ' || coalesce(reply, '')
+        ))
+    ) stored;
+
+create index if not exists inquiries_search_vector_idx on public.inquiries using gin (search_vector);
+-- Keyset order of the list, overall and per status.
+create index if not exists inquiries_created_at_id_idx on public.inquiries (created_at desc, id desc);
+create index if not exists inquiries_status_created_at_id_idx on public.inquiries (status, created_at desc, id desc);
+
+-- search_vector covers content and reply, so it stays out of the column
+-- grants and is only used here.  A keyword never matches a secret inquiry
+-- unless the caller is an admin.  Dates are UTC days, both inclusive.
+create or replace function public.search_inquiries(
+    p_query text default null,
+    p_status text default null,
+    p_from date default null,
+    p_to date default null,
+    p_before_created_at timestamptz default null,
+    p_before_id uuid default null,
+    p_limit integer default 20
+)
+returns setof jsonb
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    with params as (
+        select public.inquiry_search_query(p_query) as query, public.is_inquiry_admin() as admin
+    )
+    select jsonb_build_object(
+               'id', i.id,
+               'title', i.title,
+               'author', i.author,
+               'created_at', i.created_at,
+               'status', i.status,
+               'is_secret', i.is_secret
+           )
+      from public.inquiries i, params
+     where (p_status is null or i.status = p_status)
+       and (p_from is null or i.created_at >= p_from::timestamp at time zone 'utc')
+       and (p_to is null or i.created_at < (p_to + 1)::timestamp at time zone 'utc')
+       and (p_before_created_at is null or (i.created_at, i.id) < (p_before_created_at, p_before_id))
+       and (params.query is null
+            or (i.search_vector @@ params.query and (params.admin or not i.is_secret)))
+     order by i.created_at desc, i.id desc
+     limit least(greatest(coalesce(p_limit, 20), 1), 100);
+$$;
+
+grant execute on function public.search_inquiries(text, text, date, date, timestamptz, uuid, integer)
+    to anon, authenticated;
@@ -1,49 +1,14 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
+    # The intro animation is the subject of this case, so start from an empty
+    # context instead of a pre-warmed page that is already past it.
+    async with browser_pool.new_context() as context:
         page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        await page.goto(browser_pool.frontend_url(), wait_until="domcontentloaded", timeout=10000)
         
         # Interact with the page elements to simulate user flow
         # -> Try to locate any overlay or animation elements by scrolling or inspecting further to confirm if IntroOverlay is hidden or missing.
@@ -51,8 +16,8 @@ async def run_test():
         
 
         # -> Try to reload the page to see if IntroOverlay appears briefly on fresh load or check for any console logs or network activity related to IntroOverlay.
-        await page.goto('http://localhost:5173/', timeout=10000)
-        await asyncio.sleep(3)
+        await page.goto(browser_pool.frontend_url(), timeout=10000)
+        await waits.after_navigation(page)
         
 
         # -> Attempt to locate IntroOverlay or related elements by searching for keywords or class names in the DOM or by inspecting the page source for any references to IntroOverlay.
@@ -64,15 +29,6 @@ async def run_test():
             await expect(page.locator('text=IntroOverlay Animation Completed Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The IntroOverlay component did not animate in and out smoothly as expected. The overlay either did not appear or did not disappear properly, leaving the main page potentially obscured or with animation issues.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
@@ -1,12 +1,18 @@
+import os
 import requests
 
-BASE_URL = "http://localhost:3001"
+from harness import backend
+
+BASE_URL = os.environ.get("TESTSPRITE_BACKEND_URL", "http://localhost:3001")
 INQUIRIES_ENDPOINT = f"{BASE_URL}/inquiries"
 TIMEOUT = 30
 HEADERS = {"Content-Type": "application/json"}
+ADMIN_TOKEN = os.environ.get("TESTSPRITE_ADMIN_TOKEN")
+ADMIN_HEADERS = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
 
 
 def test_post_new_inquiry():
+    assert ADMIN_TOKEN, "TESTSPRITE_ADMIN_TOKEN is not set"
     new_inquiry_payload = {
         "title": "TestSprite Backend Test"
     }
@@ -48,7 +54,8 @@ def test_post_new_inquiry():
     finally:
         # Step 5: DELETE the created inquiry (if created)
         if created_inquiry_id is not None:
-            delete_response = requests.delete(f"{INQUIRIES_ENDPOINT}/{created_inquiry_id}", timeout=TIMEOUT)
+            delete_response = requests.delete(f"{INQUIRIES_ENDPOINT}/{created_inquiry_id}", headers=ADMIN_HEADERS,
+                                              timeout=TIMEOUT)
 
             assert delete_response.status_code in (200, 204), f"DELETE /inquiries/{created_inquiry_id} status code expected 200 or 204 but got {delete_response.status_code}"
 
@@ -58,4 +65,5 @@ def test_post_new_inquiry():
             assert get_deleted.status_code == 404, f"Deleted inquiry {created_inquiry_id} still accessible, expected 404 but got {get_deleted.status_code}"
 
 
-test_post_new_inquiry()
\ No newline at end of file
+if __name__ == "__main__":
+    backend.standalone(__file__)
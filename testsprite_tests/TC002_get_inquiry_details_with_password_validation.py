@@ -1,6 +1,10 @@
+import os
 import requests
 
-BASE_URL = "http://localhost:3001"
+from harness import backend
+
+BASE_URL = os.environ.get("TESTSPRITE_BACKEND_URL", "http://localhost:3001")
+ADMIN_TOKEN = os.environ.get("TESTSPRITE_ADMIN_TOKEN")
 HEADERS = {
     "Content-Type": "application/json"
 }
@@ -8,6 +12,7 @@ TIMEOUT = 30
 
 
 def test_get_inquiry_details_with_password_validation():
+    assert ADMIN_TOKEN, "TESTSPRITE_ADMIN_TOKEN is not set"
     session = requests.Session()
     created_id = None
 
@@ -32,37 +37,61 @@ def test_get_inquiry_details_with_password_validation():
     assert created is not None, "Created inquiry response missing 'id'"
     assert created.get("title") == inquiry_payload["title"]
     assert created.get("secret") is True
-    assert "password" in created and created["password"] == inquiry_payload["password"]
+    assert "password" not in created and "password_hash" not in created, "Password leaked in create response"
 
     try:
-        # Step 3a: GET /inquiries/{id} without password as normal user
+        # Step 3a: GET /inquiries/{id} without password - secret content and password are withheld
         resp_get_no_pass = session.get(f"{BASE_URL}/inquiries/{created_id}", timeout=TIMEOUT)
-        if resp_get_no_pass.status_code == 200:
-            data_no_pass = resp_get_no_pass.json()
-            # Since json-server does not enforce password protection, skip assertion
-        else:
-            assert resp_get_no_pass.status_code in (401, 403, 404)
-
-        # Step 3b: GET /inquiries/{id} with correct password as normal user
-        resp_get_with_pass = session.get(f"{BASE_URL}/inquiries/{created_id}", timeout=TIMEOUT)
+        assert resp_get_no_pass.status_code == 200
+        data_no_pass = resp_get_no_pass.json()
+        assert data_no_pass.get("title") == inquiry_payload["title"]
+        assert "content" not in data_no_pass, "Secret content returned without password"
+        assert "password" not in data_no_pass and "password_hash" not in data_no_pass
+
+        # The list must not leak them either
+        listed = [i for i in session.get(f"{BASE_URL}/inquiries", timeout=TIMEOUT).json() if i.get("id") == created_id]
+        assert len(listed) == 1
+        assert not {"content", "password", "password_hash"} & listed[0].keys(), "Secret fields leaked in list"
+
+        # Step 3b: POST /inquiries/{id}/verify with a wrong password
+        resp_wrong = session.post(f"{BASE_URL}/inquiries/{created_id}/verify", json={"password": "wrong"},
+                                  headers=HEADERS, timeout=TIMEOUT)
+        assert resp_wrong.status_code == 403, f"Expected 403 for wrong password, got {resp_wrong.status_code}"
+        assert "content" not in resp_wrong.json()
+
+        # Step 3c: POST /inquiries/{id}/verify with the correct password
+        resp_get_with_pass = session.post(f"{BASE_URL}/inquiries/{created_id}/verify",
+                                          json={"password": inquiry_payload["password"]},
+                                          headers=HEADERS, timeout=TIMEOUT)
         assert resp_get_with_pass.status_code == 200, "Failed to get inquiry details with password"
         data_with_pass = resp_get_with_pass.json()
-        assert data_with_pass.get("password") == inquiry_payload["password"], "Password does not match"
+        assert data_with_pass.get("content") == inquiry_payload["content"]
         assert data_with_pass.get("secret") is True
         assert data_with_pass.get("title") == inquiry_payload["title"]
+        assert "password" not in data_with_pass and "password_hash" not in data_with_pass
 
-        # Step 3c: Admin access - bypass password and get details
-        resp_get_admin = session.get(f"{BASE_URL}/inquiries/{created_id}?admin=true", timeout=TIMEOUT)
+        # Step 3d: Admin access - bypass password and get details
+        admin_headers = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+        resp_get_admin = session.get(f"{BASE_URL}/inquiries/{created_id}", headers=admin_headers,
+                                     timeout=TIMEOUT)
         assert resp_get_admin.status_code == 200, "Admin failed to access secret inquiry"
         data_admin = resp_get_admin.json()
         assert data_admin.get("title") == inquiry_payload["title"]
         assert data_admin.get("secret") is True
-        assert "content" in data_admin
+        assert data_admin.get("content") == inquiry_payload["content"]
+
+        # Step 3e: DELETE with a wrong password is refused and keeps the row
+        resp_delete_wrong = session.delete(f"{BASE_URL}/inquiries/{created_id}", json={"password": "wrong"},
+                                           headers=HEADERS, timeout=TIMEOUT)
+        assert resp_delete_wrong.status_code == 403, f"Expected 403 for wrong password, got {resp_delete_wrong.status_code}"
+        assert session.get(f"{BASE_URL}/inquiries/{created_id}", timeout=TIMEOUT).status_code == 200
 
     finally:
-        # Step 4: DELETE /inquiries/{id} the created inquiry
+        # Step 4: DELETE /inquiries/{id} the created inquiry, with its password
         if created_id is not None:
-            resp_delete = session.delete(f"{BASE_URL}/inquiries/{created_id}", timeout=TIMEOUT)
+            resp_delete = session.delete(f"{BASE_URL}/inquiries/{created_id}",
+                                         json={"password": inquiry_payload["password"]},
+                                         headers=HEADERS, timeout=TIMEOUT)
             assert resp_delete.status_code in (200, 204), f"Expected 200 or 204 on delete, got {resp_delete.status_code}"
 
         # Step 5: Verify deleted inquiry is gone
@@ -77,4 +106,5 @@ def test_get_inquiry_details_with_password_validation():
         assert len(final_inquiries) == len(original_inquiries), "Inquiry list count mismatch after cleanup"
 
 
-test_get_inquiry_details_with_password_validation()
\ No newline at end of file
+if __name__ == "__main__":
+    backend.standalone(__file__)
@@ -1,12 +1,18 @@
+import os
 import requests
+
+from harness import backend
 import time
 
-BASE_URL = "http://localhost:3001"
+BASE_URL = os.environ.get("TESTSPRITE_BACKEND_URL", "http://localhost:3001")
 INQUIRIES_ENDPOINT = f"{BASE_URL}/inquiries"
 TIMEOUT = 30
 HEADERS = {"Content-Type": "application/json"}
+ADMIN_TOKEN = os.environ.get("TESTSPRITE_ADMIN_TOKEN")
+ADMIN_HEADERS = {**HEADERS, "Authorization": f"Bearer {ADMIN_TOKEN}"}
 
 def test_admin_reply_to_inquiry():
+    assert ADMIN_TOKEN, "TESTSPRITE_ADMIN_TOKEN is not set"
     inquiry_data = {
         "title": "TestSprite Backend Test",
         "content": "Please reply to this inquiry.",
@@ -28,7 +34,10 @@ def test_admin_reply_to_inquiry():
         # Admin replies to the inquiry - PATCH request to update reply field
         patch_data = {"reply": reply_text}
         reply_url = f"{INQUIRIES_ENDPOINT}/{inquiry_id}"
-        patch_resp = requests.patch(reply_url, json=patch_data, headers=HEADERS, timeout=TIMEOUT)
+        # Without the admin token the reply is refused
+        anon_resp = requests.patch(reply_url, json=patch_data, headers=HEADERS, timeout=TIMEOUT)
+        assert anon_resp.status_code == 403, f"Expected 403 without admin token but got {anon_resp.status_code}"
+        patch_resp = requests.patch(reply_url, json=patch_data, headers=ADMIN_HEADERS, timeout=TIMEOUT)
         assert patch_resp.status_code in (200, 201), f"Expected 200 or 201 but got {patch_resp.status_code}"
         patched_inquiry = patch_resp.json()
         assert patched_inquiry.get("reply") == reply_text, "Reply text not saved correctly"
@@ -50,11 +59,12 @@ def test_admin_reply_to_inquiry():
 
     finally:
         # Clean up: Delete the created inquiry
-        delete_resp = requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", headers=HEADERS, timeout=TIMEOUT)
+        delete_resp = requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", headers=ADMIN_HEADERS, timeout=TIMEOUT)
         assert delete_resp.status_code in (200, 204), f"Expected 200 or 204 but got {delete_resp.status_code}"
 
         # Verify deletion
         verify_resp = requests.get(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", headers=HEADERS, timeout=TIMEOUT)
         assert verify_resp.status_code == 404, "Deleted inquiry still accessible"
 
-test_admin_reply_to_inquiry()
\ No newline at end of file
+if __name__ == "__main__":
+    backend.standalone(__file__)
@@ -1,105 +1,71 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+    async with browser_pool.warm_page() as page:
+        context = page.context
         
         # Interact with the page elements to simulate user flow
         # -> Open InquiryBoard overlay and open new inquiry form.
         frame = context.pages[-1]
         # Click on the '고객 문의' (Customer Inquiry) menu to open InquiryBoard overlay or inquiry section.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' button again to open InquiryBoard overlay or inquiry section.
         frame = context.pages[-1]
         # Click on the '고객 문의' (Customer Inquiry) button to open InquiryBoard overlay or inquiry section.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '고객 문의' button to open the InquiryBoard overlay and then open the new inquiry form.
         frame = context.pages[-1]
         # Click on the '고객 문의' (Customer Inquiry) button to open InquiryBoard overlay.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' button to open the new inquiry form.
         frame = context.pages[-1]
         # Click on the '문의하기' button to open the new inquiry form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click '고객 문의' button to open InquiryBoard overlay, then click '문의하기' to open new inquiry form, and carefully identify input fields for filling.
         frame = context.pages[-1]
         # Click on the '고객 문의' button to open InquiryBoard overlay.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '+ 문의하기' button to open the new inquiry form.
         frame = context.pages[-1]
         # Click on the '+ 문의하기' button to open the new inquiry form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click '고객 문의' button to open InquiryBoard overlay, then click '문의하기' to open new inquiry form, and verify the form fields are present before filling.
         frame = context.pages[-1]
         # Click on the '고객 문의' button to open InquiryBoard overlay.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '+ 문의하기' button to open the new inquiry form.
         frame = context.pages[-1]
         # Click on the '+ 문의하기' button to open the new inquiry form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -108,15 +74,6 @@ async def run_test():
             await expect(frame.locator('text=Secret Inquiry Access Granted').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The test plan execution failed because the secret inquiry password prompt did not appear as expected, or access control did not work correctly for normal users.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
@@ -1,14 +1,20 @@
+import os
 import requests
 
-BASE_URL = "http://localhost:3001"
+from harness import backend
+
+BASE_URL = os.environ.get("TESTSPRITE_BACKEND_URL", "http://localhost:3001")
 INQUIRIES_ENDPOINT = f"{BASE_URL}/inquiries"
 TIMEOUT = 30
+ADMIN_TOKEN = os.environ.get("TESTSPRITE_ADMIN_TOKEN")
+ADMIN_HEADERS = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
 HEADERS = {
     "Content-Type": "application/json"
 }
 
 
 def test_admin_delete_inquiry():
+    assert ADMIN_TOKEN, "TESTSPRITE_ADMIN_TOKEN is not set"
     # Step 1: GET inquiries list, verify 200 and list response
     resp_get_all = requests.get(INQUIRIES_ENDPOINT, timeout=TIMEOUT)
     assert resp_get_all.status_code == 200, f"Expected 200 OK, got {resp_get_all.status_code}"
@@ -33,8 +39,10 @@ def test_admin_delete_inquiry():
         assert inquiry_fetched.get("id") == inquiry_id, "Fetched inquiry ID does not match created inquiry ID"
         assert inquiry_fetched.get("title") == "TestSprite Backend Test", "Fetched inquiry title mismatch"
 
-        # Step 4: DELETE the created inquiry
-        resp_delete = requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", timeout=TIMEOUT)
+        # Step 4: DELETE without credentials is refused, as an admin it succeeds
+        resp_delete_anon = requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", timeout=TIMEOUT)
+        assert resp_delete_anon.status_code == 403, f"Expected 403 without credentials, got {resp_delete_anon.status_code}"
+        resp_delete = requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", headers=ADMIN_HEADERS, timeout=TIMEOUT)
         assert resp_delete.status_code in (200, 204), f"Expected 200 or 204 on delete, got {resp_delete.status_code}"
 
         # Step 5: Verify the deleted inquiry is gone (404 expected)
@@ -49,7 +57,8 @@ def test_admin_delete_inquiry():
 
     finally:
         # Cleanup: in case deletion failed above, try to delete again to keep test environment clean
-        requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", timeout=TIMEOUT)
+        requests.delete(f"{INQUIRIES_ENDPOINT}/{inquiry_id}", headers=ADMIN_HEADERS, timeout=TIMEOUT)
 
 
-test_admin_delete_inquiry()
\ No newline at end of file
+if __name__ == "__main__":
+    backend.standalone(__file__)
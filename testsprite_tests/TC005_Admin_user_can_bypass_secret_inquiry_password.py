@@ -1,49 +1,11 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+    async with browser_pool.warm_page() as page:
+        context = page.context
         
         # Interact with the page elements to simulate user flow
         # -> Locate and toggle admin mode ON in InquiryBoard.
@@ -54,68 +16,72 @@ async def run_test():
         frame = context.pages[-1]
         # Click on '고객 문의' (Customer Inquiry) button to navigate to InquiryBoard or inquiry section.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the 'ADMIN OFF' button to toggle admin mode ON.
         frame = context.pages[-1]
         # Click the 'ADMIN OFF' button to toggle admin mode ON.
         elem = frame.locator('xpath=html/body/div/div/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '문의하기' (Inquiry) button to create a new secret inquiry.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the new inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Navigate to the InquiryBoard page URL or reload the application to restore the InquiryBoard interface.
-        await page.goto('http://localhost:5173', timeout=10000)
-        await asyncio.sleep(3)
+        await page.goto(browser_pool.frontend_url(), timeout=10000)
+        await waits.after_navigation(page)
         
 
         # -> Click the '고객 문의' button to navigate to the InquiryBoard page.
         frame = context.pages[-1]
         # Click the '고객 문의' button to go to InquiryBoard page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' button to open the new inquiry creation form.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the new inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' button to navigate to the InquiryBoard page again.
         frame = context.pages[-1]
         # Click the '고객 문의' button to go to InquiryBoard page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the 'ADMIN OFF' button to toggle admin mode ON.
         frame = context.pages[-1]
         # Click the 'ADMIN OFF' button to toggle admin mode ON.
         elem = frame.locator('xpath=html/body/div/div/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '문의하기' button to open the new inquiry creation form.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the new inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' button to navigate to the InquiryBoard page.
         frame = context.pages[-1]
         # Click the '고객 문의' button to go to InquiryBoard page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # --> Assertions to verify final state
@@ -124,15 +90,6 @@ async def run_test():
             await expect(frame.locator('text=Password Required').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Admin mode toggle ON did not allow immediate viewing of secret inquiries without password prompt as expected.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
@@ -1,10 +1,16 @@
+import os
 import requests
 
-BASE_URL = "http://localhost:3001"
+from harness import backend
+
+BASE_URL = os.environ.get("TESTSPRITE_BACKEND_URL", "http://localhost:3001")
 HEADERS = {"Content-Type": "application/json"}
+ADMIN_TOKEN = os.environ.get("TESTSPRITE_ADMIN_TOKEN")
+ADMIN_HEADERS = {**HEADERS, "Authorization": f"Bearer {ADMIN_TOKEN}"}
 TIMEOUT = 30
 
 def test_get_inquiry_list():
+    assert ADMIN_TOKEN, "TESTSPRITE_ADMIN_TOKEN is not set"
     inquiry_data = {
         "title": "TestSprite Backend Test",
         "content": "This is a backend test inquiry.",
@@ -41,7 +47,7 @@ def test_get_inquiry_list():
         assert inquiry_by_id.get("reply") == inquiry_data["reply"], "Reply mismatch on fetch by ID"
 
         # Step 4: DELETE /inquiries/{id} - delete created inquiry
-        resp = requests.delete(f"{BASE_URL}/inquiries/{created_inquiry_id}", headers=HEADERS, timeout=TIMEOUT)
+        resp = requests.delete(f"{BASE_URL}/inquiries/{created_inquiry_id}", headers=ADMIN_HEADERS, timeout=TIMEOUT)
         assert resp.status_code in [200, 204], f"Expected 200 or 204 on delete, got {resp.status_code}"
 
         # Step 5: GET /inquiries/{id} - verify deletion
@@ -57,6 +63,7 @@ def test_get_inquiry_list():
     finally:
         # Cleanup: Delete inquiry if still exists
         if created_inquiry_id is not None:
-            requests.delete(f"{BASE_URL}/inquiries/{created_inquiry_id}", headers=HEADERS, timeout=TIMEOUT)
+            requests.delete(f"{BASE_URL}/inquiries/{created_inquiry_id}", headers=ADMIN_HEADERS, timeout=TIMEOUT)
 
-test_get_inquiry_list()
\ No newline at end of file
+if __name__ == "__main__":
+    backend.standalone(__file__)
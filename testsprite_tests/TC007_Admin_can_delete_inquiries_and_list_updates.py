@@ -1,49 +1,11 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+    async with browser_pool.warm_page() as page:
+        context = page.context
         
         # Interact with the page elements to simulate user flow
         # -> Scroll down to find and toggle admin mode ON or locate the admin mode toggle button.
@@ -54,59 +16,61 @@ async def run_test():
         frame = context.pages[-1]
         # Click the '고객 문의' (Customer Inquiry) button to go to the inquiry board or admin interface.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' (Make Inquiry) button to create a new inquiry for deletion testing.
         frame = context.pages[-1]
         # Click the '문의하기' (Make Inquiry) button to create a new inquiry.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' (Customer Inquiry) button to return to the inquiry board page and re-enable admin mode if needed.
         frame = context.pages[-1]
         # Click the '고객 문의' (Customer Inquiry) button to go back to the inquiry board page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' (Make Inquiry) button to open the inquiry creation form.
         frame = context.pages[-1]
         # Click the '문의하기' (Make Inquiry) button to open the inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Fill in the inquiry form fields: title, author, password, content, optionally check secret, then submit the inquiry.
         frame = context.pages[-1]
         # Input inquiry title
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Inquiry for Deletion')
+        await waits.settle(page); await elem.fill('Test Inquiry for Deletion')
         
 
         frame = context.pages[-1]
         # Input author name
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('AdminUser')
+        await waits.settle(page); await elem.fill('AdminUser')
         
 
         frame = context.pages[-1]
         # Input password for inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('adminpass')
+        await waits.settle(page); await elem.fill('adminpass')
         
 
         frame = context.pages[-1]
         # Input inquiry content
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[3]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test inquiry to verify deletion functionality in admin mode.')
+        await waits.settle(page); await elem.fill('This is a test inquiry to verify deletion functionality in admin mode.')
         
 
         frame = context.pages[-1]
         # Click the '비밀글로 작성' (Secret) checkbox to mark inquiry as secret
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Scroll down to find and click the '고객 문의' (Customer Inquiry) button to return to the inquiry board page.
@@ -117,28 +81,30 @@ async def run_test():
         frame = context.pages[-1]
         # Click the '고객 문의' (Customer Inquiry) button to go to the inquiry board page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' (Make Inquiry) button to create a new inquiry for deletion testing.
         frame = context.pages[-1]
         # Click the '문의하기' (Make Inquiry) button to create a new inquiry.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' (Customer Inquiry) button to navigate to the inquiry board page.
         frame = context.pages[-1]
         # Click the '고객 문의' (Customer Inquiry) button to go to the inquiry board page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' (Make Inquiry) button to create a new inquiry for deletion testing.
         frame = context.pages[-1]
         # Click the '문의하기' (Make Inquiry) button to open the inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -147,15 +113,6 @@ async def run_test():
             await expect(frame.locator('text=Inquiry deletion successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Admin mode inquiry deletion did not complete successfully or the inquiry list did not update instantly as expected.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
@@ -1,49 +1,11 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+    async with browser_pool.warm_page() as page:
+        context = page.context
         
         # Interact with the page elements to simulate user flow
         # -> Navigate to the inquiry or customer inquiry section to trigger password prompt as a normal user.
@@ -54,98 +16,103 @@ async def run_test():
         frame = context.pages[-1]
         # Click the '고객 문의' (Customer Inquiry) button to open the inquiry section
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click '문의하기' (Inquiry) button to create a new inquiry with secret enabled to test password prompt.
         frame = context.pages[-1]
         # Click '문의하기' (Inquiry) button to open new inquiry form
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Navigate back to the main page and then to the inquiry section to retry creating a secret inquiry.
-        await page.goto('http://localhost:5173/', timeout=10000)
-        await asyncio.sleep(3)
+        await page.goto(browser_pool.frontend_url(), timeout=10000)
+        await waits.after_navigation(page)
         
 
         # -> Click the '고객 문의' button to open the inquiry section again.
         frame = context.pages[-1]
         # Click the '고객 문의' button to open inquiry section
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click '문의하기' button to open the inquiry creation form.
         frame = context.pages[-1]
         # Click '문의하기' button to open inquiry creation form
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' button to navigate to the inquiry section and retry creating a secret inquiry.
         frame = context.pages[-1]
         # Click the '고객 문의' button to open the inquiry section
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' button to open the inquiry creation form.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the inquiry creation form
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' button to open the inquiry section again.
         frame = context.pages[-1]
         # Click the '고객 문의' button to open inquiry section
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' button to open the inquiry creation form.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the inquiry creation form
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Fill the inquiry form fields: title, author, password, content, check secret checkbox, and submit the form.
         frame = context.pages[-1]
         # Fill the title field with 'Test Secret Inquiry'
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Secret Inquiry')
+        await waits.settle(page); await elem.fill('Test Secret Inquiry')
         
 
         frame = context.pages[-1]
         # Fill the author field with 'TestUser'
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TestUser')
+        await waits.settle(page); await elem.fill('TestUser')
         
 
         frame = context.pages[-1]
         # Fill the password field with 'testpass123'
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testpass123')
+        await waits.settle(page); await elem.fill('testpass123')
         
 
         frame = context.pages[-1]
         # Fill the content textarea with test content
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[3]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test secret inquiry content.')
+        await waits.settle(page); await elem.fill('This is a test secret inquiry content.')
         
 
         frame = context.pages[-1]
         # Check the secret inquiry checkbox to mark inquiry as secret
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click the submit button to register the secret inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.modal_mounted(page)
         
 
         # --> Assertions to verify final state
@@ -154,15 +121,6 @@ async def run_test():
             await expect(frame.locator('text=Native Password Prompt').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Native alert, prompt, or confirm dialogs were shown instead of styled custom modal components as required by the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
@@ -1,147 +1,114 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+    async with browser_pool.warm_page() as page:
+        context = page.context
         
         # Interact with the page elements to simulate user flow
         # -> Click on the '고객 문의' (Customer Inquiry) button to open the inquiry list or inquiry board to start testing inquiry creation and admin operations.
         frame = context.pages[-1]
         # Click on the '고객 문의' button to open the inquiry list or inquiry board for inquiry operations.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click on '문의하기' button to open the inquiry creation form and create a new inquiry.
         frame = context.pages[-1]
         # Click on '문의하기' button to open the inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click on the '고객 문의' button to navigate back to the inquiry list page.
         frame = context.pages[-1]
         # Click on '고객 문의' button to open the inquiry list page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click on '문의하기' button to open the inquiry creation form and create the first inquiry.
         frame = context.pages[-1]
         # Click on '문의하기' button to open the inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Reload the application at http://localhost:5173/ to recover from unexpected navigation and then navigate to the inquiry list page again.
-        await page.goto('http://localhost:5173/', timeout=10000)
-        await asyncio.sleep(3)
+        await page.goto(browser_pool.frontend_url(), timeout=10000)
+        await waits.after_navigation(page)
         
 
         # -> Click on the '고객 문의' button to navigate to the inquiry list page.
         frame = context.pages[-1]
         # Click on '고객 문의' button to open the inquiry list page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click on '문의하기' button to open the inquiry creation form and create the first inquiry.
         frame = context.pages[-1]
         # Click on '문의하기' button to open the inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click on the '고객 문의' button to navigate to the inquiry list page.
         frame = context.pages[-1]
         # Click on '고객 문의' button to open the inquiry list page.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click on '문의하기' button to open the inquiry creation form and create the first inquiry.
         frame = context.pages[-1]
         # Click on '문의하기' button to open the inquiry creation form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Fill inquiry creation form with title, author, password, content, toggle secret checkbox, and submit to create the first inquiry.
         frame = context.pages[-1]
         # Input title for the first inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Inquiry 1')
+        await waits.settle(page); await elem.fill('Test Inquiry 1')
         
 
         frame = context.pages[-1]
         # Input author name for the first inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Tester1')
+        await waits.settle(page); await elem.fill('Tester1')
         
 
         frame = context.pages[-1]
         # Input password for the first inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('pass123')
+        await waits.settle(page); await elem.fill('pass123')
         
 
         frame = context.pages[-1]
         # Input content for the first inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[3]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test inquiry content 1.')
+        await waits.settle(page); await elem.fill('This is a test inquiry content 1.')
         
 
         frame = context.pages[-1]
         # Toggle secret checkbox for the first inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click 등록하기 to submit the first inquiry
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div[2]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.modal_mounted(page)
         
 
         # --> Assertions to verify final state
@@ -150,15 +117,6 @@ async def run_test():
             await expect(frame.locator('text=React key warning detected').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: React key warnings or invalid DOM property warnings were detected in the browser console during inquiry list rendering, inquiry creation, or admin operations as per the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
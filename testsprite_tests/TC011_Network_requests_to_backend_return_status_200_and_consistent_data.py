@@ -1,115 +1,85 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
+from harness import browser_pool, waits
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+    async with browser_pool.warm_page() as page:
+        context = page.context
         
         # Interact with the page elements to simulate user flow
         # -> Click the '고객 문의' button to open InquiryBoard and load inquiry list.
         frame = context.pages[-1]
         # Click the '고객 문의' button to open InquiryBoard and load inquiry list.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page)
+        async with waits.inquiries_response(page) as inquiries:
+            await elem.click(timeout=5000)
+        if inquiries.response is not None:
+            assert inquiries.response.status == 200, f"GET /inquiries returned {inquiries.response.status}"
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Trigger GET /inquiries API call and verify response status and data.
         frame = context.pages[-1]
         # Click 'ADMIN OFF' button to toggle admin mode ON to enable API interaction visibility and controls.
         elem = frame.locator('xpath=html/body/div/div/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '문의하기' button to open the new inquiry form for creating a new inquiry.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the new inquiry form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Navigate to http://localhost:5173 to reload the application and then open InquiryBoard.
-        await page.goto('http://localhost:5173', timeout=10000)
-        await asyncio.sleep(3)
+        await page.goto(browser_pool.frontend_url(), timeout=10000)
+        await waits.after_navigation(page)
         
 
         # -> Click the '고객 문의' button to open InquiryBoard and load inquiry list.
         frame = context.pages[-1]
         # Click the '고객 문의' button to open InquiryBoard and load inquiry list.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' button to open the new inquiry form.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the new inquiry form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the '고객 문의' button to reopen InquiryBoard and then click '문의하기' to open the new inquiry form.
         frame = context.pages[-1]
         # Click the '고객 문의' button to reopen InquiryBoard.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # -> Click the '문의하기' button to open the new inquiry form.
         frame = context.pages[-1]
         # Click the '문의하기' button to open the new inquiry form.
         elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
         
 
         # -> Navigate to http://localhost:5173 to reload the application and then open InquiryBoard.
-        await page.goto('http://localhost:5173', timeout=10000)
-        await asyncio.sleep(3)
+        await page.goto(browser_pool.frontend_url(), timeout=10000)
+        await waits.after_navigation(page)
         
 
         # -> Click the '고객 문의' button to open InquiryBoard and load inquiry list.
         frame = context.pages[-1]
         # Click the '고객 문의' button to open InquiryBoard and load inquiry list.
         elem = frame.locator('xpath=html/body/div/div/div/nav/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page); await elem.click(timeout=5000)
+        await waits.inquiry_list_rendered(page)
         
 
         # --> Assertions to verify final state
@@ -118,15 +88,6 @@ async def run_test():
             await expect(frame.locator('text=Inquiry submission successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: API interactions with /inquiries did not return HTTP 200 or response data did not match UI inquiry list and details as per the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(browser_pool.standalone(run_test))
@@ -0,0 +1,6 @@
+"""Shared execution harness for the TestSprite TC scripts.
+
+Run the whole suite from the ``testsprite_tests`` directory with::
+
+    python -m harness --jobs 4
+"""
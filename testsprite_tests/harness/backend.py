@@ -0,0 +1,111 @@
+"""Per-worker inquiries backends for the TC runner.
+
+Every worker process gets its own backend so inquiries created by one backend
+case are never visible to a case running concurrently in another worker.  UI
+cases do not reach it: the frontend they drive talks to Supabase.
+
+The backend cases rely on what only the stand-in (:mod:`harness.server`)
+implements: the admin token, ``POST /inquiries/<id>/verify`` and 403 on
+writes without the right password or token.  json-server has none of it and
+is not supported; ``external`` must be a stand-in started with the same
+``TESTSPRITE_ADMIN_TOKEN``.
+"""
+
+import os
+import secrets
+import socket
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from harness.server import ADMIN_TOKEN_ENV, InquiryServer, load_rows
+from harness.storage import InquiryStore
+
+BACKEND_URL_ENV = "TESTSPRITE_BACKEND_URL"
+DEFAULT_BACKEND_URL = "http://localhost:3001"
+SEED_DB = Path(__file__).resolve().parents[2] / "db.json"
+
+
+def backend_url():
+    """Base URL the backend TC scripts should target."""
+    return os.environ.get(BACKEND_URL_ENV, DEFAULT_BACKEND_URL)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"{url}/inquiries", timeout=1):
+                return
+        except (urllib.error.URLError, ConnectionError):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"backend at {url} did not come up within {timeout}s")
+            time.sleep(0.05)
+
+
+class StandInBackend:
+    """The in-process Python stand-in (:mod:`harness.server`) on an ephemeral port."""
+
+    def __init__(self, seed=SEED_DB):
+        self.seed = Path(seed)
+        self.url = None
+        self._server = None
+
+    def start(self):
+        # The TC scripts read the admin token from the same variable.
+        admin_token = os.environ.setdefault(ADMIN_TOKEN_ENV, secrets.token_urlsafe(16))
+        self._server = InquiryServer(InquiryStore(load_rows(self.seed)), admin_token=admin_token)
+        self.url = self._server.start()
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.stop()
+            self._server = None
+
+
+class ExternalBackend:
+    """An already running stand-in shared by every worker (no isolation)."""
+
+    def __init__(self, url=DEFAULT_BACKEND_URL):
+        self.url = url
+
+    def start(self):
+        return self.url
+
+    def stop(self):
+        pass
+
+
+BACKENDS = {
+    "stand-in": StandInBackend,
+    "external": ExternalBackend,
+}
+
+
+def make_backend(kind, url=DEFAULT_BACKEND_URL):
+    if kind == "external":
+        return ExternalBackend(url)
+    return BACKENDS[kind]()
+
+
+def standalone(path):
+    """Run one backend case against a private stand-in, as ``python TCxxx.py`` does.
+
+    The case reads its URL and admin token when it is loaded, so it is loaded
+    again from ``path`` once the stand-in is up.
+    """
+    from harness.runner import Case, run_serial
+
+    result, = run_serial([Case(Path(path).resolve(), "backend")], "stand-in", DEFAULT_BACKEND_URL)
+    if not result.passed:
+        print(result.error.rstrip(), file=sys.stderr)
+        sys.exit(1)
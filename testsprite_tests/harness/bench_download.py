@@ -0,0 +1,250 @@
+"""Throughput and resume behaviour of :mod:`harness.downloads` under connection drops.
+
+    python -m harness.bench_download --size-mb 64 --drop-every-mb 8
+
+Serves a random file of ``--size-mb`` and downloads it as
+
+* ``direct``: one GET, body sent with ``sendfile``,
+* ``copy``: the same with a read/write loop instead of ``sendfile``,
+* ``proxied``: one GET through the fault-injecting proxy, no drops,
+* ``restart``: through the proxy with drops, starting over after each one,
+  as a plain ``<a download>`` does,
+* ``resume``: through the proxy with drops, continuing with
+  ``Range: bytes=<have>-`` and ``If-Range: <etag>``, and
+* ``segmented``: ``--segments`` parallel range requests through the
+  proxy, each resuming after its own drops.
+
+The proxy cuts every connection after a random number of response bytes,
+exponentially distributed around ``--drop-every-mb``.  Every
+completed download is checked against the server's SHA-256 manifest.  The
+table shows wall time, goodput (file size over wall time), bytes received
+over file size, and connection attempts.
+"""
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import random
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from harness.downloads import MANIFEST_PATH, DownloadServer
+
+FILE_NAME = "installer.bin"
+READ_CHUNK = 1 << 20
+# A restarting client gives up after this many attempts.
+MAX_ATTEMPTS = 200
+
+
+class DropProxy:
+    """TCP proxy that cuts each connection after a random response budget."""
+
+    def __init__(self, upstream, mean_bytes=None, seed=0):
+        self.upstream = upstream
+        self.mean_bytes = mean_bytes
+        self.drops = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self._thread = threading.Thread(target=self._accept, name="drop-proxy", daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self):
+        return self._listener.getsockname()[:2]
+
+    def close(self):
+        self._listener.close()
+
+    def _budget(self):
+        if self.mean_bytes is None:
+            return float("inf")
+        with self._lock:
+            return int(self._random.expovariate(1 / self.mean_bytes))
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._pipe, args=(client,), daemon=True).start()
+
+    def _pipe(self, client):
+        upstream = socket.create_connection(self.upstream)
+        threading.Thread(target=self._forward_requests, args=(client, upstream), daemon=True).start()
+        budget = self._budget()
+        sent = 0
+        try:
+            while data := upstream.recv(READ_CHUNK):
+                if sent + len(data) > budget:
+                    client.sendall(data[:int(budget - sent)])
+                    with self._lock:
+                        self.drops += 1
+                    break
+                client.sendall(data)
+                sent += len(data)
+        except OSError:
+            pass
+        finally:
+            # shutdown() rather than just close(): the request thread is
+            # still blocked in recv() on these sockets, which keeps them open.
+            for sock in (client, upstream):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
+
+    @staticmethod
+    def _forward_requests(client, upstream):
+        try:
+            while data := client.recv(READ_CHUNK):
+                upstream.sendall(data)
+        except OSError:
+            pass
+
+
+def fetch(address, headers, sink, offset):
+    """GET the file into ``sink``; returns ``(status, received)``.
+
+    A 206 body lands at ``offset``, a full 200 body at 0.  Stops quietly at a
+    dropped connection (status None once nothing arrived); the caller
+    decides whether to resume.
+    """
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    status = None
+    received = 0
+    try:
+        connection.request("GET", f"/{FILE_NAME}", headers=headers)
+        response = connection.getresponse()
+        status = response.status
+        if status == 200:
+            offset = 0
+        elif status != 206:
+            return status, 0
+        while chunk := response.read(READ_CHUNK):
+            sink[offset + received:offset + received + len(chunk)] = chunk
+            received += len(chunk)
+    except (http.client.HTTPException, OSError):
+        pass
+    finally:
+        connection.close()
+    return status, received
+
+
+def get_manifest(address):
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    try:
+        connection.request("GET", MANIFEST_PATH)
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def download_restarting(address, size):
+    sink = bytearray(size)
+    transferred = attempts = 0
+    while attempts < MAX_ATTEMPTS:
+        attempts += 1
+        _, received = fetch(address, {}, sink, 0)
+        transferred += received
+        if received == size:
+            return sink, transferred, attempts
+    return None, transferred, attempts
+
+
+def download_resuming(address, size, etag, start=0, end=None):
+    """Fetch bytes [start, end] (the whole file by default), resuming after drops."""
+    end = size - 1 if end is None else end
+    buffer = bytearray(end - start + 1)
+    have = transferred = attempts = 0
+    while have < len(buffer) and attempts < MAX_ATTEMPTS:
+        attempts += 1
+        headers = {"Range": f"bytes={start + have}-{end}", "If-Range": etag}
+        status, received = fetch(address, headers, buffer, have)
+        transferred += received
+        if status == 200:
+            # If-Range failed: the file changed and what we have is stale.
+            raise RuntimeError("file changed during the download")
+        if status is not None and status != 206:
+            raise RuntimeError(f"unexpected status {status}")
+        have += received
+    return (buffer if have == len(buffer) else None), transferred, attempts
+
+
+def download_segmented(address, size, etag, segments):
+    bounds = [(size * i // segments, size * (i + 1) // segments - 1) for i in range(segments)]
+    with ThreadPoolExecutor(segments) as pool:
+        parts = list(pool.map(lambda span: download_resuming(address, size, etag, *span), bounds))
+    if any(part is None for part, _, _ in parts):
+        return None, sum(t for _, t, _ in parts), sum(a for _, _, a in parts)
+    return b"".join(part for part, _, _ in parts), sum(t for _, t, _ in parts), sum(a for _, _, a in parts)
+
+
+def timed(run):
+    started = time.perf_counter()
+    data, transferred, attempts = run()
+    return data, transferred, attempts, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_download", description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=64)
+    parser.add_argument("--drop-every-mb", type=float, default=8, help="mean response bytes between drops")
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    size = int(args.size_mb * (1 << 20))
+    mean = args.drop_every_mb * (1 << 20)
+    with tempfile.TemporaryDirectory() as root:
+        Path(root, FILE_NAME).write_bytes(os.urandom(size))
+        server = DownloadServer(root)
+        copy_server = DownloadServer(root, sendfile=False)
+        server.start()
+        copy_server.start()
+        expected = get_manifest(server.server_address[:2])[FILE_NAME]
+        clean = DropProxy(server.server_address[:2])
+        lossy = DropProxy(server.server_address[:2], mean, args.seed)
+        etag = expected["etag"]
+
+        runs = {
+            "direct": lambda: download_resuming(server.server_address[:2], size, etag),
+            "copy": lambda: download_resuming(copy_server.server_address[:2], size, etag),
+            "proxied": lambda: download_resuming(clean.address, size, etag),
+            "restart": lambda: download_restarting(lossy.address, size),
+            "resume": lambda: download_resuming(lossy.address, size, etag),
+            "segmented": lambda: download_segmented(lossy.address, size, etag, args.segments),
+        }
+        print(f"{args.size_mb:g} MB file, drops every ~{args.drop_every_mb:g} MB on lossy runs")
+        print(f"{'run':>10} {'time':>8} {'goodput':>11} {'received':>9} {'attempts':>9}  result")
+        try:
+            for name, run in runs.items():
+                drops_before = lossy.drops
+                data, transferred, attempts, elapsed = timed(run)
+                if data is None:
+                    result = f"gave up after {MAX_ATTEMPTS} attempts"
+                elif hashlib.sha256(data).hexdigest() != expected["sha256"]:
+                    result = "CORRUPT"
+                else:
+                    result = "ok"
+                if name in ("restart", "resume", "segmented"):
+                    result += f", {lossy.drops - drops_before} drops"
+                goodput = size / elapsed / (1 << 20) if data is not None else 0
+                print(f"{name:>10} {elapsed:7.2f}s {goodput:7.0f}MB/s {transferred / size:8.2f}x {attempts:>9}  {result}")
+        finally:
+            clean.close()
+            lossy.close()
+            server.stop()
+            copy_server.stop()
+
+
+if __name__ == "__main__":
+    main()
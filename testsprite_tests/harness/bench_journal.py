@@ -0,0 +1,76 @@
+"""Sustained insert throughput of the journaled store vs table size.
+
+    python -m harness.bench_journal --sizes 10000 100000 1000000
+
+Each size starts from a ``db.json`` snapshot holding that many rows, replays
+it, then times ``--inserts`` consecutive creates, background compactions
+included.  For comparison it also times json-server's strategy of rewriting
+the whole file on every mutation, up to ``--rewrite-limit`` rows.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from harness.bench_storage import synthetic_rows
+from harness.journal import COLLECTION
+from harness.storage import InquiryStore
+
+
+def write_snapshot(path, size):
+    with open(path, "w", encoding="utf-8") as snapshot:
+        json.dump({COLLECTION: list(synthetic_rows(size))}, snapshot, ensure_ascii=False)
+
+
+def new_inquiry(number):
+    return {"title": f"새 문의 {number}", "author": "bench", "content": "내용", "is_secret": False,
+            "status": "pending", "reply": None}
+
+
+def journaled_rate(db_path, inserts, fsync):
+    store = InquiryStore.open(db_path, fsync=fsync)
+    try:
+        started = time.perf_counter()
+        for number in range(inserts):
+            store.create(new_inquiry(number))
+        elapsed = time.perf_counter() - started
+    finally:
+        store.close()
+    return inserts / elapsed
+
+
+def rewrite_rate(db_path, inserts):
+    rows = json.loads(Path(db_path).read_text(encoding="utf-8"))[COLLECTION]
+    started = time.perf_counter()
+    for number in range(inserts):
+        rows.append(dict(new_inquiry(number), id=f"new{number}"))
+        with open(db_path, "w", encoding="utf-8") as db:
+            json.dump({COLLECTION: rows}, db, ensure_ascii=False)
+    return inserts / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_journal", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--inserts", type=int, default=50_000)
+    parser.add_argument("--fsync", action="store_true", help="fsync after every journal append")
+    parser.add_argument("--rewrite-limit", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>9} {'journal inserts/s':>18} {'rewrite inserts/s':>18}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="bench-journal-") as tmp:
+            db_path = Path(tmp) / "db.json"
+            write_snapshot(db_path, size)
+            journaled = journaled_rate(db_path, args.inserts, args.fsync)
+            rewrite_cell = f"{'-':>18}"
+            if size <= args.rewrite_limit:
+                write_snapshot(db_path, size)
+                rewrite_cell = f"{rewrite_rate(db_path, max(3, 200_000 // size)):18.1f}"
+        print(f"{size:>9} {journaled:18.0f} {rewrite_cell}")
+
+
+if __name__ == "__main__":
+    main()
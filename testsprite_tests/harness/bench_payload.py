@@ -0,0 +1,92 @@
+"""List payload size with ``select=*`` vs the list projection.
+
+    python -m harness.bench_payload --rows 1000
+
+Serves each dataset from a stand-in backend and fetches the first page and
+the whole table twice, once with every column and once with ``_select`` set
+to :data:`harness.server.LIST_COLUMNS`.  Sizes are response bodies as sent,
+plus their gzip size since Supabase responses are compressed in transit.
+"""
+
+import argparse
+import gzip
+import random
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from harness.bench_storage import PAGE_SIZE, synthetic_rows
+from harness.server import LIST_COLUMNS, InquiryServer
+from harness.storage import InquiryStore
+
+SENTENCES = [
+    "PDF 변환 후 표의 테두리가 사라집니다.",
+    "설치 파일 실행 시 Windows Defender 경고가 표시됩니다.",
+    "한글 글꼴이 포함된 문서를 변환하면 글자가 깨집니다.",
+    "대용량 파일(300MB 이상)에서 진행률이 99%에서 멈춥니다.",
+    "The converter crashes when the output folder is on a network drive.",
+]
+LOG_LINE = "2025-01-01 12:00:00.123 ERROR [converter.pdf.RenderWorker] page {n}: font 'MalgunGothic' not embedded"
+
+
+def text(rng, sentences):
+    return " ".join(rng.choice(SENTENCES) for _ in range(sentences))
+
+
+def dataset(kind, count, seed=0):
+    """Rows whose content/reply resemble ``short``, ``typical`` or ``long`` inquiries."""
+    rng = random.Random(seed)
+    for row in synthetic_rows(count, seed):
+        if kind == "short":
+            row["content"] = rng.choice(SENTENCES)
+        elif kind == "typical":
+            row["content"] = text(rng, rng.randint(3, 12))
+            row["reply"] = text(rng, rng.randint(2, 6)) if row["status"] == "answered" else None
+        else:
+            log = "\n".join(LOG_LINE.format(n=n) for n in range(rng.randint(40, 120)))
+            row["content"] = text(rng, rng.randint(5, 15)) + "\n\n" + log
+            row["reply"] = text(rng, rng.randint(4, 10)) if row["status"] == "answered" else None
+        yield row
+
+
+def body_size(url, query):
+    with urlopen(f"{url}/inquiries?{urlencode(query)}") as response:
+        body = response.read()
+    return len(body), len(gzip.compress(body))
+
+
+def measure(kind, count):
+    server = InquiryServer(InquiryStore(dataset(kind, count)))
+    url = server.start()
+    try:
+        select = {"_select": ",".join(LIST_COLUMNS)}
+        page = {"_limit": PAGE_SIZE}
+        return {
+            "page": (body_size(url, page), body_size(url, {**page, **select})),
+            "table": (body_size(url, {}), body_size(url, select)),
+        }
+    finally:
+        server.stop()
+
+
+def kib(size):
+    return f"{size / 1024:9.1f}K"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_payload", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--kinds", nargs="+", default=["short", "typical", "long"],
+                        choices=["short", "typical", "long"])
+    args = parser.parse_args(argv)
+
+    print(f"{'dataset':>8} {'fetch':>9} {'select=*':>10} {'list cols':>10} {'ratio':>6} "
+          f"{'gz *':>10} {'gz list':>10} {'ratio':>6}")
+    for kind in args.kinds:
+        for fetch, ((full, full_gz), (lean, lean_gz)) in measure(kind, args.rows).items():
+            label = f"{PAGE_SIZE} rows" if fetch == "page" else f"{args.rows} rows"
+            print(f"{kind:>8} {label:>9} {kib(full)} {kib(lean)} {full / lean:5.1f}x "
+                  f"{kib(full_gz)} {kib(lean_gz)} {full_gz / lean_gz:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Search and filter latency of :class:`harness.storage.InquiryStore` vs table size.
+
+    python -m harness.bench_search --sizes 1000 10000 100000
+
+For every size it times the first page (``PAGE_SIZE`` rows) of
+
+* ``broad``: a keyword found in most rows,
+* ``rare``: a keyword found in a handful of rows,
+* ``range``: status plus a one-week created_at window, and
+* ``all``: keyword, status and date window together,
+
+as ``GET /inquiries?q=&status=&from=&to=`` asks for them.  The same filters
+done by scanning every row, as json-server's ``q`` does, are shown for
+comparison up to ``--scan-limit`` rows.
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+from harness.bench_payload import dataset
+from harness.bench_storage import EPOCH, PAGE_SIZE
+from harness.storage import TEXT_FIELDS, InquiryStore
+
+
+def day(offset):
+    return (EPOCH + timedelta(days=offset)).date().isoformat()
+
+
+def queries(size):
+    # synthetic_rows spaces rows ~37s apart; put the window in the middle.
+    middle = size * 37 // 86_400 // 2
+    window = {"since": day(middle), "until": day(middle + 6)}
+    return {
+        "broad": {"text": "변환"},
+        "rare": {"text": "user42"},
+        "range": {"filters": {"status": "pending"}, **window},
+        "all": {"text": "글꼴", "filters": {"status": "answered"}, **window},
+    }
+
+
+def scan(rows, text=None, filters=None, since=None, until=None):
+    words = text.lower().split() if text else []
+    matches = []
+    for row in rows:
+        if since is not None and row["created_at"] < since:
+            continue
+        if until is not None and row["created_at"][:len(until)] > until:
+            continue
+        if any(str(row.get(key)) != value for key, value in (filters or {}).items()):
+            continue
+        haystack = " ".join(str(row.get(field) or "") for field in TEXT_FIELDS).lower()
+        if all(word in haystack for word in words):
+            matches.append(row)
+    matches.sort(key=lambda row: (row["created_at"], row["id"]), reverse=True)
+    return matches[:PAGE_SIZE]
+
+
+def median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1e6
+
+
+def bench(size, repeat, scan_limit):
+    rows = list(dataset("typical", size))
+    started = time.perf_counter()
+    store = InquiryStore(rows)
+    build = time.perf_counter() - started
+
+    result = {"size": size, "build_s": build}
+    for name, query in queries(size).items():
+        result[name] = median_us(lambda: store.list(limit=PAGE_SIZE, **query), repeat)
+        result[f"{name}_hits"] = len(store.list(**query))
+        if size <= scan_limit:
+            result[f"scan_{name}"] = median_us(lambda: scan(rows, **query), max(3, min(repeat, 100_000 // size)))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_search", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=200, help="timed calls per query")
+    parser.add_argument("--scan-limit", type=int, default=100_000, help="largest size to time the full scan at")
+    args = parser.parse_args(argv)
+
+    names = list(queries(0))
+    print(f"{'rows':>8} {'build':>7} " + " ".join(f"{name:>24}" for name in names))
+    for size in args.sizes:
+        r = bench(size, args.repeat, args.scan_limit)
+        cells = []
+        for name in names:
+            scan_cell = f"/{r[f'scan_{name}'] / 1000:.0f}ms" if f"scan_{name}" in r else ""
+            cells.append(f"{r[name]:.0f}us{scan_cell} ({r[f'{name}_hits']})")
+        print(f"{size:>8} {r['build_s']:6.2f}s " + " ".join(f"{cell:>24}" for cell in cells))
+    print("index time per first page / scan time (total matches)")
+
+
+if __name__ == "__main__":
+    main()
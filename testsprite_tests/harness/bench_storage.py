@@ -0,0 +1,96 @@
+"""Lookup and list latency of :class:`harness.storage.InquiryStore` vs table size.
+
+    python -m harness.bench_storage --sizes 100 10000 1000000
+
+For every size it times GET-by-id, the newest-first first page (what
+InquiryBoard shows) and the first page filtered by status.  The same queries
+against a plain list scan, which is what json-server does, are shown for
+comparison up to ``--scan-limit`` rows.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from harness.storage import InquiryStore
+
+PAGE_SIZE = 20
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def synthetic_rows(count, seed=0):
+    rng = random.Random(seed)
+    for number in range(count):
+        created = EPOCH + timedelta(seconds=number * 37 + rng.randrange(30))
+        yield {
+            "id": f"{number:08x}",
+            "title": f"문의 {number}",
+            "author": f"user{number % 997}",
+            "content": "PDF 변환 중 오류가 발생합니다.",
+            "is_secret": number % 5 == 0,
+            "status": "answered" if number % 3 == 0 else "pending",
+            "reply": None,
+            "created_at": created.isoformat().replace("+00:00", "Z"),
+        }
+
+
+def time_per_call(fn, args, repeat):
+    samples = []
+    for arg in args[:repeat]:
+        started = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1e6
+
+
+def scan_get(rows, inquiry_id):
+    return next((row for row in rows if row["id"] == inquiry_id), None)
+
+
+def scan_list(rows, status=None):
+    matches = [row for row in rows if status is None or row["status"] == status]
+    matches.sort(key=lambda row: row["created_at"], reverse=True)
+    return matches[:PAGE_SIZE]
+
+
+def bench(size, repeat, scan_limit):
+    rows = list(synthetic_rows(size))
+    started = time.perf_counter()
+    store = InquiryStore(rows)
+    build = time.perf_counter() - started
+
+    ids = [row["id"] for row in random.Random(1).choices(rows, k=repeat)]
+    result = {
+        "size": size,
+        "build_s": build,
+        "get_us": time_per_call(store.get, ids, repeat),
+        "list_us": time_per_call(lambda _: store.list(limit=PAGE_SIZE), ids, repeat),
+        "status_us": time_per_call(lambda _: store.list({"status": "pending"}, limit=PAGE_SIZE), ids, repeat),
+    }
+    if size <= scan_limit:
+        scan_repeat = max(3, min(repeat, 200_000 // size))
+        result["scan_get_us"] = time_per_call(lambda i: scan_get(rows, i), ids, scan_repeat)
+        result["scan_list_us"] = time_per_call(lambda _: scan_list(rows), ids, scan_repeat)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_storage", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=2000, help="timed calls per query")
+    parser.add_argument("--scan-limit", type=int, default=100_000, help="largest size to time the list scan at")
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>9} {'build':>8} {'get/id':>9} {'page':>9} {'status pg':>10} {'scan get':>10} {'scan page':>11}")
+    for size in args.sizes:
+        r = bench(size, args.repeat, args.scan_limit)
+        scan_get_cell = f"{r['scan_get_us']:8.1f}us" if "scan_get_us" in r else f"{'-':>10}"
+        scan_list_cell = f"{r['scan_list_us']:9.1f}us" if "scan_list_us" in r else f"{'-':>11}"
+        print(f"{size:>9} {r['build_s']:7.2f}s {r['get_us']:7.2f}us {r['list_us']:7.2f}us "
+              f"{r['status_us']:8.2f}us {scan_get_cell} {scan_list_cell}")
+
+
+if __name__ == "__main__":
+    main()
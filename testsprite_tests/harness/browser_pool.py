@@ -0,0 +1,167 @@
+"""Shared Chromium for the Playwright UI cases.
+
+One browser is launched per process (per runner worker) and reused by every
+case that process runs.  Cases get a fresh, isolated browser context each
+time, either empty (:func:`new_context`) or holding a page that is already
+past the IntroOverlay (:func:`warm_page`).  While a case runs, the pool warms
+the next page in the background so the following case starts immediately
+(enabled by the runner through ``prewarm``; a standalone script runs a single
+case and has nothing to warm for).
+
+Browser launch time is tracked separately from test time; the runner reports
+it through :func:`take_cold_start`.
+
+Standalone use from a TC script::
+
+    if __name__ == "__main__":
+        asyncio.run(browser_pool.standalone(run_test))
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+
+from harness import waits
+
+FRONTEND_URL_ENV = "TESTSPRITE_FRONTEND_URL"
+DEFAULT_FRONTEND_URL = "http://localhost:5173"
+
+# --single-process is deliberately absent: it is unstable once several
+# contexts share one browser.
+LAUNCH_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+]
+DEFAULT_TIMEOUT_MS = 5000
+
+
+def frontend_url():
+    return os.environ.get(FRONTEND_URL_ENV, DEFAULT_FRONTEND_URL)
+
+
+class BrowserPool:
+    def __init__(self, headless=True, prewarm=False):
+        self.headless = headless
+        self.prewarm = prewarm
+        self.cold_start = 0.0
+        self.launches = 0
+        self._playwright = None
+        self._browser = None
+        self._spare = None
+
+    async def start(self):
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        started = time.perf_counter()
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+        self.cold_start += time.perf_counter() - started
+        self.launches += 1
+        return self._browser
+
+    async def close(self):
+        await self._discard_spare()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _new_context(self):
+        browser = await self.start()
+        context = await browser.new_context()
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        return context
+
+    async def _open_warm_page(self):
+        context = await self._new_context()
+        page = await context.new_page()
+        await page.goto(frontend_url(), wait_until="domcontentloaded", timeout=10000)
+        await waits.intro_exit(page)
+        return page
+
+    async def _take_spare(self):
+        spare, self._spare = self._spare, None
+        if spare is not None:
+            try:
+                return await spare
+            except Exception:
+                pass
+        return await self._open_warm_page()
+
+    async def _discard_spare(self):
+        spare, self._spare = self._spare, None
+        if spare is None:
+            return
+        try:
+            page = await spare
+        except Exception:
+            return
+        await page.context.close()
+
+    @asynccontextmanager
+    async def new_context(self):
+        """A fresh, empty context (for cases that must observe the first load)."""
+        context = await self._new_context()
+        try:
+            yield context
+        finally:
+            await context.close()
+
+    @asynccontextmanager
+    async def warm_page(self):
+        """A page in its own context, already showing the landing page."""
+        page = await self._take_spare()
+        if self.prewarm:
+            self._spare = asyncio.ensure_future(self._open_warm_page())
+        try:
+            yield page
+        finally:
+            await page.context.close()
+
+
+_shared = None
+
+
+def shared():
+    global _shared
+    if _shared is None:
+        _shared = BrowserPool()
+    return _shared
+
+
+def new_context():
+    return shared().new_context()
+
+
+def warm_page():
+    return shared().warm_page()
+
+
+def take_cold_start():
+    """Return and reset the browser launch time spent since the last call."""
+    if _shared is None:
+        return 0.0
+    spent, _shared.cold_start = _shared.cold_start, 0.0
+    return spent
+
+
+async def close_shared():
+    global _shared
+    if _shared is not None:
+        await _shared.close()
+        _shared = None
+
+
+async def standalone(run_test):
+    """Run one case with a private pool, as ``python TCxxx.py`` does."""
+    try:
+        await run_test()
+    finally:
+        await close_shared()
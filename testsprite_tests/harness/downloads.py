@@ -0,0 +1,357 @@
+"""Static download service for the installer, resumable and range-capable.
+
+Serves the regular files of one directory (``public/`` by default)::
+
+    GET|HEAD /<name>          the file, with Accept-Ranges, a strong ETag
+                              derived from its SHA-256, Last-Modified and
+                              Repr-Digest; ``Range: bytes=a-b`` (also ``a-``
+                              and ``-n``) answers 206 or 416, and
+                              ``If-Range`` with the current ETag or
+                              Last-Modified keeps a resumed download from
+                              splicing two versions of the file
+    GET      /SHA256SUMS      ``sha256sum -c`` compatible manifest
+    GET      /manifest.json   {name: {size, sha256, etag, last_modified}}
+    GET      /updates?from=1.0.0[&stem=<stem>]
+                              the patch chain from an installed version to
+                              the latest build of that installer (by
+                              default the one with the newest build), from
+                              the releases.json that
+                              ``python -m harness.releases build`` writes
+                              (see :func:`harness.releases.update_plan`)
+
+``If-None-Match`` answers 304.  A request for several ranges is served whole,
+as RFC 9110 allows; segmented downloaders ask for one range per connection.
+File bodies go out through ``socket.sendfile`` (``sendfile(2)``), so they are
+never copied through user space.  Hashes are computed once per file version
+and recomputed when the size or mtime changes.
+
+The landing page links ``/PDF_Converter_Pro_Installer_x64.exe``; map that to
+the file on disk with ``--alias``::
+
+    python -m harness.downloads --root ../public --port 8080 \\
+        --alias PDF_Converter_Pro_Installer_x64.exe=PDF_Converter_Pro_Installer.exe
+
+``python -m harness.bench_download`` measures throughput and resume behaviour
+under injected connection drops.
+"""
+
+import argparse
+import base64
+import json
+import mimetypes
+import os
+import re
+import threading
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from harness.releases import MANIFEST_NAME as RELEASES_NAME, sha256_file, update_plan
+
+SUMS_PATH = "/SHA256SUMS"
+MANIFEST_PATH = "/manifest.json"
+UPDATES_PATH = "/updates"
+COPY_CHUNK = 1 << 16
+LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/"
+RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    name: str
+    path: Path
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    @property
+    def etag(self):
+        # Strong: equal tags mean byte-identical files.
+        return f'"{self.sha256[:32]}"'
+
+    @property
+    def last_modified(self):
+        return formatdate(self.mtime_ns / 1e9, usegmt=True)
+
+    @property
+    def repr_digest(self):
+        return "sha-256=:" + base64.b64encode(bytes.fromhex(self.sha256)).decode("ascii") + ":"
+
+
+def is_lfs_pointer(path):
+    with open(path, "rb") as handle:
+        return handle.read(len(LFS_POINTER_PREFIX)) == LFS_POINTER_PREFIX
+
+
+class Catalog:
+    """The files directly under ``root``, with hashes cached per version."""
+
+    def __init__(self, root, aliases=None):
+        self.root = Path(root).resolve()
+        self.aliases = dict(aliases or {})
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def names(self):
+        return sorted(entry.name for entry in self.root.iterdir() if entry.is_file())
+
+    def get(self, name):
+        """:class:`FileInfo` for ``name`` (or an alias of it), or None."""
+        name = self.aliases.get(name, name)
+        if not name or "/" in name or name.startswith("."):
+            return None
+        path = self.root / name
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+        key = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._cache.get(name)
+            if cached is not None and (cached.size, cached.mtime_ns) == key:
+                return cached
+            info = FileInfo(name, path, stat.st_size, stat.st_mtime_ns, sha256_file(path))
+            self._cache[name] = info
+            return info
+
+    def manifest(self):
+        infos = [info for info in map(self.get, self.names()) if info is not None]
+        return {
+            info.name: {
+                "size": info.size,
+                "sha256": info.sha256,
+                "etag": info.etag,
+                "last_modified": info.last_modified,
+            }
+            for info in infos
+        }
+
+
+def parse_range(header, size):
+    """``(start, end)`` inclusive for a single-range header, else a marker.
+
+    Returns None when the header should be ignored (absent, malformed or
+    several ranges) and ``"unsatisfiable"`` when it asks for nothing that
+    exists.
+    """
+    match = RANGE.fullmatch((header or "").strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            return "unsatisfiable"
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        return "unsatisfiable"
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def if_range_matches(header, info):
+    """Whether the validator in an ``If-Range`` header still holds."""
+    if header.startswith('"') or header.startswith("W/"):
+        return header == info.etag  # strong comparison; weak tags never match
+    try:
+        return int(parsedate_to_datetime(header).timestamp()) == info.mtime_ns // 1_000_000_000
+    except (TypeError, ValueError):
+        return False
+
+
+def etag_listed(header, info):
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or info.etag in tags
+
+
+class DownloadHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "DownloadStandIn/1.0"
+
+    @property
+    def catalog(self):
+        return self.server.catalog
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_bytes(self, status, data, content_type, head=False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        if not head:
+            self.wfile.write(data)
+
+    def _send_validators(self, info):
+        self.send_header("ETag", info.etag)
+        self.send_header("Last-Modified", info.last_modified)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Cache-Control", "public, max-age=0, must-revalidate")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "ETag, Content-Range, Accept-Ranges, Repr-Digest")
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def _serve(self, head):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        if path == SUMS_PATH:
+            lines = "".join(f"{entry['sha256']}  {name}\n" for name, entry in self.catalog.manifest().items())
+            return self._send_bytes(HTTPStatus.OK, lines.encode("utf-8"), "text/plain; charset=utf-8", head)
+        if path == MANIFEST_PATH:
+            data = json.dumps(self.catalog.manifest(), indent=2).encode("utf-8")
+            return self._send_bytes(HTTPStatus.OK, data, "application/json; charset=utf-8", head)
+        if path == UPDATES_PATH:
+            return self._updates(dict(parse_qsl(parts.query)), head)
+
+        info = self.catalog.get(path.lstrip("/"))
+        if info is None:
+            return self._send_bytes(HTTPStatus.NOT_FOUND, b"not found\n", "text/plain; charset=utf-8", head)
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and etag_listed(if_none_match, info):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_validators(info)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        span = parse_range(self.headers.get("Range"), info.size)
+        if_range = self.headers.get("If-Range")
+        if span is not None and if_range and not if_range_matches(if_range, info):
+            span = None  # the file changed; send all of the new one
+        if span == "unsatisfiable":
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self._send_validators(info)
+            self.send_header("Content-Range", f"bytes */{info.size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = span if span is not None else (0, info.size - 1)
+        length = end - start + 1
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if span is not None else HTTPStatus.OK)
+        self._send_validators(info)
+        self.send_header("Content-Type", mimetypes.guess_type(info.name)[0] or "application/octet-stream")
+        self.send_header("Content-Disposition", f'attachment; filename="{info.name}"')
+        self.send_header("Content-Length", str(length))
+        self.send_header("Repr-Digest", info.repr_digest)
+        if span is not None:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{info.size}")
+        self.end_headers()
+        if head or length <= 0:
+            return
+        try:
+            with open(info.path, "rb") as handle:
+                if self.server.sendfile:
+                    self.connection.sendfile(handle, start, length)
+                else:
+                    self._copy(handle, start, length)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _updates(self, query, head):
+        releases = self.catalog.root / RELEASES_NAME
+        try:
+            manifest = json.loads(releases.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return self._send_bytes(HTTPStatus.NOT_FOUND, b"no releases.json\n", "text/plain; charset=utf-8", head)
+        try:
+            plan = update_plan(manifest, query.get("from") or None, query.get("stem") or None)
+        except KeyError:
+            return self._send_bytes(HTTPStatus.NOT_FOUND, b"unknown stem\n", "text/plain; charset=utf-8", head)
+        data = json.dumps(plan, indent=2).encode("utf-8")
+        return self._send_bytes(HTTPStatus.OK, data, "application/json; charset=utf-8", head)
+
+    def _copy(self, handle, start, length):
+        """Read-and-write fallback, kept to compare against ``sendfile``."""
+        handle.seek(start)
+        while length > 0:
+            chunk = handle.read(min(COPY_CHUNK, length))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            length -= len(chunk)
+
+
+class DownloadServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, root, host="127.0.0.1", port=0, aliases=None, sendfile=True, verbose=False):
+        super().__init__((host, port), DownloadHandler)
+        self.catalog = Catalog(root, aliases)
+        self.sendfile = sendfile
+        self.verbose = verbose
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self.serve_forever, name="download-server", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def parse_alias(value):
+    published, sep, actual = value.partition("=")
+    if not sep or not published or not actual:
+        raise argparse.ArgumentTypeError(f"expected PUBLISHED=ACTUAL, got {value!r}")
+    return published, actual
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.downloads", description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=os.path.join(os.pardir, "public"), help="directory to serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--alias", type=parse_alias, action="append", default=[],
+                        help="serve ACTUAL under the name PUBLISHED as well (PUBLISHED=ACTUAL)")
+    args = parser.parse_args(argv)
+
+    server = DownloadServer(args.root, args.host, args.port, aliases=args.alias, verbose=True)
+    for name in server.catalog.names():
+        if is_lfs_pointer(server.catalog.root / name):
+            print(f"warning: {name} is a Git LFS pointer; run `git lfs pull` to serve the real file")
+    # Hash everything up front rather than on the first request.
+    for name, entry in server.catalog.manifest().items():
+        print(f"{entry['sha256']}  {name} ({entry['size']} bytes)")
+    print(f"Serving {server.catalog.root} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Bounded, resumable change log for the stand-in's ``/events`` stream.
+
+Every mutation of :class:`harness.storage.InquiryStore` is published here
+with a sequence id.  A subscriber that reconnects with the last id it saw
+gets exactly the events after it, as long as those are still within the
+last ``capacity`` events; otherwise it is told to reload instead.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    op: str  # "insert", "update" or "delete"
+    inquiry_id: str
+    row: dict  # the stored row; for "delete" the row as it was removed
+
+
+class EventLog:
+    def __init__(self, capacity=10_000):
+        self._events = deque(maxlen=capacity)
+        self._last_id = 0
+        self._changed = threading.Condition()
+
+    @property
+    def last_id(self):
+        return self._last_id
+
+    def publish(self, op, inquiry_id, row):
+        with self._changed:
+            self._last_id += 1
+            self._events.append(Event(self._last_id, op, inquiry_id, row))
+            self._changed.notify_all()
+
+    def since(self, last_id, timeout=None):
+        """Events after ``last_id``, waiting up to ``timeout`` s for one.
+
+        Returns ``None`` when ``last_id`` cannot be resumed from: it is older
+        than the retained window or newer than anything published (the
+        server restarted).
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._last_id != last_id, timeout)
+            if last_id > self._last_id:
+                return None
+            if last_id == self._last_id:
+                return []
+            oldest = self._events[0].id
+            if last_id < oldest - 1:
+                return None
+            return list(self._events)[last_id - oldest + 1:]
@@ -0,0 +1,131 @@
+"""Append-only write-ahead journal for the stand-in backend.
+
+json-server persists every POST/PATCH/DELETE by re-serializing the whole
+``db.json``.  Here each mutation appends one JSON line to ``<db>.journal``
+instead, so a write costs the size of the changed row, not of the table::
+
+    {"op": "put", "row": {...}}
+    {"op": "delete", "id": "..."}
+
+Once the journal holds as many entries as the table has rows (and at least
+``compact_min``), a background thread folds it into a fresh ``db.json``
+snapshot.  Compaction first rotates the live journal to ``<db>.journal.old``
+so writers never wait on it; the snapshot is written to a temporary file and
+moved into place atomically before the old segment is removed.
+
+Replay on startup loads the snapshot and re-applies ``.journal.old`` and then
+``.journal``.  Entries carry whole rows, so applying one that the snapshot
+already contains is harmless, and a torn last line from a crash mid-append
+is dropped.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+COLLECTION = "inquiries"
+
+
+def _apply(rows, entry):
+    if entry["op"] == "put":
+        rows[str(entry["row"]["id"])] = entry["row"]
+    elif entry["op"] == "delete":
+        rows.pop(str(entry["id"]), None)
+
+
+class Journal:
+    def __init__(self, snapshot_path, compact_min=10_000, fsync=False):
+        self.snapshot_path = Path(snapshot_path)
+        self.path = self.snapshot_path.with_name(self.snapshot_path.name + ".journal")
+        self.old_path = self.snapshot_path.with_name(self.snapshot_path.name + ".journal.old")
+        self.compact_min = compact_min
+        self.fsync = fsync
+        self.pending = 0
+        self._file = None
+        self._compactor = None
+
+    def replay(self):
+        """Rebuild the table from the snapshot plus journal; return its rows."""
+        rows = {}
+        if self.snapshot_path.exists():
+            for row in json.loads(self.snapshot_path.read_text(encoding="utf-8")).get(COLLECTION, []):
+                rows[str(row["id"])] = row
+        for path in (self.old_path, self.path):
+            self.pending += self._replay_segment(path, rows)
+        self._file = open(self.path, "a", encoding="utf-8")
+        return list(rows.values())
+
+    def _replay_segment(self, path, rows):
+        if not path.exists():
+            return 0
+        applied = 0
+        good_bytes = 0
+        with open(path, "rb") as segment:
+            for line in segment:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                _apply(rows, entry)
+                applied += 1
+                good_bytes += len(line)
+        if good_bytes < path.stat().st_size:
+            os.truncate(path, good_bytes)
+        return applied
+
+    def append(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.pending += 1
+
+    def should_compact(self, table_size):
+        busy = self._compactor is not None and self._compactor.is_alive()
+        return not busy and self.pending >= max(self.compact_min, table_size)
+
+    def start_compaction(self, rows):
+        """Rotate the journal and write ``rows`` as the new snapshot in the background.
+
+        Must be called with the store's write lock held so no mutation slips
+        between the rows handed in and the rotation.
+        """
+        self._rotate()
+        self._compactor = threading.Thread(target=self._write_snapshot, args=(rows,),
+                                           name="journal-compaction", daemon=True)
+        self._compactor.start()
+
+    def _rotate(self):
+        self._file.close()
+        if self.old_path.exists():
+            # A previous compaction died before finishing; keep its entries.
+            with open(self.old_path, "ab") as old, open(self.path, "rb") as current:
+                old.write(current.read())
+            os.remove(self.path)
+        else:
+            os.replace(self.path, self.old_path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self.pending = 0
+
+    def _write_snapshot(self, rows):
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as tmp:
+            json.dump({COLLECTION: rows}, tmp, ensure_ascii=False)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        os.remove(self.old_path)
+
+    def wait(self):
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+    def close(self):
+        self.wait()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,44 @@
+"""Salted password hashes for secret inquiries.
+
+Hashes are stored as ``pbkdf2_sha256$<iterations>$<salt hex>$<digest hex>``
+and checked with :func:`hmac.compare_digest`, so neither the stored value nor
+the time a check takes reveals the password.
+"""
+
+import hashlib
+import hmac
+import secrets
+
+ALGORITHM = "pbkdf2_sha256"
+ITERATIONS = 100_000
+
+
+def _digest(password, salt, iterations):
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def hash_password(password, iterations=ITERATIONS):
+    salt = secrets.token_bytes(16)
+    return f"{ALGORITHM}${iterations}${salt.hex()}${_digest(password, salt, iterations).hex()}"
+
+
+def _parse(encoded):
+    algorithm, iterations, salt, digest = encoded.split("$")
+    if algorithm != ALGORITHM:
+        raise ValueError(f"unsupported hash algorithm {algorithm!r}")
+    return int(iterations), bytes.fromhex(salt), bytes.fromhex(digest)
+
+
+# Checked when a row has no usable hash, so a miss costs the same as a match.
+_DUMMY = hash_password("")
+
+
+def verify_password(password, encoded):
+    try:
+        iterations, salt, expected = _parse(encoded or "")
+        usable = True
+    except ValueError:
+        iterations, salt, expected = _parse(_DUMMY)
+        usable = False
+    matches = hmac.compare_digest(_digest(password or "", salt, iterations), expected)
+    return usable and matches
@@ -0,0 +1,225 @@
+"""Binary delta releases of the installer.
+
+Given a directory of installer builds named ``<stem>-<version>.exe``::
+
+    python -m harness.releases build ../public
+
+writes, next to them,
+
+* one patch per pair of consecutive versions of the same stem,
+  ``<stem>-<from>-to-<to>.zst``, made with ``zstd --patch-from`` (the old
+  build is the dictionary; libzstd on the client applies it the same way),
+* ``releases.json``, the version manifest: every build and patch with its
+  stem, size and SHA-256, and the latest version of each stem,
+
+applies every patch again to check it reproduces its build byte for byte,
+and prints the patch/full size ratio of each step.  Patches that already
+exist and still match their builds are kept.
+
+:func:`update_plan` turns the manifest into what one client should fetch;
+:mod:`harness.downloads` serves it as ``GET /updates?from=<version>``.
+Requires the ``zstd`` command (1.4.5 or later).
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MANIFEST_NAME = "releases.json"
+BUILD_NAME = re.compile(r"(?P<stem>.+?)[-_]v?(?P<version>\d+(?:\.\d+)+)\.exe")
+COMPRESSION_LEVEL = 19
+# zstd decoders refuse windows above 2**27 unless told otherwise.
+DEFAULT_WINDOW_LOG = 27
+
+
+def version_key(version):
+    return tuple(int(part) for part in version.split("."))
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_builds(directory):
+    """``{(stem, version): path}`` of the installer builds in ``directory``.
+
+    Each stem (``PDF_Converter_Pro_Installer_x64``, ``..._x86``) is its own
+    line of builds, ordered by version.
+    """
+    builds = {}
+    for path in Path(directory).iterdir():
+        match = BUILD_NAME.fullmatch(path.name)
+        if match and path.is_file():
+            builds[match["stem"], match["version"]] = path
+    return dict(sorted(builds.items(), key=lambda item: (item[0][0], version_key(item[0][1]))))
+
+
+def default_stem(stems):
+    """Of ``{stem: latest version}``, the stem ``/updates`` answers for when
+    the client names none: the one with the newest build, the first by name
+    on a tie."""
+    return max(sorted(stems), key=lambda stem: version_key(stems[stem]))
+
+
+def window_log(*paths):
+    """Smallest zstd window covering the largest file, at least the default."""
+    largest = max(path.stat().st_size for path in paths)
+    return max(DEFAULT_WINDOW_LOG, math.ceil(math.log2(max(largest, 2))))
+
+
+def zstd(*args):
+    if shutil.which("zstd") is None:
+        raise SystemExit("zstd not found; install it (1.4.5 or later) to build delta releases")
+    subprocess.run(["zstd", "-q", "-f", *map(str, args)], check=True)
+
+
+def make_patch(old, new, patch):
+    log = window_log(old, new)
+    zstd(f"-{COMPRESSION_LEVEL}", f"--long={log}", f"--patch-from={old}", new, "-o", patch)
+    return log
+
+
+def apply_patch(old, patch, out, log):
+    zstd("-d", f"--long={log}", f"--patch-from={old}", patch, "-o", out)
+
+
+def entry(path, **extra):
+    return {"file": path.name, "size": path.stat().st_size, "sha256": sha256_file(path), **extra}
+
+
+def build(directory, verbose=True):
+    """Create missing patches and rewrite the manifest; returns the manifest."""
+    directory = Path(directory)
+    builds = find_builds(directory)
+    if not builds:
+        raise SystemExit(f"no <stem>-<version>.exe builds in {directory}")
+    previous = {}
+    manifest_path = directory / MANIFEST_NAME
+    if manifest_path.exists():
+        previous = {
+            (p.get("stem"), p["from"], p["to"]): p
+            for p in json.loads(manifest_path.read_text("utf-8"))["patches"]
+        }
+
+    releases = {key: entry(path, stem=key[0], version=key[1]) for key, path in builds.items()}
+    patches = []
+    keys = list(builds)
+    if verbose:
+        print(f"{'stem':<32} {'patch':>20} {'full':>12} {'patch':>12} {'ratio':>7} {'time':>7}")
+    # Builds are sorted by stem first, so consecutive keys of the same stem
+    # are that stem's consecutive versions.
+    for old_key, new_key in zip(keys, keys[1:]):
+        if old_key[0] != new_key[0]:
+            continue
+        stem, old_version, new_version = old_key[0], old_key[1], new_key[1]
+        old, new = builds[old_key], builds[new_key]
+        patch = directory / f"{stem}-{old_version}-to-{new_version}.zst"
+        known = previous.get((stem, old_version, new_version))
+        started = time.perf_counter()
+        reused = (
+            known is not None
+            and patch.exists()
+            and known["source_sha256"] == releases[old_key]["sha256"]
+            and known["target_sha256"] == releases[new_key]["sha256"]
+            and known["sha256"] == sha256_file(patch)
+        )
+        log = known["window_log"] if reused else make_patch(old, new, patch)
+        if not reused:
+            check = patch.with_name(patch.name + ".check")
+            try:
+                apply_patch(old, patch, check, log)
+                if sha256_file(check) != releases[new_key]["sha256"]:
+                    raise SystemExit(f"{patch.name} does not reproduce {new.name}")
+            finally:
+                check.unlink(missing_ok=True)
+        elapsed = time.perf_counter() - started
+        patches.append(entry(
+            patch,
+            stem=stem,
+            **{"from": old_version, "to": new_version},
+            source_sha256=releases[old_key]["sha256"],
+            target_sha256=releases[new_key]["sha256"],
+            window_log=log,
+        ))
+        if verbose:
+            full_size = releases[new_key]["size"]
+            size = patches[-1]["size"]
+            note = " (kept)" if reused else ""
+            print(f"{stem:<32} {old_version + ' -> ' + new_version:>20} {full_size:>12,} {size:>12,} "
+                  f"{size / full_size:6.1%} {elapsed:6.1f}s{note}")
+
+    stems = {stem: version for stem, version in keys}  # sorted, so the last version wins
+    manifest = {
+        "latest": stems[default_stem(stems)],
+        "stems": stems,
+        "releases": list(releases.values()),
+        "patches": patches,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def update_plan(manifest, installed=None, stem=None):
+    """What a client on ``installed`` should download to reach the latest build
+    of ``stem`` (:func:`default_stem` when None).
+
+    ``patches`` is the chain to apply in order, empty when there is none or
+    when it would not be smaller than the full installer.  Raises
+    :class:`KeyError` for a stem the manifest does not list.
+    """
+    stem = stem or default_stem(manifest["stems"])
+    latest = manifest["stems"][stem]
+    full = next(
+        release for release in manifest["releases"]
+        if release["stem"] == stem and release["version"] == latest
+    )
+    plan = {"latest": latest, "stem": stem, "installed": installed, "full": full, "patches": [], "patch_bytes": 0}
+    if installed is None or installed == latest:
+        return plan
+    by_source = {patch["from"]: patch for patch in manifest["patches"] if patch["stem"] == stem}
+    chain = []
+    version = installed
+    while version != latest:
+        patch = by_source.get(version)
+        if patch is None:
+            return plan
+        chain.append(patch)
+        version = patch["to"]
+    patch_bytes = sum(patch["size"] for patch in chain)
+    if patch_bytes < full["size"]:
+        plan.update(patches=chain, patch_bytes=patch_bytes)
+    return plan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.releases", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="create patches and releases.json")
+    build_parser.add_argument("directory", help="directory holding <stem>-<version>.exe builds")
+    plan_parser = commands.add_parser("plan", help="print the update plan for an installed version")
+    plan_parser.add_argument("directory")
+    plan_parser.add_argument("installed")
+    plan_parser.add_argument("--stem", help="build line to update (default: the one with the newest build)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build(args.directory)
+    else:
+        manifest = json.loads((Path(args.directory) / MANIFEST_NAME).read_text("utf-8"))
+        json.dump(update_plan(manifest, args.installed, args.stem), sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Parallel runner for the TC*.py scripts.
+
+Discovers the TC scripts next to this package and runs the backend API cases
+across a process pool.  With ``--serial-baseline`` it first runs the same
+cases one after another and reports the wall-clock speedup over that run.
+
+Each worker process owns a private backend (see :mod:`harness.backend`), so
+inquiries created by one backend case never leak into the list another case
+asserts on.  The Playwright UI cases drive the frontend on :5173, which talks
+to the shared Supabase project rather than a worker's backend, so they cannot
+be isolated that way: they run one after another in a single extra worker,
+alongside the backend pool, sharing one Chromium (see
+:mod:`harness.browser_pool`).  Browser launch time is reported apart from
+test time.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import inspect
+import multiprocessing
+import os
+import runpy
+import sys
+import time
+import traceback
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.util import Finalize
+from pathlib import Path
+
+from harness.backend import BACKEND_URL_ENV, BACKENDS, DEFAULT_BACKEND_URL, make_backend
+
+SUITE_DIR = Path(__file__).resolve().parents[1]
+CASE_MODULE_NAME = "testsprite_case"
+
+
+@dataclass(frozen=True)
+class Case:
+    path: Path
+    kind: str  # "backend" or "ui"
+
+    @property
+    def name(self):
+        return self.path.stem
+
+
+@dataclass
+class CaseResult:
+    name: str
+    kind: str
+    passed: bool
+    duration: float
+    worker: int
+    error: str = ""
+    cold_start: float = 0.0
+
+
+def discover(root=SUITE_DIR, keyword=None, kind="all"):
+    """Collect the TC scripts under ``root``; UI cases are the ones driving Playwright."""
+    cases = []
+    for path in sorted(Path(root).glob("TC*.py")):
+        case_kind = "ui" if "playwright" in path.read_text(encoding="utf-8") else "backend"
+        if kind != "all" and case_kind != kind:
+            continue
+        if keyword and keyword not in path.stem:
+            continue
+        cases.append(Case(path, case_kind))
+    return cases
+
+
+def _entry_point(namespace):
+    if callable(namespace.get("run_test")):
+        return namespace["run_test"]
+    for name, value in namespace.items():
+        if name.startswith("test_") and callable(value):
+            return value
+    raise LookupError("no run_test() or test_*() entry point found")
+
+
+_loop = None
+
+
+def _run_coroutine(coroutine):
+    # UI cases share one event loop per process so the pooled browser, which
+    # is bound to the loop it was launched on, survives between cases.
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coroutine)
+
+
+def _take_cold_start():
+    pool = sys.modules.get("harness.browser_pool")
+    return pool.take_cold_start() if pool is not None else 0.0
+
+
+def run_case(case):
+    """Execute one TC script in the current process and capture the outcome."""
+    started = time.perf_counter()
+    error = ""
+    try:
+        namespace = runpy.run_path(str(case.path), run_name=CASE_MODULE_NAME)
+        outcome = _entry_point(namespace)()
+        if inspect.iscoroutine(outcome):
+            _run_coroutine(outcome)
+    except Exception:
+        error = traceback.format_exc(limit=3, chain=False)
+    elapsed = time.perf_counter() - started
+    cold_start = _take_cold_start()
+    return CaseResult(case.name, case.kind, not error, elapsed - cold_start, os.getpid(), error, cold_start)
+
+
+def _close_browser():
+    pool = sys.modules.get("harness.browser_pool")
+    if pool is not None and _loop is not None:
+        _loop.run_until_complete(pool.close_shared())
+
+
+def _start_backend(backend_kind, backend_url):
+    if str(SUITE_DIR) not in sys.path:
+        sys.path.insert(0, str(SUITE_DIR))
+    backend = make_backend(backend_kind, backend_url)
+    os.environ[BACKEND_URL_ENV] = backend.start()
+    return backend
+
+
+def _init_worker(backend_kind, backend_url):
+    backend = _start_backend(backend_kind, backend_url)
+    Finalize(None, backend.stop, exitpriority=10)
+    if importlib.util.find_spec("playwright") is not None:
+        from harness import browser_pool
+        browser_pool.shared().prewarm = True
+        Finalize(None, _close_browser, exitpriority=20)
+
+
+def run_serial(cases, backend_kind, backend_url, report=print):
+    backend = _start_backend(backend_kind, backend_url)
+    try:
+        results = []
+        for case in cases:
+            results.append(run_case(case))
+            report(_format_result(results[-1]))
+        return results
+    finally:
+        _close_browser()
+        backend.stop()
+
+
+def _pool(stack, workers, backend_kind, backend_url):
+    return stack.enter_context(ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(backend_kind, backend_url),
+    ))
+
+
+def run_parallel(cases, jobs, backend_kind, backend_url, report=print):
+    """Run backend cases on ``jobs`` workers and UI cases serially on one more.
+
+    UI cases all go through the same frontend and Supabase project, so they
+    share state no matter which worker runs them; only their order is kept
+    deterministic by running them one at a time.
+    """
+    backend_cases = [case for case in cases if case.kind == "backend"]
+    ui_cases = [case for case in cases if case.kind == "ui"]
+    results = []
+    with ExitStack() as stack:
+        futures = []
+        # UI cases dominate the runtime, so start them first to keep the tail short.
+        if ui_cases:
+            ui_pool = _pool(stack, 1, backend_kind, backend_url)
+            futures += [ui_pool.submit(run_case, case) for case in ui_cases]
+        if backend_cases:
+            backend_pool = _pool(stack, jobs, backend_kind, backend_url)
+            futures += [backend_pool.submit(run_case, case) for case in backend_cases]
+        for future in as_completed(futures):
+            results.append(future.result())
+            report(_format_result(results[-1]))
+    return results
+
+
+def _format_result(result):
+    status = "PASS" if result.passed else "FAIL"
+    line = f"{status} {result.duration:7.2f}s  [{result.kind:<7}] {result.name}"
+    if result.cold_start:
+        line += f"  (+{result.cold_start:.2f}s browser cold start)"
+    return line
+
+
+def summarize(results, wall, jobs, serial_wall=None):
+    passed = sum(result.passed for result in results)
+    cold_starts = [result.cold_start for result in results if result.cold_start]
+    lines = [f"{passed} passed, {len(results) - passed} failed in {wall:.2f}s wall ({jobs} workers)"]
+    if cold_starts:
+        lines.append(f"browser cold start {sum(cold_starts):.2f}s over {len(cold_starts)} launches"
+                     " (excluded from case times)")
+    # Only a measured serial run makes a speedup; case times taken inside the
+    # parallel run include its contention.
+    if serial_wall is not None:
+        lines.append(f"serial run {serial_wall:.2f}s wall -> speedup {serial_wall / wall:.2f}x")
+    for result in results:
+        if not result.passed:
+            lines.append(f"\n--- {result.name} ---\n{result.error.rstrip()}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__.splitlines()[0])
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 2,
+                        help="worker processes for backend cases (default: CPU count)")
+    parser.add_argument("-k", dest="keyword", help="only run cases whose file name contains this")
+    parser.add_argument("--kind", choices=("all", "backend", "ui"), default="all")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="stand-in",
+                        help="per-worker backend to start (default: stand-in)")
+    parser.add_argument("--backend-url", default=DEFAULT_BACKEND_URL,
+                        help="URL of a running stand-in (python -m harness.server) for --backend external")
+    parser.add_argument("--serial-baseline", action="store_true",
+                        help="run the cases serially first and compare measured wall time")
+    args = parser.parse_args(argv)
+
+    cases = discover(keyword=args.keyword, kind=args.kind)
+    if not cases:
+        print("no TC cases matched")
+        return 1
+
+    serial_wall = None
+    if args.serial_baseline:
+        print(f"== serial baseline: {len(cases)} cases")
+        started = time.perf_counter()
+        run_serial(cases, args.backend, args.backend_url)
+        serial_wall = time.perf_counter() - started
+
+    backend_count = sum(case.kind == "backend" for case in cases)
+    ui_count = len(cases) - backend_count
+    jobs = max(1, min(args.jobs, backend_count))
+    plan = []
+    if backend_count:
+        plan.append(f"{backend_count} backend cases on {jobs} workers")
+    if ui_count:
+        plan.append(f"{ui_count} UI cases serially on one worker")
+    print(f"== parallel: {', '.join(plan)}")
+    started = time.perf_counter()
+    results = run_parallel(cases, jobs, args.backend, args.backend_url)
+    wall = time.perf_counter() - started
+
+    print()
+    workers = (jobs if backend_count else 0) + (1 if ui_count else 0)
+    print(summarize(results, wall, workers, serial_wall))
+    return 0 if all(result.passed for result in results) else 1
@@ -0,0 +1,405 @@
+"""In-process stand-in for the json-server ``/inquiries`` backend.
+
+Implements the part of the json-server contract the TC scripts and the
+debugging notes rely on::
+
+    GET    /inquiries          list, newest first (field=value filters,
+                               _limit and 1-based _page apply; both
+                               must be positive integers, else 400)
+    GET    /inquiries?_limit=20&_cursor=<token>
+                               keyset page on (created_at, id); the token
+                               for the following page comes back in
+                               X-Next-Cursor (and a Link rel="next")
+    GET    /inquiries?q=변환&status=pending&from=2025-01-01&to=2025-03-31
+                               search: every word of q in title, author,
+                               content or reply, created_at within
+                               [from, to] (dates cover the whole day);
+                               combines with the above, like the
+                               search_inquiries RPC
+    POST   /inquiries          create, 201 with the stored row; 409 when
+                               the body names an id that exists
+    GET    /inquiries/<id>     one row or 404
+    GET    ...?_select=id,title
+                               either read trimmed to the listed fields
+                               (PostgREST's ``select=``), e.g. LIST_COLUMNS
+    PUT    /inquiries/<id>     replace (id is kept); admin only, else 403
+    PATCH  /inquiries/<id>     merge; admin only, else 403
+    DELETE /inquiries/<id>     {"password": ...} or the admin token; 200
+                               with the removed row, 403 or 404
+    POST   /inquiries/<id>/verify
+                               {"password": ...}; 200 with the full row when
+                               it matches (or the row is not secret), else 403
+    GET    /events             Server-Sent Events, one insert / update /
+                               delete per change with list columns only;
+                               resumes after Last-Event-ID (or
+                               ?lastEventId=), ``reset`` means reload
+
+Reads never include ``password_hash``, and secret rows are listed and fetched
+without ``content`` and ``reply``; only ``/verify`` or a request carrying
+``Authorization: Bearer <admin token>`` sees those.  This is the contract of
+the ``get_inquiry`` RPC in ``supabase/migrations``.  Deleting follows the
+``delete_inquiry`` RPC: the inquiry's password or an admin.  Updates are
+replies and status changes, which only admins make.
+
+Rows live in an indexed in-memory store (:mod:`harness.storage`).  The
+server binds an ephemeral port by default, so any number of instances can run
+side by side.
+
+Standalone, as a drop-in for ``json-server --port 3001 db.json``::
+
+    python -m harness.server --port 3001 --db ../db.json
+
+With ``--db`` the store is persistent: mutations go to an append-only journal
+next to the file and are compacted back into it (see :mod:`harness.journal`).
+"""
+
+import argparse
+import base64
+import hmac
+import json
+import os
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from harness.passwords import verify_password
+from harness.storage import DuplicateIdError, InquiryStore, is_secret, sort_key
+
+COLLECTION = "inquiries"
+# Search parameters; any other field=value is an exact filter.
+SEARCH_PARAMS = ("q", "from", "to")
+ADMIN_TOKEN_ENV = "TESTSPRITE_ADMIN_TOKEN"
+EVENTS_PATH = "/events"
+KEEPALIVE_SECONDS = 15
+DEFAULT_PAGE_SIZE = 20
+# What InquiryBoard's list renders; everything else is loaded per detail.
+LIST_COLUMNS = ("id", "title", "author", "created_at", "status", "is_secret")
+
+
+def project(row, columns):
+    """``row`` trimmed to ``columns``, or unchanged when ``columns`` is None."""
+    if columns is None:
+        return row
+    return {column: row[column] for column in columns if column in row}
+
+
+def private_view(row):
+    return {key: value for key, value in row.items() if key != "password_hash"}
+
+
+def public_view(row):
+    hidden = ("password_hash", "content", "reply") if is_secret(row) else ("password_hash",)
+    return {key: value for key, value in row.items() if key not in hidden}
+
+
+def parse_columns(query):
+    if "_select" not in query:
+        return None
+    return [column.strip() for column in query["_select"].split(",") if column.strip()]
+
+
+def encode_cursor(row):
+    raw = json.dumps(sort_key(row), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def positive_int(query, name, default=None):
+    """``query[name]`` as an int of at least 1, ``default`` when absent."""
+    if name not in query:
+        return default
+    try:
+        value = int(query[name])
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer, got {query[name]!r}")
+    return value
+
+
+def decode_cursor(token):
+    try:
+        created_at, inquiry_id = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"malformed cursor {token!r}") from exc
+    return str(created_at), str(inquiry_id)
+
+
+class InquiryHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "InquiryStandIn/1.0"
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _route(self):
+        """``(collection, id, action, query)``; collection is None off-route."""
+        parts = urlsplit(self.path)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        if not segments or segments[0] != COLLECTION or len(segments) > 3:
+            return None, None, None, {}
+        inquiry_id = segments[1] if len(segments) >= 2 else None
+        action = segments[2] if len(segments) == 3 else None
+        return COLLECTION, inquiry_id, action, dict(parse_qsl(parts.query))
+
+    def _is_admin(self):
+        token = self.server.admin_token
+        supplied = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        return bool(token) and hmac.compare_digest(supplied.encode(), token.encode())
+
+    def _may_delete(self, row, password):
+        return self._is_admin() or verify_password(password, row.get("password_hash"))
+
+    def _view(self, row):
+        return private_view(row) if self._is_admin() else public_view(row)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        payload = json.loads(self.rfile.read(length))
+        if not isinstance(payload, dict):
+            raise ValueError("expected a JSON object")
+        return payload
+
+    def _send(self, status, body=None, headers=None):
+        data = b"" if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "X-Next-Cursor, Link")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _not_found(self):
+        self._send(HTTPStatus.NOT_FOUND, {})
+
+    def do_OPTIONS(self):
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path.rstrip("/") == EVENTS_PATH:
+            return self._stream_events(dict(parse_qsl(parts.query)))
+        collection, inquiry_id, action, query = self._route()
+        if collection is None or action is not None:
+            return self._not_found()
+        if inquiry_id is None:
+            return self._list(query)
+        row = self.store.get(inquiry_id)
+        if row is None:
+            return self._not_found()
+        return self._send(HTTPStatus.OK, project(self._view(row), parse_columns(query)))
+
+    def _list(self, query):
+        filters = {key: value for key, value in query.items()
+                   if not key.startswith("_") and key not in SEARCH_PARAMS}
+        search = {
+            "text": query.get("q", "").strip() or None,
+            "since": query.get("from") or None,
+            "until": query.get("to") or None,
+            # Keyword hits on secret rows are for admins only.
+            "include_secret": self._is_admin(),
+        }
+        columns = parse_columns(query)
+        try:
+            limit = positive_int(query, "_limit")
+            page = positive_int(query, "_page", 1)
+            before = decode_cursor(query["_cursor"]) if "_cursor" in query else None
+        except ValueError as exc:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        if before is not None:
+            limit = limit or DEFAULT_PAGE_SIZE
+            offset = 0
+        else:
+            offset = (page - 1) * limit if limit is not None and page > 1 else 0
+        rows = self.store.list(filters, limit=limit, offset=offset, before=before, **search)
+
+        headers = {}
+        if rows and limit is not None and len(rows) == limit:
+            token = encode_cursor(rows[-1])
+            next_query = urlencode({**query, "_cursor": token, "_limit": limit})
+            headers["X-Next-Cursor"] = token
+            headers["Link"] = f'</{COLLECTION}?{next_query}>; rel="next"'
+        return self._send(HTTPStatus.OK, [project(self._view(row), columns) for row in rows], headers)
+
+    def _stream_events(self, query):
+        log = self.store.events
+        resume = self.headers.get("Last-Event-ID") or query.get("lastEventId")
+        try:
+            last_id = int(resume) if resume else log.last_id
+        except ValueError:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": f"bad event id {resume!r}"})
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self.wfile.write(b"retry: 1000\n\n")
+            self.wfile.flush()
+            while not self.server.stopping.is_set():
+                events = log.since(last_id, timeout=KEEPALIVE_SECONDS)
+                if events is None:
+                    last_id = log.last_id
+                    self._write_event(last_id, "reset", {})
+                elif not events:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                for event in events or ():
+                    payload = {"id": event.inquiry_id} if event.op == "delete" else \
+                        project(public_view(event.row), LIST_COLUMNS)
+                    self._write_event(event.id, event.op, payload)
+                    last_id = event.id
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _write_event(self, event_id, name, payload):
+        data = json.dumps(payload, ensure_ascii=False)
+        self.wfile.write(f"id: {event_id}\nevent: {name}\ndata: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def do_POST(self):
+        collection, inquiry_id, action, _ = self._route()
+        if collection is not None and inquiry_id is not None and action == "verify":
+            return self._verify(inquiry_id)
+        if collection is None or inquiry_id is not None:
+            return self._not_found()
+        try:
+            fields = self._read_json()
+        except ValueError:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "invalid JSON body"})
+        try:
+            row = self.store.create(fields)
+        except DuplicateIdError as exc:
+            return self._send(HTTPStatus.CONFLICT, {"error": str(exc)})
+        return self._send(HTTPStatus.CREATED, private_view(row))
+
+    def _verify(self, inquiry_id):
+        try:
+            password = str(self._read_json().get("password") or "")
+        except ValueError:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "invalid JSON body"})
+        row = self.store.get(inquiry_id)
+        if row is None:
+            return self._not_found()
+        if is_secret(row) and not self._is_admin() and not verify_password(password, row.get("password_hash")):
+            return self._send(HTTPStatus.FORBIDDEN, {"error": "password does not match"})
+        return self._send(HTTPStatus.OK, private_view(row))
+
+    def _write(self, apply):
+        collection, inquiry_id, action, _ = self._route()
+        if collection is None or inquiry_id is None or action is not None:
+            return self._not_found()
+        if not self._is_admin():
+            return self._send(HTTPStatus.FORBIDDEN, {"error": "admin only"})
+        try:
+            fields = self._read_json()
+        except ValueError:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "invalid JSON body"})
+        row = apply(inquiry_id, fields)
+        return self._send(HTTPStatus.OK, private_view(row)) if row is not None else self._not_found()
+
+    def do_PUT(self):
+        self._write(self.store.replace)
+
+    def do_PATCH(self):
+        self._write(self.store.update)
+
+    def do_DELETE(self):
+        collection, inquiry_id, action, _ = self._route()
+        if collection is None or inquiry_id is None or action is not None:
+            return self._not_found()
+        try:
+            password = str(self._read_json().get("password") or "")
+        except ValueError:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "invalid JSON body"})
+        row = self.store.get(inquiry_id)
+        if row is None:
+            return self._not_found()
+        if not self._may_delete(row, password):
+            return self._send(HTTPStatus.FORBIDDEN, {"error": "password does not match"})
+        row = self.store.delete(inquiry_id)
+        return self._send(HTTPStatus.OK, private_view(row)) if row is not None else self._not_found()
+
+
+class InquiryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, store=None, host="127.0.0.1", port=0, verbose=False, admin_token=None):
+        super().__init__((host, port), InquiryHandler)
+        self.store = store if store is not None else InquiryStore()
+        self.verbose = verbose
+        self.admin_token = admin_token
+        self.stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self.serve_forever, name="inquiry-server", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def load_rows(db_path):
+    """Read the ``inquiries`` array from a json-server style db.json."""
+    path = Path(db_path)
+    if not path.exists():
+        return []
+    return json.loads(path.read_text(encoding="utf-8")).get(COLLECTION, [])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.server", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--db", help="db.json to load from and persist to")
+    parser.add_argument("--fsync", action="store_true", help="fsync the journal after every write")
+    parser.add_argument("--admin-token", default=os.environ.get(ADMIN_TOKEN_ENV),
+                        help=f"bearer token that bypasses secret-inquiry passwords (default: ${ADMIN_TOKEN_ENV})")
+    args = parser.parse_args(argv)
+
+    store = InquiryStore.open(args.db, fsync=args.fsync) if args.db else InquiryStore()
+    server = InquiryServer(store, args.host, args.port, verbose=True, admin_token=args.admin_token)
+    print(f"Serving /{COLLECTION} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
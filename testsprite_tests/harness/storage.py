@@ -0,0 +1,375 @@
+"""Indexed in-memory storage for the inquiries stand-in backend.
+
+json-server keeps the table as one JSON array and rescans it for every
+lookup.  :class:`InquiryStore` instead maintains
+
+* a primary hash index ``id -> row``,
+* a sorted secondary index on ``(created_at, id)`` that serves the
+  newest-first list InquiryBoard's ``fetchInquiries`` asks for, and
+* one sorted ``(created_at, id)`` index per ``status`` value, and
+* inverted bigram indexes (:class:`TextIndex`) over title, author, content
+  and reply for keyword search,
+
+so a lookup by id is O(1) and a page of the list costs O(log n + page size)
+regardless of how many inquiries are stored.  Keyword and date-range filters
+(:meth:`InquiryStore.list`) are answered from the same indexes.  Passwords are never kept in
+clear: a ``password`` field is replaced by a salted ``password_hash`` on the
+way in (:mod:`harness.passwords`).  Every mutation is published to
+:attr:`InquiryStore.events` (:mod:`harness.events`), and with a
+:class:`harness.journal.Journal` attached it is also appended to the
+write-ahead journal.
+"""
+
+import re
+import secrets
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from datetime import datetime, timezone
+from itertools import islice, takewhile
+
+from harness.events import EventLog
+from harness.journal import Journal
+from harness.passwords import hash_password
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+class SortedKeys:
+    """A sorted list split into bounded chunks.
+
+    Insertions and removals touch a single chunk, so they stay cheap at
+    millions of keys where one flat list would memmove megabytes.
+    """
+
+    CHUNK = 1000
+
+    def __init__(self, keys=()):
+        keys = sorted(keys)
+        self._chunks = [keys[i:i + self.CHUNK] for i in range(0, len(keys), self.CHUNK)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._len = len(keys)
+
+    def __len__(self):
+        return self._len
+
+    def add(self, key):
+        if not self._chunks:
+            self._chunks.append([key])
+            self._maxes.append(key)
+        else:
+            pos = min(bisect_left(self._maxes, key), len(self._chunks) - 1)
+            chunk = self._chunks[pos]
+            insort(chunk, key)
+            self._maxes[pos] = chunk[-1]
+            if len(chunk) > 2 * self.CHUNK:
+                self._chunks[pos:pos + 1] = [chunk[:self.CHUNK], chunk[self.CHUNK:]]
+                self._maxes[pos:pos + 1] = [chunk[self.CHUNK - 1], chunk[-1]]
+        self._len += 1
+
+    def discard(self, key):
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._chunks):
+            return
+        chunk = self._chunks[pos]
+        index = bisect_left(chunk, key)
+        if index == len(chunk) or chunk[index] != key:
+            return
+        del chunk[index]
+        self._len -= 1
+        if chunk:
+            self._maxes[pos] = chunk[-1]
+        else:
+            del self._chunks[pos]
+            del self._maxes[pos]
+
+    def descending(self, offset=0, below=None):
+        """Yield keys from the largest down.
+
+        Starts just under ``below`` when given (keyset pagination), otherwise
+        at the top after skipping ``offset`` keys.
+        """
+        last = len(self._chunks) - 1
+        if below is not None:
+            last = min(bisect_left(self._maxes, below), last)
+        for pos in range(last, -1, -1):
+            chunk = self._chunks[pos]
+            start = len(chunk) if below is None else bisect_left(chunk, below)
+            below = None
+            if offset >= start:
+                offset -= start
+                continue
+            for index in range(start - 1 - offset, -1, -1):
+                yield chunk[index]
+            offset = 0
+
+
+WORD = re.compile(r"[^\W_]+")
+# Fields a keyword can match; the client can only search what it has loaded.
+TEXT_FIELDS = ("title", "author", "content", "reply")
+# A keyword whose rarest bigram is in more than this fraction of the walked
+# index is checked row by row in date order, which stops once the page is
+# full, rather than by collecting and sorting every match.
+SORT_MATCHES_BELOW = 0.1
+
+
+def bigrams(text):
+    """Character bigrams per word, the tokenizer of ``src/lib/searchIndex.ts``.
+
+    Korean has no reliable word boundaries, so "변환오류" is indexed as
+    변환, 환오, 오류 and a search for "변환" finds it.  One-letter words are
+    kept whole.
+    """
+    grams = set()
+    for word in set(WORD.findall(unicodedata.normalize("NFKC", text).lower())):
+        if len(word) == 1:
+            grams.add(word)
+        else:
+            grams.update(map(str.__add__, word, word[1:]))
+    return grams
+
+
+class TextIndex:
+    """Inverted index from bigrams to the ids of the rows containing them."""
+
+    def __init__(self):
+        self._postings = {}
+        self._grams = {}
+
+    def __len__(self):
+        return len(self._grams)
+
+    def add(self, inquiry_id, grams):
+        self._grams[inquiry_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(inquiry_id)
+
+    def discard(self, inquiry_id):
+        for gram in self._grams.pop(inquiry_id, ()):
+            posting = self._postings[gram]
+            posting.discard(inquiry_id)
+            if not posting:
+                del self._postings[gram]
+
+    def estimate(self, grams):
+        """An upper bound on the matches of ``grams``: its rarest posting."""
+        return min(len(self._postings.get(gram, ())) for gram in grams)
+
+    def matches(self, grams):
+        """Ids of the rows containing every one of ``grams``."""
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def contains(self, inquiry_id, grams):
+        return grams <= self._grams.get(inquiry_id, set())
+
+
+def row_text(row):
+    return " ".join(str(row.get(field) or "") for field in TEXT_FIELDS)
+
+
+def sort_key(row):
+    return (str(row.get("created_at") or ""), row["id"])
+
+
+def is_secret(row):
+    """The secret flag; json-server era rows and TC payloads call it ``secret``."""
+    return bool(row.get("is_secret", row.get("secret", False)))
+
+
+class DuplicateIdError(ValueError):
+    """A create named an id that is already taken."""
+
+
+def seal(fields):
+    """``fields`` with a plaintext ``password`` swapped for its hash.
+
+    An empty password stores no hash, so only an admin can open the row.
+    """
+    if "password" not in fields:
+        return fields
+    fields = dict(fields)
+    password = fields.pop("password")
+    if password:
+        fields["password_hash"] = hash_password(str(password))
+    return fields
+
+
+class InquiryStore:
+    """Thread-safe table of inquiries with hash, created_at, status and text indexes.
+
+    Secret rows are left out of the public text index: a keyword hit on one
+    would disclose words of a content its reader may not open.
+    """
+
+    def __init__(self, rows=(), journal=None):
+        self._lock = threading.RLock()
+        self._journal = journal
+        self.events = EventLog()
+        self._rows = {}
+        for row in rows:
+            inquiry_id = str(row["id"])
+            self._rows[inquiry_id] = dict(seal(row), id=inquiry_id)
+        self._by_created = SortedKeys(sort_key(row) for row in self._rows.values())
+        by_status = {}
+        for row in self._rows.values():
+            by_status.setdefault(row.get("status"), []).append(sort_key(row))
+        self._by_status = {status: SortedKeys(keys) for status, keys in by_status.items()}
+        self._text = TextIndex()
+        self._public_text = TextIndex()
+        for row in self._rows.values():
+            self._index_text(row)
+
+    @classmethod
+    def open(cls, db_path, **journal_options):
+        """Load a persistent store from ``db_path`` and its journal."""
+        journal = Journal(db_path, **journal_options)
+        return cls(journal.replay(), journal=journal)
+
+    def close(self):
+        if self._journal is not None:
+            self._journal.close()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _new_id(self):
+        while True:
+            candidate = secrets.token_hex(4)
+            if candidate not in self._rows:
+                return candidate
+
+    def _index_text(self, row):
+        grams = bigrams(row_text(row))
+        self._text.add(row["id"], grams)
+        if not is_secret(row):
+            self._public_text.add(row["id"], grams)
+
+    def _index(self, row):
+        key = sort_key(row)
+        self._by_created.add(key)
+        self._by_status.setdefault(row.get("status"), SortedKeys()).add(key)
+        self._index_text(row)
+
+    def _unindex(self, row):
+        key = sort_key(row)
+        self._by_created.discard(key)
+        status_index = self._by_status.get(row.get("status"))
+        if status_index is not None:
+            status_index.discard(key)
+        self._text.discard(row["id"])
+        self._public_text.discard(row["id"])
+
+    def _log(self, entry):
+        if self._journal is None:
+            return
+        self._journal.append(entry)
+        if self._journal.should_compact(len(self._rows)):
+            self._journal.start_compaction(list(self._rows.values()))
+
+    def _put(self, row):
+        previous = self._rows.get(row["id"])
+        if previous is not None:
+            self._unindex(previous)
+        self._rows[row["id"]] = row
+        self._index(row)
+        self._log({"op": "put", "row": row})
+        self.events.publish("insert" if previous is None else "update", row["id"], row)
+        return row
+
+    def get(self, inquiry_id):
+        with self._lock:
+            return self._rows.get(inquiry_id)
+
+    def list(self, filters=None, limit=None, offset=0, before=None,
+             text=None, since=None, until=None, include_secret=True):
+        """Rows newest first, optionally filtered by exact field values.
+
+        ``before`` is a ``(created_at, id)`` key as returned by :func:`sort_key`;
+        only rows strictly older than it are returned.  A ``status`` filter is
+        answered from its own index; other fields are checked row by row while
+        walking the created_at order.
+
+        ``text`` keeps rows containing every word of it (as bigrams, see
+        :func:`bigrams`); secret rows never match it unless
+        ``include_secret``.  ``since`` and ``until`` bound ``created_at``
+        inclusively as ISO strings, so ``until="2025-03-01"`` covers that
+        whole day.
+        """
+        filters = dict(filters or {})
+        if until is not None:
+            bound = (until + "\uffff",)
+            before = bound if before is None or bound < before else before
+        with self._lock:
+            text_index = self._text if include_secret else self._public_text
+            grams = bigrams(text or "") or None  # no words: no keyword filter
+            index = self._status_index(filters["status"]) if "status" in filters else self._by_created
+            if index is None:
+                return []
+            if grams is not None and text_index.estimate(grams) < SORT_MATCHES_BELOW * len(index):
+                return self._sorted_matches(text_index.matches(grams), filters, limit, offset, before, since)
+            filters.pop("status", None)
+            if grams is None and since is None and not filters:
+                rows = (self._rows[inquiry_id] for _, inquiry_id in index.descending(offset, before))
+                return list(islice(rows, limit))
+            keys = index.descending(below=before)
+            if since is not None:
+                keys = takewhile(lambda key: key[0] >= since, keys)
+            rows = (self._rows[inquiry_id] for _, inquiry_id in keys
+                    if grams is None or text_index.contains(inquiry_id, grams))
+            matches = (row for row in rows if all(str(row.get(key)) == value for key, value in filters.items()))
+            return list(islice(matches, offset, None if limit is None else offset + limit))
+
+    def _sorted_matches(self, ids, filters, limit, offset, before, since):
+        """A page of a selective keyword: sort its few matches directly."""
+        keys = []
+        for inquiry_id in ids:
+            key = sort_key(self._rows[inquiry_id])
+            if (before is None or key < before) and (since is None or key[0] >= since):
+                keys.append(key)
+        keys.sort(reverse=True)
+        rows = (self._rows[inquiry_id] for _, inquiry_id in keys)
+        matches = (row for row in rows if all(str(row.get(key)) == value for key, value in filters.items()))
+        return list(islice(matches, offset, None if limit is None else offset + limit))
+
+    def _status_index(self, value):
+        for status, index in self._by_status.items():
+            if str(status) == value:
+                return index
+        return None
+
+    def create(self, fields):
+        """Insert a row; a client-chosen ``id`` that exists raises :class:`DuplicateIdError`."""
+        fields = seal(fields)  # PBKDF2 is slow; keep it outside the lock
+        with self._lock:
+            inquiry_id = str(fields.get("id") or self._new_id())
+            if inquiry_id in self._rows:
+                raise DuplicateIdError(f"inquiry {inquiry_id!r} already exists")
+            return self._put({"created_at": now_iso(), **fields, "id": inquiry_id})
+
+    def replace(self, inquiry_id, fields):
+        fields = seal(fields)
+        with self._lock:
+            current = self._rows.get(inquiry_id)
+            if current is None:
+                return None
+            return self._put({"created_at": current.get("created_at") or now_iso(), **fields, "id": inquiry_id})
+
+    def update(self, inquiry_id, fields):
+        fields = seal(fields)
+        with self._lock:
+            current = self._rows.get(inquiry_id)
+            if current is None:
+                return None
+            return self._put({**current, **fields, "id": inquiry_id})
+
+    def delete(self, inquiry_id):
+        with self._lock:
+            row = self._rows.pop(inquiry_id, None)
+            if row is not None:
+                self._unindex(row)
+                self._log({"op": "delete", "id": inquiry_id})
+                self.events.publish("delete", inquiry_id, row)
+            return row
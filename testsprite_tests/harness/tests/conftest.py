@@ -0,0 +1,23 @@
+import pytest
+
+from harness.server import InquiryServer
+from harness.storage import InquiryStore
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def store():
+    return InquiryStore()
+
+
+@pytest.fixture
+def base_url(store):
+    server = InquiryServer(store, admin_token=ADMIN_TOKEN)
+    yield server.start()
+    server.stop()
+
+
+@pytest.fixture
+def admin_headers():
+    return {"Authorization": f"Bearer {ADMIN_TOKEN}"}
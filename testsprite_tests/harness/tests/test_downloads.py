@@ -0,0 +1,135 @@
+import hashlib
+import os
+
+import pytest
+import requests
+
+from harness.downloads import DownloadServer, parse_range
+
+TIMEOUT = 5
+BODY = bytes(range(256)) * 40  # 10240 bytes
+NAME = "installer.exe"
+
+
+@pytest.fixture(params=[True, False], ids=["sendfile", "copy"])
+def download(tmp_path, request):
+    (tmp_path / NAME).write_bytes(BODY)
+    server = DownloadServer(tmp_path, sendfile=request.param, aliases={"alias.exe": NAME})
+    yield tmp_path, f"{server.start()}/{NAME}"
+    server.stop()
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("bytes=0-9", (0, 9)),
+    ("bytes=10-", (10, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=90-500", (90, 99)),
+    ("bytes=100-", "unsatisfiable"),
+    ("bytes=-0", "unsatisfiable"),
+    ("bytes=5-2", None),
+    ("bytes=0-1,4-5", None),
+    ("items=0-1", None),
+    ("bytes=-", None),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 100) == expected
+
+
+def test_parse_range_of_an_empty_file():
+    assert parse_range("bytes=-1", 0) == "unsatisfiable"
+    assert parse_range("bytes=0-", 0) == "unsatisfiable"
+
+
+def test_full_download_carries_validators(download):
+    _, url = download
+    resp = requests.get(url, timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert resp.content == BODY
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert resp.headers["ETag"] == f'"{hashlib.sha256(BODY).hexdigest()[:32]}"'
+
+
+@pytest.mark.parametrize("header, start, end", [
+    ("bytes=0-99", 0, 99),
+    ("bytes=10000-", 10000, 10239),
+    ("bytes=-40", 10200, 10239),
+    ("bytes=10230-20000", 10230, 10239),
+])
+def test_range_answers_206(download, header, start, end):
+    _, url = download
+    resp = requests.get(url, headers={"Range": header}, timeout=TIMEOUT)
+    assert resp.status_code == 206
+    assert resp.headers["Content-Range"] == f"bytes {start}-{end}/{len(BODY)}"
+    assert resp.content == BODY[start:end + 1]
+
+
+@pytest.mark.parametrize("header", ["bytes=10240-", "bytes=-0"])
+def test_unsatisfiable_range_answers_416(download, header):
+    _, url = download
+    resp = requests.get(url, headers={"Range": header}, timeout=TIMEOUT)
+    assert resp.status_code == 416
+    assert resp.headers["Content-Range"] == f"bytes */{len(BODY)}"
+    assert resp.content == b""
+
+
+def test_several_ranges_are_served_whole(download):
+    _, url = download
+    resp = requests.get(url, headers={"Range": "bytes=0-1,5-6"}, timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert resp.content == BODY
+
+
+def test_if_range_with_the_current_etag_resumes(download):
+    _, url = download
+    etag = requests.head(url, timeout=TIMEOUT).headers["ETag"]
+    resp = requests.get(url, headers={"Range": "bytes=100-", "If-Range": etag}, timeout=TIMEOUT)
+    assert resp.status_code == 206
+    assert resp.content == BODY[100:]
+
+
+def test_if_range_with_a_stale_etag_sends_the_new_file(download):
+    root, url = download
+    etag = requests.head(url, timeout=TIMEOUT).headers["ETag"]
+    changed = BODY[::-1]
+    (root / NAME).write_bytes(changed)
+    os.utime(root / NAME, ns=(0, 1_000_000_000))
+    resp = requests.get(url, headers={"Range": "bytes=100-", "If-Range": etag}, timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert resp.content == changed
+    assert resp.headers["ETag"] != etag
+
+
+def test_if_range_with_a_weak_etag_never_matches(download):
+    _, url = download
+    etag = requests.head(url, timeout=TIMEOUT).headers["ETag"]
+    resp = requests.get(url, headers={"Range": "bytes=100-", "If-Range": "W/" + etag}, timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert resp.content == BODY
+
+
+def test_if_range_with_last_modified(download):
+    _, url = download
+    last_modified = requests.head(url, timeout=TIMEOUT).headers["Last-Modified"]
+    resp = requests.get(url, headers={"Range": "bytes=0-9", "If-Range": last_modified}, timeout=TIMEOUT)
+    assert resp.status_code == 206
+    stale = "Thu, 01 Jan 1970 00:00:00 GMT"
+    resp = requests.get(url, headers={"Range": "bytes=0-9", "If-Range": stale}, timeout=TIMEOUT)
+    assert resp.status_code == 200
+
+
+def test_if_none_match_answers_304(download):
+    _, url = download
+    etag = requests.head(url, timeout=TIMEOUT).headers["ETag"]
+    resp = requests.get(url, headers={"If-None-Match": f'"other", {etag}'}, timeout=TIMEOUT)
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+def test_alias_and_missing_files(download):
+    _, url = download
+    base = url.rsplit("/", 1)[0]
+    assert requests.get(f"{base}/alias.exe", timeout=TIMEOUT).content == BODY
+    assert requests.get(f"{base}/missing.exe", timeout=TIMEOUT).status_code == 404
+    assert requests.get(f"{base}/..%2Fetc%2Fpasswd", timeout=TIMEOUT).status_code == 404
@@ -0,0 +1,87 @@
+import json
+import threading
+
+import requests
+
+from harness.events import EventLog
+
+TIMEOUT = 5
+
+
+def publish(log, count):
+    for number in range(count):
+        log.publish("insert", str(number), {"id": str(number)})
+
+
+def test_since_resumes_within_the_window():
+    log = EventLog(capacity=3)
+    publish(log, 5)
+    assert [event.id for event in log.since(2)] == [3, 4, 5]
+    assert [event.id for event in log.since(4)] == [5]
+    assert log.since(5, timeout=0) == []
+
+
+def test_since_asks_for_a_reload_outside_the_window():
+    log = EventLog(capacity=3)
+    publish(log, 5)
+    assert log.since(1) is None  # event 2 was evicted
+    assert log.since(9) is None  # ahead of the log: the server restarted
+
+
+def test_since_waits_for_the_next_event():
+    log = EventLog()
+    publish(log, 1)
+    timer = threading.Timer(0.05, publish, (log, 1))
+    timer.start()
+    try:
+        assert [event.id for event in log.since(1, timeout=TIMEOUT)] == [2]
+    finally:
+        timer.cancel()
+
+
+def test_store_publishes_every_mutation(store):
+    row = store.create({"title": "a"})
+    store.update(row["id"], {"status": "answered"})
+    store.delete(row["id"])
+    assert [(event.op, event.inquiry_id) for event in store.events.since(0)] == [
+        ("insert", row["id"]), ("update", row["id"]), ("delete", row["id"]),
+    ]
+
+
+def read_events(resp, count):
+    events, fields = [], {}
+    for line in resp.iter_lines(chunk_size=1, decode_unicode=True):
+        if line:
+            name, _, value = line.partition(": ")
+            fields[name] = value
+            continue
+        if "event" in fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+            if len(events) == count:
+                return events
+        fields = {}
+    return events
+
+
+def test_stream_resumes_after_last_event_id(base_url, store):
+    first = store.create({"title": "seen"})
+    second = store.create({"title": "missed", "is_secret": True, "content": "private"})
+    store.delete(first["id"])
+    with requests.get(f"{base_url}/events", headers={"Last-Event-ID": "1"}, stream=True, timeout=TIMEOUT) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"].startswith("text/event-stream")
+        (insert_id, insert, row), (delete_id, delete, gone) = read_events(resp, 2)
+    assert (insert_id, insert, row["id"]) == (2, "insert", second["id"])
+    assert "content" not in row
+    assert (delete_id, delete, gone) == (3, "delete", {"id": first["id"]})
+
+
+def test_stream_resets_a_client_it_cannot_resume(base_url, store):
+    store.create({"title": "a"})
+    with requests.get(f"{base_url}/events?lastEventId=99", stream=True, timeout=TIMEOUT) as resp:
+        assert read_events(resp, 1) == [(1, "reset", {})]
+
+
+def test_stream_rejects_a_malformed_event_id(base_url):
+    resp = requests.get(f"{base_url}/events", headers={"Last-Event-ID": "abc"}, timeout=TIMEOUT)
+    assert resp.status_code == 400
@@ -0,0 +1,105 @@
+import json
+
+from harness.journal import Journal
+from harness.storage import InquiryStore
+
+
+def rows_by_id(store):
+    return {row["id"]: row for row in store.list()}
+
+
+def mutate(store, count):
+    for number in range(count):
+        row = store.create({"title": f"inquiry {number}", "status": "pending"})
+        if number % 3 == 1:
+            store.update(row["id"], {"status": "answered", "reply": "done"})
+        if number % 4 == 2:
+            store.delete(row["id"])
+
+
+def write_lines(path, entries, torn=None):
+    with open(path, "w", encoding="utf-8") as segment:
+        for entry in entries:
+            segment.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        if torn is not None:
+            segment.write(torn)
+
+
+def test_replay_after_compaction(tmp_path):
+    db = tmp_path / "db.json"
+    store = InquiryStore.open(db, compact_min=5)
+    mutate(store, 40)
+    store.close()
+    expected = rows_by_id(store)
+
+    assert len(json.loads(db.read_text("utf-8"))["inquiries"]) > 0
+    assert not db.with_name("db.json.journal.old").exists()
+    reopened = InquiryStore.open(db, compact_min=5)
+    try:
+        assert rows_by_id(reopened) == expected
+    finally:
+        reopened.close()
+
+
+def test_writes_after_compaction_survive(tmp_path):
+    db = tmp_path / "db.json"
+    store = InquiryStore.open(db, compact_min=5)
+    mutate(store, 12)
+    store._journal.wait()
+    late = store.create({"title": "after the snapshot"})
+    store.delete(store.list()[-1]["id"])
+    store.close()
+    expected = rows_by_id(store)
+
+    reopened = InquiryStore.open(db, compact_min=5)
+    try:
+        assert rows_by_id(reopened) == expected
+        assert reopened.get(late["id"])["title"] == "after the snapshot"
+    finally:
+        reopened.close()
+
+
+def test_replay_of_an_interrupted_compaction(tmp_path):
+    # The journal was rotated to .journal.old but the snapshot was never
+    # replaced: replay applies the stale snapshot, then both segments.
+    db = tmp_path / "db.json"
+    db.write_text(json.dumps({"inquiries": [{"id": "a", "title": "old"}, {"id": "b", "title": "gone"}]}), "utf-8")
+    write_lines(db.with_name("db.json.journal.old"), [
+        {"op": "put", "row": {"id": "a", "title": "new"}},
+        {"op": "delete", "id": "b"},
+    ])
+    write_lines(db.with_name("db.json.journal"), [{"op": "put", "row": {"id": "c", "title": "later"}}])
+
+    journal = Journal(db)
+    rows = {row["id"]: row["title"] for row in journal.replay()}
+    journal.close()
+    assert rows == {"a": "new", "c": "later"}
+    assert journal.pending == 3
+
+
+def test_compaction_over_a_leftover_old_segment(tmp_path):
+    db = tmp_path / "db.json"
+    write_lines(db.with_name("db.json.journal.old"), [{"op": "put", "row": {"id": "a", "title": "first"}}])
+    journal = Journal(db)
+    journal.replay()
+    journal.append({"op": "put", "row": {"id": "b", "title": "second"}})
+    journal.start_compaction([{"id": "a", "title": "first"}, {"id": "b", "title": "second"}])
+    journal.append({"op": "delete", "id": "a"})
+    journal.close()
+
+    replayed = Journal(db)
+    assert [row["id"] for row in replayed.replay()] == ["b"]
+    replayed.close()
+
+
+def test_torn_last_line_is_dropped_and_truncated(tmp_path):
+    db = tmp_path / "db.json"
+    path = db.with_name("db.json.journal")
+    write_lines(path, [{"op": "put", "row": {"id": "a", "title": "whole"}}], torn='{"op": "put", "row": {"id"')
+    journal = Journal(db)
+    assert [row["id"] for row in journal.replay()] == ["a"]
+    journal.append({"op": "put", "row": {"id": "b", "title": "next"}})
+    journal.close()
+
+    lines = path.read_text("utf-8").splitlines()
+    assert [json.loads(line)["row"]["id"] for line in lines] == ["a", "b"]
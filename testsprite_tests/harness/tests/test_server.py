@@ -0,0 +1,78 @@
+import pytest
+import requests
+
+from harness.server import positive_int
+
+TIMEOUT = 5
+
+
+def seed(store, count):
+    for n in range(count):
+        store.create({"title": f"inquiry {n}", "created_at": f"2025-01-01T00:00:{n:02d}Z"})
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "x", ""])
+def test_positive_int_rejects(value):
+    with pytest.raises(ValueError):
+        positive_int({"_limit": value}, "_limit")
+
+
+def test_positive_int_default():
+    assert positive_int({}, "_page", 1) == 1
+    assert positive_int({"_page": "3"}, "_page", 1) == 3
+
+
+@pytest.mark.parametrize("query", ["_limit=0", "_limit=-1", "_limit=two", "_page=0", "_page=-2", "_limit=5&_page=0"])
+def test_list_rejects_bad_paging(base_url, query):
+    resp = requests.get(f"{base_url}/inquiries?{query}", timeout=TIMEOUT)
+    assert resp.status_code == 400
+    assert "positive integer" in resp.json()["error"]
+
+
+def test_list_pages_by_limit_and_page(base_url, store):
+    seed(store, 5)
+    resp = requests.get(f"{base_url}/inquiries?_limit=2&_page=3", timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert [row["title"] for row in resp.json()] == ["inquiry 0"]
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_page_past_the_end_is_empty_without_cursor(base_url, store):
+    seed(store, 2)
+    resp = requests.get(f"{base_url}/inquiries?_limit=2&_page=5", timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert resp.json() == []
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_empty_store_has_no_cursor(base_url):
+    resp = requests.get(f"{base_url}/inquiries?_limit=1", timeout=TIMEOUT)
+    assert resp.status_code == 200
+    assert resp.json() == []
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_cursor_walks_every_row_once(base_url, store):
+    seed(store, 5)
+    seen, cursor = [], None
+    while True:
+        params = {"_limit": 2, **({"_cursor": cursor} if cursor else {})}
+        resp = requests.get(f"{base_url}/inquiries", params=params, timeout=TIMEOUT)
+        assert resp.status_code == 200
+        seen += [row["title"] for row in resp.json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert seen == [f"inquiry {n}" for n in reversed(range(5))]
+
+
+def test_malformed_cursor_is_rejected(base_url):
+    resp = requests.get(f"{base_url}/inquiries?_cursor=not-a-cursor", timeout=TIMEOUT)
+    assert resp.status_code == 400
+
+
+def test_post_with_an_existing_id_conflicts(base_url, store):
+    store.create({"id": "taken", "title": "original"})
+    resp = requests.post(f"{base_url}/inquiries", json={"id": "taken", "title": "copy"}, timeout=TIMEOUT)
+    assert resp.status_code == 409
+    assert requests.get(f"{base_url}/inquiries/taken", timeout=TIMEOUT).json()["title"] == "original"
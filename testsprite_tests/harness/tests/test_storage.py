@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from harness import storage
+from harness.storage import DuplicateIdError, InquiryStore, SortedKeys, bigrams, sort_key
+
+
+def test_create_assigns_fresh_ids():
+    store = InquiryStore()
+    first = store.create({"title": "a"})
+    second = store.create({"title": "b"})
+    assert first["id"] != second["id"]
+    assert len(store) == 2
+
+
+def test_create_keeps_a_free_client_id():
+    store = InquiryStore()
+    assert store.create({"id": "custom", "title": "a"})["id"] == "custom"
+
+
+def test_create_rejects_an_existing_id():
+    store = InquiryStore([{"id": "1", "title": "kept", "status": "pending", "created_at": "2025-01-01T00:00:00Z"}])
+    with pytest.raises(DuplicateIdError):
+        store.create({"id": "1", "title": "overwrite", "status": "answered"})
+    assert store.get("1")["title"] == "kept"
+    assert [row["id"] for row in store.list({"status": "pending"})] == ["1"]
+    assert store.list({"status": "answered"}) == []
+    assert [row["id"] for row in store.list(text="kept")] == ["1"]
+    assert store.list(text="overwrite") == []
+
+
+class SmallChunks(SortedKeys):
+    CHUNK = 4
+
+
+def test_sorted_keys_match_a_plain_sorted_list():
+    rng = random.Random(5)
+    keys, reference = SmallChunks(), []
+    for _ in range(500):
+        key = rng.randrange(200)
+        if key in reference and rng.random() < 0.5:
+            keys.discard(key)
+            reference.remove(key)
+        else:
+            keys.add(key)
+            reference.append(key)
+    reference.sort(reverse=True)
+    assert len(keys) == len(reference)
+    assert list(keys.descending()) == reference
+    for offset in (0, 1, 3, 4, 5, 17, len(reference) - 1, len(reference), len(reference) + 3):
+        assert list(keys.descending(offset)) == reference[offset:]
+    for below in (-1, 0, 1, 50, 99, 100, 199, 500):
+        assert list(keys.descending(below=below)) == [key for key in reference if key < below]
+
+
+def test_sorted_keys_discard_of_a_missing_key_is_a_no_op():
+    keys = SmallChunks([1, 2, 3])
+    keys.discard(7)
+    keys.discard(0)
+    assert list(keys.descending()) == [3, 2, 1]
+
+
+def synthetic_rows(count, seed=0):
+    rng = random.Random(seed)
+    words = ["변환", "오류", "글꼴", "설치", "license", "batch"]
+    for number in range(count):
+        yield {
+            "id": f"{number:04d}",
+            "title": " ".join(rng.sample(words, 2)),
+            "author": f"user{number % 7}",
+            "status": rng.choice(["pending", "answered"]),
+            "is_secret": number % 5 == 0,
+            # Duplicate timestamps check the id tie-break.
+            "created_at": f"2025-01-{1 + number // 40:02d}T00:00:{number % 20:02d}Z",
+        }
+
+
+@pytest.fixture
+def table(monkeypatch):
+    monkeypatch.setattr(SortedKeys, "CHUNK", 8)
+    rows = list(synthetic_rows(300))
+    return InquiryStore(rows), sorted(rows, key=sort_key, reverse=True)
+
+
+def ids(rows):
+    return [row["id"] for row in rows]
+
+
+@pytest.mark.parametrize("limit, offset", [(None, 0), (10, 0), (10, 7), (8, 8), (1, 299), (5, 300), (5, 1000)])
+def test_list_pages_match_a_scan(table, limit, offset):
+    store, newest_first = table
+    expected = newest_first[offset:None if limit is None else offset + limit]
+    assert ids(store.list(limit=limit, offset=offset)) == ids(expected)
+
+
+def test_list_keyset_pages_cover_every_row_once(table):
+    store, newest_first = table
+    seen, before = [], None
+    while page := store.list(limit=7, before=before):
+        seen += ids(page)
+        before = sort_key(page[-1])
+    assert seen == ids(newest_first)
+
+
+@pytest.mark.parametrize("status", ["pending", "answered", "closed"])
+def test_list_by_status(table, status):
+    store, newest_first = table
+    expected = [row for row in newest_first if row["status"] == status]
+    assert ids(store.list({"status": status}, limit=10, offset=3)) == ids(expected[3:13])
+
+
+# Both ways of answering a keyword: sorting its matches, or checking rows
+# while walking the date index.
+@pytest.mark.parametrize("threshold", [0, 1])
+def test_list_by_keyword_and_dates(table, monkeypatch, threshold):
+    monkeypatch.setattr(storage, "SORT_MATCHES_BELOW", threshold)
+    store, newest_first = table
+    expected = [
+        row for row in newest_first
+        if "변환" in row["title"] and "2025-01-02" <= row["created_at"] <= "2025-01-04\uffff"
+    ]
+    assert expected
+    page = store.list(text="변환", since="2025-01-02", until="2025-01-04")
+    assert ids(page) == ids(expected)
+
+
+def test_keyword_search_skips_secret_rows_unless_included(table):
+    store, newest_first = table
+    everything = [row for row in newest_first if "license" in row["title"]]
+    public = [row for row in everything if not row["is_secret"]]
+    assert ids(store.list(text="license")) == ids(everything)
+    assert ids(store.list(text="license", include_secret=False)) == ids(public)
+
+
+def test_bigrams_split_korean_words():
+    assert bigrams("변환오류 A") == {"변환", "환오", "오류", "a"}
@@ -0,0 +1,97 @@
+"""Event-driven waits for the Playwright UI cases.
+
+These replace the fixed ``page.wait_for_timeout(3000)`` / ``asyncio.sleep()``
+pauses with waits on the signals the app actually emits: IntroOverlay leaving
+the DOM, the ``/inquiries`` response, InquiryBoard finishing its list render
+and GlobalModal mounting.  Every wait is bounded by a deadline and falls
+through when it expires, so a missing signal costs at most the deadline
+instead of failing the case; the next Playwright action still applies its own
+actionability checks.
+"""
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+INTRO_OVERLAY = '[data-testid="intro-overlay"]'
+INQUIRY_LIST = '[data-testid="inquiry-list"]'
+GLOBAL_MODAL = '[data-testid="global-modal"]'
+
+DEFAULT_DEADLINE_MS = 5000
+
+# The page is idle for our purposes once the intro curtain is gone and the
+# board (if open) is not waiting on its /inquiries request.
+_SETTLED_JS = f"""() =>
+    !document.querySelector('{INTRO_OVERLAY}') &&
+    !document.querySelector('{INQUIRY_LIST}[aria-busy="true"]')
+"""
+
+
+async def _within_deadline(awaitable):
+    try:
+        await awaitable
+    except PlaywrightTimeoutError:
+        return False
+    return True
+
+
+async def intro_exit(page, deadline_ms=DEFAULT_DEADLINE_MS):
+    """Wait for IntroOverlay to finish its exit animation and unmount."""
+    return await _within_deadline(
+        page.locator(INTRO_OVERLAY).wait_for(state="detached", timeout=deadline_ms))
+
+
+async def inquiry_list_rendered(page, deadline_ms=DEFAULT_DEADLINE_MS):
+    """Wait for InquiryBoard to render its list with the fetched inquiries."""
+    return await _within_deadline(
+        page.locator(f'{INQUIRY_LIST}[aria-busy="false"]').wait_for(state="attached", timeout=deadline_ms))
+
+
+async def modal_mounted(page, deadline_ms=DEFAULT_DEADLINE_MS):
+    """Wait for GlobalModal to mount an alert/confirm/prompt dialog."""
+    return await _within_deadline(
+        page.locator(GLOBAL_MODAL).wait_for(state="visible", timeout=deadline_ms))
+
+
+async def settle(page, deadline_ms=DEFAULT_DEADLINE_MS):
+    """Wait until the app is idle enough for the next click or fill."""
+    return await _within_deadline(page.wait_for_function(_SETTLED_JS, timeout=deadline_ms))
+
+
+async def after_navigation(page, deadline_ms=DEFAULT_DEADLINE_MS):
+    """Wait for a fresh page load to become interactive (DOM ready, intro gone)."""
+    await _within_deadline(page.wait_for_load_state("domcontentloaded", timeout=deadline_ms))
+    return await intro_exit(page, deadline_ms)
+
+
+def _is_inquiries_response(response):
+    return "/inquiries" in response.url and response.request.method == "GET"
+
+
+class inquiries_response:
+    """Wait for the ``GET /inquiries`` response triggered inside the block.
+
+    ::
+
+        async with waits.inquiries_response(page):
+            await board_button.click()
+
+    Errors raised by the block propagate unchanged; only a missing response is
+    tolerated once the deadline passes.
+    """
+
+    def __init__(self, page, deadline_ms=DEFAULT_DEADLINE_MS):
+        self._expectation = page.expect_response(_is_inquiries_response, timeout=deadline_ms)
+        self.response = None
+
+    async def __aenter__(self):
+        self._info = await self._expectation.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            return await self._expectation.__aexit__(exc_type, exc, tb)
+        try:
+            await self._expectation.__aexit__(None, None, None)
+            self.response = await self._info.value
+        except PlaywrightTimeoutError:
+            pass
+        return False
@@ -9,4 +9,8 @@ export default defineConfig({
     react(),
     tailwindcss(),
   ],
+  build: {
+    // Read by scripts/bundle-report.mjs.
+    manifest: true,
+  },
 })